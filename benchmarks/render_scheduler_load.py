@@ -0,0 +1,92 @@
+"""Load-test the web app's RenderScheduler with one busy session and several light ones.
+
+    python benchmarks/render_scheduler_load.py --busy-jobs 30 --light-sessions 4 --light-jobs 5 \\
+        --max-renders 3 --max-heavy 1
+
+Every job is submitted up front, the busy session's first (the worst case for
+a plain FIFO queue), and "renders" by sleeping. Prints the admission order and
+when each session's last job started, and exits non-zero if the scheduler ever
+ran more jobs or more 4K jobs at once than its caps allow. Needs the web app's
+requirements (it imports manimgui_web), but not manim.
+"""
+import argparse
+import os
+import string
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from manimgui_web import RenderScheduler  # noqa: E402
+
+
+def run_load(busy_jobs, light_sessions, light_jobs, max_renders, per_session, max_heavy, heavy_every, job_seconds):
+    """Submit every job, let them run, and return (admission order, peak running, peak 4K running)."""
+    scheduler = RenderScheduler(max_renders, per_session, max_heavy)
+    lock = threading.Lock()
+    order = []
+    running = {"all": 0, "heavy": 0}
+    peaks = {"all": 0, "heavy": 0}
+
+    def render(job, label):
+        scheduler.wait(job)
+        with lock:
+            order.append(label)
+            running["all"] += 1
+            running["heavy"] += job.heavy
+            peaks["all"] = max(peaks["all"], running["all"])
+            peaks["heavy"] = max(peaks["heavy"], running["heavy"])
+        time.sleep(job_seconds * (2 if job.heavy else 1))
+        with lock:
+            running["all"] -= 1
+            running["heavy"] -= job.heavy
+        scheduler.release(job)
+
+    submissions = [("busy", "B", index % heavy_every == heavy_every - 1 if heavy_every else False)
+                   for index in range(busy_jobs)]
+    for session in range(light_sessions):
+        label = string.ascii_lowercase[session % 26]
+        submissions += [(f"light-{session}", label, False)] * light_jobs
+
+    threads = []
+    for session_id, label, heavy in submissions:
+        job = scheduler.submit(session_id, heavy=heavy)
+        thread = threading.Thread(target=render, args=(job, label), daemon=True)
+        thread.start()
+        threads.append(thread)
+    for thread in threads:
+        thread.join()
+    return order, peaks["all"], peaks["heavy"]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--busy-jobs", type=int, default=30)
+    parser.add_argument("--light-sessions", type=int, default=4)
+    parser.add_argument("--light-jobs", type=int, default=5)
+    parser.add_argument("--max-renders", type=int, default=3)
+    parser.add_argument("--per-session", type=int, default=3)
+    parser.add_argument("--max-heavy", type=int, default=1)
+    parser.add_argument("--heavy-every", type=int, default=2, help="every Nth busy job is 4K (0 = none)")
+    parser.add_argument("--job-seconds", type=float, default=0.05)
+    args = parser.parse_args(argv)
+
+    order, peak, peak_heavy = run_load(
+        args.busy_jobs, args.light_sessions, args.light_jobs, args.max_renders, args.per_session,
+        args.max_heavy, args.heavy_every, args.job_seconds,
+    )
+    print(f"admission order (B = busy session): {''.join(order)}")
+    for label in sorted(set(order)):
+        positions = [index + 1 for index, other in enumerate(order) if other == label]
+        print(f"  {label}: {len(positions)} job(s), last started {positions[-1]} of {len(order)}")
+    light_total = args.light_sessions * args.light_jobs
+    if light_total:
+        light_done = max(index + 1 for index, label in enumerate(order) if label != "B")
+        print(f"light sessions done after {light_done} admissions (FIFO: {args.busy_jobs + light_total})")
+    print(f"peak running {peak}/{args.max_renders}, peak 4K running {peak_heavy}/{args.max_heavy}")
+    return 0 if peak <= args.max_renders and peak_heavy <= args.max_heavy else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
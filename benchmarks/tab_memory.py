@@ -0,0 +1,84 @@
+"""Open many tabs, hibernate and rehydrate them repeatedly, and check resident memory stays flat.
+
+    python benchmarks/tab_memory.py --tabs 100 --cycles 5
+
+Runs the real editor window offscreen with a throwaway home directory, so it
+needs PyQt6 but no display and leaves your settings alone. Exits non-zero
+when memory after the last cycle has grown past the tolerance over the first.
+"""
+import argparse
+import gc
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def scene_source(index, lines):
+    body = "".join(f"        self.play(Create(Circle(radius={i % 7 + 1})))  # step {i}\n" for i in range(lines))
+    return f"from manim import *\n\n\nclass Scene{index}(Scene):\n    def construct(self):\n{body}"
+
+
+def mb(value):
+    return value / (1024 * 1024)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tabs", type=int, default=100)
+    parser.add_argument("--cycles", type=int, default=5)
+    parser.add_argument("--lines", type=int, default=2000, help="lines per generated scene file")
+    parser.add_argument("--tolerance-mb", type=float, default=20.0,
+                        help="allowed growth between the first and the last cycle")
+    args = parser.parse_args(argv)
+
+    home = tempfile.mkdtemp(prefix="manimgui-tabmem-")
+    os.environ["HOME"] = home
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    os.environ["XDG_CONFIG_HOME"] = os.path.join(home, ".config")
+
+    from PyQt6.QtCore import QEvent
+    from PyQt6.QtWidgets import QApplication
+    from manimgui import ManimGUI, process_rss_bytes
+
+    app = QApplication(sys.argv[:1])
+    window = ManimGUI()
+
+    def settle():
+        # Without a running event loop deleteLater() needs flushing by hand
+        for _ in range(3):
+            app.processEvents()
+            app.sendPostedEvents(None, QEvent.Type.DeferredDelete.value)
+        gc.collect()
+
+    paths = []
+    for index in range(args.tabs):
+        path = os.path.join(home, f"scene_{index}.py")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(scene_source(index, args.lines))
+        window.open_scene_file(path)
+        paths.append(path)
+    settle()
+    print(f"{args.tabs} tabs open: {mb(process_rss_bytes()):.1f} MB")
+
+    samples = []
+    for cycle in range(1, args.cycles + 1):
+        for path in paths:
+            window.hibernate_tab(path)
+        settle()
+        hibernated = process_rss_bytes()
+        for path in paths:
+            window.rehydrate_tab(window.scene_tabs.editor(path))
+        settle()
+        samples.append(process_rss_bytes())
+        print(f"cycle {cycle}: hibernated {mb(hibernated):.1f} MB, rehydrated {mb(samples[-1]):.1f} MB")
+
+    growth = mb(samples[-1] - samples[0])
+    print(f"growth over {args.cycles - 1} cycle(s): {growth:+.1f} MB (tolerance {args.tolerance_mb:.0f} MB)")
+    window.close()
+    return 0 if growth <= args.tolerance_mb else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
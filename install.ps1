@@ -7,6 +7,9 @@ Write-Host "Installing Manim GUI Editor (by Dimensional Algebra)" -ForegroundCol
 # Download files
 New-Item -ItemType Directory -Path $tempDir -Force
 Invoke-WebRequest "$repo/raw/main/manimgui.py" -OutFile "$tempDir\manimgui.py"
+foreach ($module in @("manimgui_scan.py", "manimgui_worker.py", "manimgui_history.py", "manimgui_symbols.py", "manimgui_lint.py", "manimgui_bench.py", "manimgui_profiles.py", "manimgui_process.py", "manimgui_logs.py")) {
+    Invoke-WebRequest "$repo/raw/main/$module" -OutFile "$tempDir\$module"
+}
 Invoke-WebRequest "$repo/raw/main/requirements.txt" -OutFile "$tempDir\requirements.txt"
 
 # Install Python dependencies
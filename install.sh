@@ -62,6 +62,14 @@ install_manimgui() {
         exit 1
     }
 
+    # Download shared helper modules
+    for module in manimgui_scan.py manimgui_worker.py manimgui_history.py manimgui_symbols.py manimgui_lint.py manimgui_bench.py manimgui_profiles.py manimgui_process.py manimgui_logs.py; do
+        curl -sL -o "$module" "https://raw.githubusercontent.com/tereachar134/manimgui/main/$module" || {
+            echo -e "${RED}Failed to download $module${NC}"
+            exit 1
+        }
+    done
+
     # Download requirements
     curl -sL -o "requirements.txt" "https://raw.githubusercontent.com/tereachar134/manimgui/main/requirements.txt" || {
         echo -e "${RED}Failed to download requirements.txt${NC}"
@@ -1,9 +1,22 @@
 import sys
 import os
 import re
-import subprocess
 import json
+import time
+import hashlib
+import shutil
+import tempfile
+import difflib
+import ast
+import glob
+import queue
+import sqlite3
+import threading
+import struct
+from collections import deque
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime
+from html import escape as html_escape
 try:
     from PyQt6.QtWidgets import QFileSystemModel
 except ImportError:
@@ -11,27 +24,684 @@ except ImportError:
 
 from PyQt6.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QHBoxLayout, QFileDialog,
-    QPushButton, QTabWidget, QTextEdit, QLabel, QLineEdit, QMessageBox,
+    QPushButton, QTabWidget, QTextEdit, QPlainTextEdit, QPlainTextDocumentLayout, QLabel, QLineEdit,
+    QMessageBox,
     QProgressBar, QToolButton, QInputDialog, QSplitter,
-    QTreeView, QComboBox, QToolBar, QMenu, QMenuBar,
-  codex/improve-logging-system-and-ui-krnteu
+    QTreeView, QTableView, QHeaderView, QAbstractItemView, QComboBox, QToolBar, QMenu, QMenuBar,
     QFrame, QScrollArea, QGridLayout, QSizePolicy,
- 
-    QShortcut, QFrame, QScrollArea, QGridLayout, QSizePolicy,
-  main
-    QDialog, QDialogButtonBox, QListWidget, QListWidgetItem, QCheckBox
+    QDialog, QDialogButtonBox, QListWidget, QListWidgetItem, QCheckBox, QSpinBox, QCompleter
+)
+from PyQt6.QtCore import (
+    Qt, QObject, QEvent, QProcess, QProcessEnvironment, QTimer, QDir, QUrl, QSettings, QStandardPaths, QSize,
+    QThread, QFileSystemWatcher, QSortFilterProxyModel, pyqtSignal
 )
-from PyQt6.QtCore import Qt, QProcess, QTimer, QDir, QUrl, QSettings, QStandardPaths, QSize
 from PyQt6.QtGui import (
-  codex/improve-logging-system-and-ui-krnteu
     QTextCursor, QColor, QTextCharFormat, QIcon, QFont, QSyntaxHighlighter, QAction, QShortcut,
- 
-    QTextCursor, QColor, QTextCharFormat, QIcon, QFont, QSyntaxHighlighter, QAction,
-  main
-    QDesktopServices, QKeySequence, QPixmap, QMovie
+    QDesktopServices, QKeySequence, QPixmap, QMovie, QTextDocument, QStandardItemModel, QStandardItem
+)
+
+from manimgui_scan import ScanCache, deep_repo_scan, is_ignored_dir
+from manimgui_worker import FarmJob, FarmScheduler
+from manimgui_history import DEFAULT_THRESHOLD_PERCENT, RenderHistory, peak_rss_bytes
+from manimgui_symbols import SymbolIndex, index_path, installed_manim_version
+from manimgui_lint import lint_source, preflight
+from manimgui_logs import LogStore, highlight_pattern
+from manimgui_bench import RENDERERS, build_matrix, config_label, run_benchmark, summarize
+from manimgui_process import (
+    STOP_GRACE_SECONDS, descendants, pid_alive, process_pool, remove_partial_outputs, session_prefix, signal_tree
+)
+from manimgui_profiles import (
+    DEFAULT_PROFILE, QUALITY_PRESETS, ProfileError, delete_profile, describe, load_profiles,
+    profile_flags, save_profile
 )
 
+UPDATE_TIMEOUT_MS = 120000
+
+# Files above this size are streamed into the editor in chunks and opened
+# without syntax highlighting, which would otherwise re-style every block.
+LARGE_FILE_BYTES = 1024 * 1024
+LOAD_CHUNK_CHARS = 256 * 1024
+
+# Upper bound on project folders handed to the file watcher.
+MAX_WATCHED_DIRS = 500
+
+# Scene thumbnails render at the lowest quality on a few low-priority workers.
+THUMBNAIL_WORKERS = max(1, (os.cpu_count() or 2) // 4)
+THUMBNAIL_REFRESH_DELAY_MS = 3000
+
+OUTPUT_EXTENSIONS = (".mp4", ".mov", ".webm", ".gif", ".png", ".svg")
+
+# Typing pause before the open file is linted again
+LINT_DEBOUNCE_MS = 600
+
+# The log view keeps only the newest lines; all of them stay searchable in the log store
+LOG_VIEW_MAX_LINES = 5000
+LOG_FLUSH_MS = 500
+LOG_SEARCH_DEBOUNCE_MS = 250
+LOG_SEARCH_LIMIT = 500
+
+# Clean tabs left inactive this long drop their document; 0 disables.
+DEFAULT_HIBERNATE_MINUTES = 10
+
+def content_hash(text):
+    return hashlib.sha1(text.encode('utf-8')).hexdigest()
+
+def atomic_write_text(path, text):
+    """Write text to a temp file beside path, then rename it into place"""
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(prefix=".manimgui-", suffix=".tmp", dir=directory)
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        if os.path.exists(path):
+            shutil.copymode(path, tmp_path)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+def text_diff_edits(old_text, new_text):
+    """Line-level (start, end, replacement) edits turning old_text into new_text, last edit first
+
+    Offsets index into old_text, so applying the edits in the returned order
+    keeps every remaining offset valid.
+    """
+    old_lines = old_text.split("\n")
+    new_lines = new_text.split("\n")
+    starts = [0]
+    for line in old_lines:
+        starts.append(starts[-1] + len(line) + 1)
+    end_of_text = len(old_text)
+
+    edits = []
+    matcher = difflib.SequenceMatcher(None, old_lines, new_lines, autojunk=False)
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == "equal":
+            continue
+        if i2 < len(old_lines):
+            edits.append((starts[i1], starts[i2], "".join(line + "\n" for line in new_lines[j1:j2])))
+        elif i1 == len(old_lines):
+            edits.append((end_of_text, end_of_text, "\n" + "\n".join(new_lines[j1:j2])))
+        elif j1 == j2:
+            # Dropping the last lines also drops the newline before them.
+            edits.append((max(0, starts[i1] - 1), end_of_text, ""))
+        else:
+            edits.append((starts[i1], end_of_text, "\n".join(new_lines[j1:j2])))
+    edits.reverse()
+    return edits
+
+def scene_source_keys(source):
+    """(class name, source hash) for each Scene subclass in a module
+
+    The hash covers the class, any base classes defined in the same module and
+    all module-level code outside classes, so editing one scene leaves the
+    other scenes' hashes alone.
+    """
+    try:
+        tree = ast.parse(source)
+    except SyntaxError:
+        return []
+    classes = {node.name: node for node in tree.body if isinstance(node, ast.ClassDef)}
+    shared = "\n".join(
+        ast.get_source_segment(source, node) or ""
+        for node in tree.body if not isinstance(node, ast.ClassDef)
+    )
+
+    def is_scene(node, seen=()):
+        for base in node.bases:
+            if "Scene" in ast.unparse(base):
+                return True
+            if isinstance(base, ast.Name) and base.id in classes and base.id not in seen:
+                if is_scene(classes[base.id], seen + (node.name,)):
+                    return True
+        return False
+
+    keys = []
+    for name, node in classes.items():
+        if not is_scene(node):
+            continue
+        parts, pending, seen = [], [node], set()
+        while pending:
+            current = pending.pop()
+            if current.name in seen:
+                continue
+            seen.add(current.name)
+            parts.append(ast.get_source_segment(source, current) or current.name)
+            pending.extend(classes[b.id] for b in current.bases if isinstance(b, ast.Name) and b.id in classes)
+        keys.append((name, content_hash(shared + "\n" + "\n".join(parts))))
+    return keys
+
+def iter_project_py_files(folder):
+    for root, dirnames, filenames in os.walk(folder):
+        dirnames[:] = [d for d in dirnames if not is_ignored_dir(root, d)]
+        for name in filenames:
+            if name.endswith(".py"):
+                yield os.path.join(root, name)
+
+def png_size(path):
+    """(width, height) from a PNG header, or None"""
+    try:
+        with open(path, 'rb') as f:
+            header = f.read(24)
+    except OSError:
+        return None
+    if len(header) == 24 and header[:8] == b"\x89PNG\r\n\x1a\n":
+        return struct.unpack(">II", header[16:24])
+    return None
+
+def parse_output_path(media_dir, path):
+    """Scene, quality, height and fps implied by manim's media/<kind>/<module>/[<quality>/]<file> layout"""
+    parts = os.path.relpath(path, media_dir).split(os.sep)
+    stem = os.path.splitext(parts[-1])[0]
+    scene = re.sub(r"_ManimCE_v[\d.]+$", "", stem)
+    quality, height, fps = "", None, None
+    if len(parts) >= 4:
+        quality = parts[-2]
+        match = re.match(r"^(\d+)p(\d+)$", quality)
+        if match:
+            height, fps = int(match.group(1)), int(match.group(2))
+    return {
+        "scene": scene,
+        "module": parts[1] if len(parts) >= 3 else "",
+        "quality": quality,
+        "height": height,
+        "fps": fps,
+    }
+
+class OutputIndex:
+    """SQLite index of rendered outputs under each project's media directory"""
+
+    def __init__(self, db_path):
+        os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        self.db_path = db_path
+        self.db = sqlite3.connect(db_path)
+        self.db.executescript("""
+            CREATE TABLE IF NOT EXISTS outputs (
+                path TEXT PRIMARY KEY,
+                project TEXT NOT NULL,
+                scene TEXT,
+                module TEXT,
+                quality TEXT,
+                width INTEGER,
+                height INTEGER,
+                fps INTEGER,
+                duration REAL,
+                size INTEGER,
+                mtime REAL,
+                render_seconds REAL
+            );
+            CREATE INDEX IF NOT EXISTS outputs_project ON outputs(project, mtime);
+            CREATE TABLE IF NOT EXISTS scanned_projects (project TEXT PRIMARY KEY, scanned_at REAL);
+        """)
+
+    def add_output(self, project, path, render_seconds=None):
+        """Index or refresh one output file; returns False if it isn't a readable output"""
+        with self.db:
+            return self.store_output(project, path, render_seconds)
+
+    def store_output(self, project, path, render_seconds=None):
+        """add_output() inside the caller's transaction, without committing"""
+        path = os.path.abspath(path)
+        if not path.endswith(OUTPUT_EXTENSIONS) or "partial_movie_files" in path:
+            return False
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return False
+        info = parse_output_path(os.path.join(project, "media"), path)
+        width = height = None
+        if path.endswith(".png"):
+            width, height = png_size(path) or (None, None)
+        elif info["height"]:
+            height = info["height"]
+            width = height * 16 // 9
+        self.db.execute(
+            "INSERT INTO outputs (path, project, scene, module, quality, width, height, fps, size, mtime, render_seconds)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+            " ON CONFLICT(path) DO UPDATE SET size=excluded.size, mtime=excluded.mtime, duration=NULL,"
+            " render_seconds=COALESCE(excluded.render_seconds, render_seconds)",
+            (path, project, info["scene"], info["module"], info["quality"], width, height, info["fps"],
+             stat.st_size, stat.st_mtime, render_seconds)
+        )
+        return True
+
+    def set_media_info(self, path, duration, width, height):
+        with self.db:
+            self.db.execute(
+                "UPDATE outputs SET duration=?, width=COALESCE(?, width), height=COALESCE(?, height) WHERE path=?",
+                (duration, width, height, path)
+            )
+
+    def needs_scan(self, project):
+        row = self.db.execute("SELECT 1 FROM scanned_projects WHERE project=?", (project,)).fetchone()
+        return row is None
+
+    def scan(self, project):
+        """Index outputs that are new or changed since the last scan and drop deleted ones, in one transaction"""
+        media_dir = os.path.join(project, "media")
+        known = {
+            path: (size, mtime) for path, size, mtime in
+            self.db.execute("SELECT path, size, mtime FROM outputs WHERE project=?", (project,))
+        }
+        seen, changed = set(), []
+        for root, dirnames, filenames in os.walk(media_dir):
+            dirnames[:] = [d for d in dirnames if d not in ("partial_movie_files", "Tex", "texts")]
+            for name in filenames:
+                if not name.endswith(OUTPUT_EXTENSIONS):
+                    continue
+                path = os.path.join(root, name)
+                seen.add(path)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                if known.get(path) != (stat.st_size, stat.st_mtime):
+                    changed.append(path)
+        with self.db:
+            for path in changed:
+                self.store_output(project, path)
+            self.db.executemany("DELETE FROM outputs WHERE path=?", [(p,) for p in known if p not in seen])
+            self.db.execute("INSERT OR REPLACE INTO scanned_projects VALUES (?, ?)", (project, time.time()))
+
+    def rows(self, project):
+        return self.db.execute(
+            "SELECT path, scene, quality, width, height, fps, duration, size, mtime, render_seconds"
+            " FROM outputs WHERE project=? ORDER BY mtime DESC", (project,)
+        ).fetchall()
+
+    def row(self, path):
+        """The rows() entry for one output, or None if it isn't indexed"""
+        return self.db.execute(
+            "SELECT path, scene, quality, width, height, fps, duration, size, mtime, render_seconds"
+            " FROM outputs WHERE path=?", (path,)
+        ).fetchone()
+
+    def missing_durations(self, project):
+        return [row[0] for row in self.db.execute(
+            "SELECT path FROM outputs WHERE project=? AND duration IS NULL"
+            " AND (path LIKE '%.mp4' OR path LIKE '%.mov' OR path LIKE '%.webm' OR path LIKE '%.gif')",
+            (project,)
+        )]
+
+class RenderTimings:
+    """Per-animation render durations from the last successful render of each scene and quality"""
+
+    def __init__(self, db_path):
+        os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        self.db = sqlite3.connect(db_path)
+        self.db.execute("""
+            CREATE TABLE IF NOT EXISTS animation_timings (
+                scene_key TEXT NOT NULL,
+                quality TEXT NOT NULL,
+                source_hash TEXT,
+                durations TEXT,
+                frames TEXT,
+                recorded_at REAL,
+                PRIMARY KEY (scene_key, quality)
+            )
+        """)
+
+    def load(self, scene_key, quality):
+        """(source_hash, durations, frames) or None"""
+        row = self.db.execute(
+            "SELECT source_hash, durations, frames FROM animation_timings WHERE scene_key=? AND quality=?",
+            (scene_key, quality)
+        ).fetchone()
+        if row is None:
+            return None
+        return row[0], json.loads(row[1]), json.loads(row[2])
+
+    def save(self, scene_key, quality, source_hash, durations, frames):
+        with self.db:
+            self.db.execute(
+                "INSERT OR REPLACE INTO animation_timings VALUES (?, ?, ?, ?, ?, ?)",
+                (scene_key, quality, source_hash, json.dumps(durations), json.dumps(frames), time.time())
+            )
+
+class RenderEstimate:
+    """Expected per-animation durations for one render, refined as it runs.
+
+    With history for unchanged source the last render's durations are used
+    as is. When the source changed, durations are rescaled from frame counts
+    at the historical seconds-per-frame as each animation reports its frames;
+    without any history every animation weighs the same.
+    """
+
+    def __init__(self, animation_count, history=None, source_hash=None):
+        self.started_at = time.monotonic()
+        self.started = {}
+        self.durations = {}
+        self.frames = {}
+        self.current = 0
+        self.fraction = 0.0
+        self.seconds_per_frame = None
+        self.exact = False
+        expected = []
+        if history:
+            old_hash, old_durations, old_frames = history
+            known = [(d, f) for d, f in zip(old_durations, old_frames) if d and f]
+            if known:
+                self.seconds_per_frame = sum(d for d, _ in known) / sum(f for _, f in known)
+            self.exact = old_hash == source_hash and all(d is not None for d in old_durations)
+            if self.exact:
+                expected = list(old_durations)
+            else:
+                timed = [d for d in old_durations if d]
+                average = sum(timed) / len(timed) if timed else 1.0
+                expected = [average] * max(animation_count, 1)
+        if not expected:
+            expected = [1.0] * max(animation_count, 1)
+        self.expected = expected
+
+    def animation_progress(self, index, percent, total_frames=None):
+        now = time.monotonic()
+        if index not in self.started:
+            self.started[index] = now
+            previous = index - 1
+            if previous in self.started and previous not in self.durations:
+                self.durations[previous] = now - self.started[previous]
+        while index >= len(self.expected):
+            self.expected.append(sum(self.expected) / len(self.expected))
+        if total_frames:
+            self.frames[index] = total_frames
+            if not self.exact and self.seconds_per_frame:
+                self.expected[index] = total_frames * self.seconds_per_frame
+        self.current, self.fraction = index, min(percent / 100, 1.0)
+
+    def animation_finished(self, index):
+        now = time.monotonic()
+        start = self.started.get(index)
+        if start is None:
+            start = max([self.started_at] + [self.started[i] + self.durations.get(i, 0) for i in self.started])
+            self.started[index] = start
+        self.durations.setdefault(index, now - start)
+        while index >= len(self.expected):
+            self.expected.append(sum(self.expected) / len(self.expected))
+        self.current, self.fraction = index + 1, 0.0
+
+    def progress(self):
+        """Completed share of the expected render time, 0..1"""
+        total = sum(self.expected)
+        if total <= 0:
+            return 0.0
+        done = sum(self.expected[:self.current])
+        if self.current < len(self.expected):
+            done += self.expected[self.current] * self.fraction
+        return min(done / total, 1.0)
+
+    def remaining_seconds(self):
+        """Seconds left, or None until there is enough to go on"""
+        progress = self.progress()
+        elapsed = time.monotonic() - self.started_at
+        if progress <= 0.02 or elapsed < 1:
+            return None
+        if self.exact or self.seconds_per_frame:
+            # Expected durations are in seconds; correct for this machine running faster or slower
+            expected_so_far = progress * sum(self.expected)
+            speed = min(max(elapsed / expected_so_far, 0.25), 4.0) if expected_so_far > 0 else 1.0
+            return (1 - progress) * sum(self.expected) * speed
+        return elapsed / progress * (1 - progress)
+
+    def timings(self):
+        """Durations and frame counts to record once the render has succeeded"""
+        now = time.monotonic()
+        for index, start in self.started.items():
+            self.durations.setdefault(index, now - start)
+        count = max(list(self.durations) + list(self.started) + [-1]) + 1
+        return [self.durations.get(i) for i in range(count)], [self.frames.get(i) for i in range(count)]
+
+class EventLogWriter:
+    """Appends NDJSON events to a file from a background thread so emitting never blocks the UI"""
+
+    def __init__(self, path):
+        self.path = path
+        self.started = time.monotonic()
+        self.queue = queue.SimpleQueue()
+        self.error = None
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+
+    def emit(self, event, **fields):
+        record = {"ts": round(time.time(), 3), "elapsed": round(time.monotonic() - self.started, 3), "event": event}
+        record.update(fields)
+        self.queue.put(record)
+
+    def close(self):
+        self.queue.put(None)
+
+    def _run(self):
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with open(self.path, "a", encoding="utf-8") as f:
+                while True:
+                    batch = [self.queue.get()]
+                    while True:
+                        try:
+                            batch.append(self.queue.get_nowait())
+                        except queue.Empty:
+                            break
+                    f.writelines(json.dumps(r, ensure_ascii=False) + "\n" for r in batch if r is not None)
+                    f.flush()
+                    if None in batch:
+                        return
+        except OSError as e:
+            self.error = e
+
+def format_eta(seconds):
+    if seconds is None:
+        return "⏱️ ETA: --"
+    seconds = int(round(seconds))
+    if seconds >= 3600:
+        return f"⏱️ ETA: {seconds // 3600}h {seconds % 3600 // 60:02d}m"
+    if seconds >= 60:
+        return f"⏱️ ETA: {seconds // 60}m {seconds % 60:02d}s"
+    return f"⏱️ ETA: {seconds}s"
+
+SNIPPET_SUFFIXES = (".py", ".txt")
+MAX_SNIPPET_RESULTS = 200
+# Bump when the shape of an index entry changes so stale caches are rebuilt
+SNIPPET_INDEX_VERSION = 2
+
+def fuzzy_score(query, text):
+    """Score query as an in-order subsequence of text (both lowercase); None if it isn't one.
+
+    Consecutive matches and matches at word starts score higher, so "fdin"
+    ranks "Fade In" above "find_index".
+    """
+    if not query:
+        return 0
+    start = text.find(query)
+    if start >= 0:
+        # Whole query as a substring beats any scattered match
+        return 100 + len(query) * 4 - min(start, 50) + (20 if start == 0 or not text[start - 1].isalnum() else 0)
+    score, position, previous = 0, 0, -2
+    for char in query:
+        position = text.find(char, position)
+        if position < 0:
+            return None
+        if position == previous + 1:
+            score += 3
+        if position == 0 or not text[position - 1].isalnum():
+            score += 2
+        previous = position
+        position += 1
+    return score - min(previous, 50) // 10
+
+def parse_snippet_header(text):
+    """Metadata from leading "# name:", "# tags:" and "# description:" comments, plus where the body starts"""
+    meta = {}
+    lines = text.splitlines(keepends=True)
+    offset = 0
+    for line in lines:
+        match = re.match(r"#\s*(name|tags|description)\s*:\s*(.*)", line.strip())
+        if not match:
+            break
+        meta[match.group(1)] = match.group(2).strip()
+        offset += len(line)
+    return meta, offset
+
+class SnippetLibrary:
+    """Snippets from user and project folders with a small metadata index cached on disk.
+
+    Only names, tags and the identifiers used in each body are kept in
+    memory and in the index; bodies are read from disk on demand.
+    """
+
+    def __init__(self, index_path, builtin=None):
+        self.index_path = index_path
+        self.builtin = dict(builtin or {})
+        self.entries = {}
+        self.bodies = {}
+        self.dirty = False
+        try:
+            with open(index_path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            data = {}
+        self.cached = data.get("entries", {}) if data.get("version") == SNIPPET_INDEX_VERSION else {}
+
+    def refresh(self, folders):
+        """Pick up new, changed and deleted snippet files; unchanged files aren't opened"""
+        entries = {}
+        for name, body in self.builtin.items():
+            entries[f"builtin:{name}"] = self._entry(name, "", "built-in", body)
+        for folder in folders:
+            if not os.path.isdir(folder):
+                continue
+            for root, dirnames, filenames in os.walk(folder):
+                dirnames[:] = [d for d in dirnames if not d.startswith(".") and d != "__pycache__"]
+                for filename in filenames:
+                    if not filename.endswith(SNIPPET_SUFFIXES):
+                        continue
+                    path = os.path.join(root, filename)
+                    try:
+                        stat = os.stat(path)
+                    except OSError:
+                        continue
+                    cached = self.cached.get(path)
+                    if cached and cached["mtime"] == stat.st_mtime and cached["size"] == stat.st_size:
+                        entries[path] = cached
+                        continue
+                    entry = self._index_file(path, folder)
+                    if entry:
+                        entry.update(mtime=stat.st_mtime, size=stat.st_size)
+                        entries[path] = entry
+                        self.bodies.pop(path, None)
+                        self.dirty = True
+        if set(p for p in self.cached if not p.startswith("builtin:")) != \
+                set(p for p in entries if not p.startswith("builtin:")):
+            self.dirty = True
+        self.entries = entries
+        self.cached = {key: entry for key, entry in entries.items() if not key.startswith("builtin:")}
+        self.save_index()
+
+    def _entry(self, name, tags, source, body):
+        # Every distinct identifier, in order of first use
+        words = dict.fromkeys(re.findall(r"[A-Za-z_][A-Za-z0-9_]{2,}", body.lower()))
+        return {
+            "name": name,
+            "tags": tags,
+            "source": source,
+            "search": [name.lower(), tags.lower(), " ".join(words)],
+        }
+
+    def _index_file(self, path, folder):
+        try:
+            with open(path, encoding="utf-8") as f:
+                text = f.read()
+        except (OSError, UnicodeDecodeError):
+            return None
+        meta, offset = parse_snippet_header(text)
+        name = meta.get("name") or os.path.splitext(os.path.relpath(path, folder))[0].replace(os.sep, " / ")
+        tags = meta.get("tags", "")
+        if meta.get("description"):
+            tags = f"{tags} {meta['description']}".strip()
+        entry = self._entry(name, tags, folder, text[offset:])
+        entry["offset"] = offset
+        return entry
+
+    def save_index(self):
+        if not self.dirty:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.index_path), exist_ok=True)
+            atomic_write_text(self.index_path, json.dumps({"version": SNIPPET_INDEX_VERSION, "entries": self.cached}))
+            self.dirty = False
+        except OSError:
+            pass
+
+    def search(self, query, limit=MAX_SNIPPET_RESULTS):
+        """Keys of the best matches; name matches weigh most, then tags, then body words"""
+        query = query.strip().lower()
+        if not query:
+            keys = sorted(self.entries, key=lambda key: self.entries[key]["name"].lower())
+            return keys[:limit]
+        scored = []
+        for key, entry in self.entries.items():
+            name_text, tags_text, body_text = entry["search"]
+            best = None
+            for text, weight in ((name_text, 3), (tags_text, 2), (body_text, 1)):
+                score = fuzzy_score(query, text)
+                if score is not None:
+                    score = score * weight
+                    if best is None or score > best:
+                        best = score
+            if best is not None:
+                scored.append((-best, name_text, key))
+        scored.sort()
+        return [key for _, _, key in scored[:limit]]
+
+    def name(self, key):
+        return self.entries[key]["name"]
+
+    def body(self, key):
+        """Snippet code, read from disk on first use"""
+        if key.startswith("builtin:"):
+            return self.builtin.get(key[len("builtin:"):], "")
+        if key not in self.bodies:
+            try:
+                with open(key, encoding="utf-8") as f:
+                    self.bodies[key] = f.read()[self.entries[key].get("offset", 0):].strip("\n")
+            except (OSError, UnicodeDecodeError):
+                return ""
+        return self.bodies[key]
+
+def process_rss_bytes():
+    """Resident memory of this process in bytes, or 0 when it can't be read"""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        pass
+    try:
+        import psutil
+    except ImportError:
+        return 0
+    return psutil.Process().memory_info().rss
+
+class ManimNamePattern:
+    """Stands in for a compiled pattern, matching identifiers that are known manim names"""
+    identifier = re.compile(r"\b[A-Za-z_]\w*\b")
+
+    def finditer(self, text):
+        names = PythonSyntaxHighlighter.manim_names
+        return (match for match in self.identifier.finditer(text) if match.group() in names)
+
 class PythonSyntaxHighlighter(QSyntaxHighlighter):
+    # Hand-picked until the symbol index of the installed manim is loaded
+    manim_names = frozenset([
+        "Scene", "Mobject", "VMobject", "Text",
+        "Write", "Create", "FadeIn", "FadeOut",
+        "Circle", "Square", "Line", "Dot",
+        "Arrow", "Vector", "Matrix", "Table",
+        "play", "wait", "add", "remove"
+    ])
+
     def __init__(self, parent):
         super().__init__(parent)
         self.highlighting_rules = []
@@ -54,14 +724,7 @@ class PythonSyntaxHighlighter(QSyntaxHighlighter):
         # Manim-specific classes format
         manim_format = QTextCharFormat()
         manim_format.setForeground(QColor("#4ec9b0")) # Teal
-        manim_classes = [
-            r"\bScene\b", r"\bMobject\b", r"\bVMobject\b", r"\bText\b",
-            r"\bWrite\b", r"\bCreate\b", r"\bFadeIn\b", r"\bFadeOut\b",
-            r"\bCircle\b", r"\bSquare\b", r"\bLine\b", r"\bDot\b",
-            r"\bArrow\b", r"\bVector\b", r"\bMatrix\b", r"\bTable\b",
-            r"\bplay\b", r"\bwait\b", r"\badd\b", r"\bremove\b"
-        ]
-        self.highlighting_rules.extend([(re.compile(pattern), manim_format) for pattern in manim_classes])
+        self.highlighting_rules.append((ManimNamePattern(), manim_format))
 
         # String format
         string_format = QTextCharFormat()
@@ -90,6 +753,492 @@ class PythonSyntaxHighlighter(QSyntaxHighlighter):
             for match in expression.finditer(text):
                 self.setFormat(match.start(), match.end() - match.start(), format)
 
+class TabRegistry:
+    """Open editor tabs keyed by absolute path, with O(1) lookup from either side"""
+
+    def __init__(self):
+        self.by_path = {}      # path -> [editor, highlighter]
+        self.by_editor = {}    # editor -> path
+        self.by_basename = {}  # basename -> set of paths
+
+    def __len__(self):
+        return len(self.by_path)
+
+    def __contains__(self, path):
+        return os.path.abspath(path) in self.by_path
+
+    def items(self):
+        """Yield (path, editor, highlighter) for every open tab"""
+        for path, (editor, highlighter) in self.by_path.items():
+            yield path, editor, highlighter
+
+    def add(self, path, editor, highlighter):
+        """Register a tab; returns the paths whose labels need refreshing"""
+        path = os.path.abspath(path)
+        self.by_path[path] = [editor, highlighter]
+        self.by_editor[editor] = path
+        siblings = self.by_basename.setdefault(os.path.basename(path), set())
+        siblings.add(path)
+        return set(siblings)
+
+    def remove(self, editor):
+        """Forget a tab; returns (its path, paths whose labels need refreshing)"""
+        path = self.by_editor.pop(editor, None)
+        if path is None:
+            return None, set()
+        del self.by_path[path]
+        name = os.path.basename(path)
+        siblings = self.by_basename[name]
+        siblings.discard(path)
+        if not siblings:
+            del self.by_basename[name]
+        return path, set(siblings)
+
+    def editor(self, path):
+        entry = self.by_path.get(os.path.abspath(path))
+        return entry[0] if entry else None
+
+    def highlighter(self, path):
+        entry = self.by_path.get(os.path.abspath(path))
+        return entry[1] if entry else None
+
+    def set_highlighter(self, path, highlighter):
+        self.by_path[os.path.abspath(path)][1] = highlighter
+
+    def path_for(self, editor):
+        return self.by_editor.get(editor)
+
+    def label(self, path):
+        """Basename, plus just enough parent folders to tell same-named files apart"""
+        name = os.path.basename(path)
+        siblings = self.by_basename.get(name, ())
+        if len(siblings) < 2:
+            return name
+        parents = {p: os.path.dirname(p).split(os.sep) for p in siblings}
+        depth = 1
+        while depth < max(len(parts) for parts in parents.values()):
+            suffixes = {p: os.sep.join(parts[-depth:]) for p, parts in parents.items()}
+            if len(set(suffixes.values())) == len(suffixes):
+                break
+            depth += 1
+        return f"{name} — {os.sep.join(parents[path][-depth:])}"
+
+class ChunkedFileLoader(QObject):
+    """Stream a file into a QPlainTextEdit one chunk per event-loop turn"""
+    progress = pyqtSignal(int)
+    loaded = pyqtSignal()
+
+    def __init__(self, filepath, editor):
+        super().__init__(editor)
+        self.editor = editor
+        self.total = max(1, os.path.getsize(filepath))
+        self.file = open(filepath, 'r', encoding='utf-8', errors='replace')
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.load_chunk)
+        editor.destroyed.connect(self.stop)
+
+    def start(self):
+        self.editor.setReadOnly(True)
+        self.editor.setUndoRedoEnabled(False)
+        self.timer.start(0)
+
+    def stop(self):
+        self.timer.stop()
+        self.file.close()
+
+    def load_chunk(self):
+        chunk = self.file.read(LOAD_CHUNK_CHARS)
+        if chunk:
+            cursor = QTextCursor(self.editor.document())
+            cursor.movePosition(QTextCursor.MoveOperation.End)
+            cursor.insertText(chunk)
+            self.progress.emit(min(99, self.file.buffer.tell() * 100 // self.total))
+            return
+
+        self.stop()
+        self.editor.setUndoRedoEnabled(True)
+        self.editor.setReadOnly(False)
+        self.editor.document().setModified(False)
+        self.editor.moveCursor(QTextCursor.MoveOperation.Start)
+        self.progress.emit(100)
+        self.loaded.emit()
+
+class DeepScanWorker(QThread):
+    """Run the repository deep scan off the GUI thread"""
+    scan_done = pyqtSignal(list, list)
+
+    def __init__(self, repo_dir, cache, parent=None):
+        super().__init__(parent)
+        self.repo_dir = repo_dir
+        self.cache = cache
+        self.stopping = False
+
+    def stop(self):
+        self.stopping = True
+        self.wait()
+
+    def run(self):
+        conflict_files, syntax_errors = deep_repo_scan(
+            self.repo_dir, cache=self.cache, should_stop=lambda: self.stopping
+        )
+        if not self.stopping:
+            self.scan_done.emit(conflict_files, syntax_errors)
+
+class OutputScanWorker(QThread):
+    """Index a project's render outputs off the GUI thread, on its own database connection"""
+
+    def __init__(self, db_path, project_path, parent=None):
+        super().__init__(parent)
+        self.db_path = db_path
+        self.project_path = project_path
+        self.error = None
+
+    def run(self):
+        try:
+            index = OutputIndex(self.db_path)
+            try:
+                index.scan(self.project_path)
+            finally:
+                index.db.close()
+        except sqlite3.Error as e:
+            self.error = str(e)
+
+class LintWorker(QThread):
+    """Lints the newest submitted text of each editor in a worker process.
+
+    A newer submission for an editor replaces one that hasn't started yet;
+    results for text that has changed since are dropped by the receiver.
+    """
+    linted = pyqtSignal(object, int, list)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.condition = threading.Condition()
+        self.pending = {}
+        self.stopping = False
+
+    def submit(self, editor, generation, source, star_names):
+        with self.condition:
+            self.pending[editor] = (generation, source, star_names)
+            self.condition.notify()
+
+    def stop(self):
+        with self.condition:
+            self.stopping = True
+            self.condition.notify()
+        self.wait()
+
+    def run(self):
+        # Parsing holds the GIL, so it runs in another process to keep the UI responsive
+        pool = process_pool(1)
+        try:
+            while True:
+                with self.condition:
+                    while not self.pending and not self.stopping:
+                        self.condition.wait()
+                    if self.stopping:
+                        return
+                    editor, (generation, source, star_names) = self.pending.popitem()
+                try:
+                    diagnostics = pool.submit(lint_source, source, "<editor>", star_names).result()
+                except (BrokenProcessPool, OSError, RuntimeError):
+                    pool.shutdown(wait=False)
+                    pool = process_pool(1)
+                    diagnostics = lint_source(source, "<editor>", star_names)
+                self.linted.emit(editor, generation, diagnostics)
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+class LogSearchWorker(QThread):
+    """Runs log searches on its own database connection; a newer query replaces a waiting one"""
+    searched = pyqtSignal(int, list, list)
+
+    def __init__(self, db_path, parent=None):
+        super().__init__(parent)
+        self.db_path = db_path
+        self.condition = threading.Condition()
+        self.pending = None
+        self.stopping = False
+
+    def submit(self, generation, query, run):
+        with self.condition:
+            self.pending = (generation, query, run)
+            self.condition.notify()
+
+    def stop(self):
+        with self.condition:
+            self.stopping = True
+            self.condition.notify()
+        self.wait()
+
+    def run(self):
+        store = None
+        try:
+            while True:
+                with self.condition:
+                    while self.pending is None and not self.stopping:
+                        self.condition.wait()
+                    if self.stopping:
+                        return
+                    (generation, query, run), self.pending = self.pending, None
+                try:
+                    if store is None:
+                        store = LogStore(self.db_path)
+                    counts, hits = store.search(query, run, LOG_SEARCH_LIMIT)
+                except sqlite3.Error:
+                    counts, hits = [], []
+                self.searched.emit(generation, counts, hits)
+        finally:
+            if store is not None:
+                store.db.close()
+
+class HistoryWriter(QThread):
+    """Records finished renders off the GUI thread, since that hashes the scene file and runs git"""
+    failed = pyqtSignal(str)
+
+    def __init__(self, history, parent=None):
+        super().__init__(parent)
+        self.history = history
+        self.condition = threading.Condition()
+        self.pending = deque()
+        self.stopping = False
+
+    def submit(self, *args, **kwargs):
+        with self.condition:
+            self.pending.append((args, kwargs))
+            self.condition.notify()
+
+    def stop(self):
+        """Finish writing what was already submitted, then exit"""
+        with self.condition:
+            self.stopping = True
+            self.condition.notify()
+        self.wait()
+
+    def run(self):
+        while True:
+            with self.condition:
+                while not self.pending and not self.stopping:
+                    self.condition.wait()
+                if not self.pending:
+                    return
+                args, kwargs = self.pending.popleft()
+            try:
+                self.history.record(*args, **kwargs)
+            except (sqlite3.Error, OSError) as e:
+                self.failed.emit(str(e))
+
+class BenchmarkWorker(QThread):
+    """Run a renderer/caching/fps benchmark matrix off the GUI thread"""
+    run_done = pyqtSignal(dict)
+    benchmark_done = pyqtSignal(list)
+
+    def __init__(self, filepath, scene, configs, repetitions, quality_flag, parent=None):
+        super().__init__(parent)
+        self.filepath = filepath
+        self.scene = scene
+        self.configs = configs
+        self.repetitions = repetitions
+        self.quality_flag = quality_flag
+        self.stopping = False
+
+    def stop(self):
+        """Stop the running manim process tree and wait for the thread to exit"""
+        self.stopping = True
+        self.wait()
+
+    def run(self):
+        results = run_benchmark(
+            self.filepath, self.scene, self.configs, self.repetitions, self.quality_flag,
+            on_result=self.run_done.emit, should_stop=lambda: self.stopping
+        )
+        self.benchmark_done.emit(results)
+
+class ThumbnailScanWorker(QThread):
+    """Walk a project and hash its scenes off the GUI thread, for ThumbnailGenerator"""
+
+    def __init__(self, project_path, source_keys, cache_dir, parent=None):
+        super().__init__(parent)
+        self.project_path = project_path
+        self.source_keys = source_keys
+        self.cache_dir = cache_dir
+        self.found = []  # (file path, scene, digest, thumbnail already cached)
+
+    def run(self):
+        for filepath in iter_project_py_files(self.project_path):
+            for scene, digest in self.scene_keys(filepath):
+                cached = os.path.exists(os.path.join(self.cache_dir, f"{digest}.png"))
+                self.found.append((filepath, scene, digest, cached))
+
+    def scene_keys(self, filepath):
+        try:
+            stat = os.stat(filepath)
+            cached = self.source_keys.get(filepath)
+            if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+                return cached[2]
+            with open(filepath, 'r', encoding='utf-8') as f:
+                keys = scene_source_keys(f.read())
+        except (OSError, UnicodeDecodeError, ValueError):
+            return []
+        self.source_keys[filepath] = (stat.st_mtime_ns, stat.st_size, keys)
+        return keys
+
+class ThumbnailGenerator(QObject):
+    """Render a last-frame PNG for every scene in a project on a small, low-priority process pool"""
+    thumbnail_ready = pyqtSignal(str, str, str)  # file path, scene class, png path
+    scanned = pyqtSignal()
+    failed = pyqtSignal(str)
+
+    def __init__(self, cache_dir, parent=None):
+        super().__init__(parent)
+        self.cache_dir = cache_dir
+        os.makedirs(cache_dir, exist_ok=True)
+        self.queue = deque()
+        self.running = {}      # QProcess -> (file path, scene, digest, temp media dir)
+        self.scenes = {}       # (file path, scene) -> digest
+        self.source_keys = {}  # file path -> (mtime_ns, size, [(scene, digest)]), used by one scan at a time
+        self.scan_worker = None
+        self.rescan_path = None
+
+    def thumbnail_path(self, digest):
+        return os.path.join(self.cache_dir, f"{digest}.png")
+
+    def thumbnail_for(self, filepath, scene):
+        digest = self.scenes.get((filepath, scene))
+        if digest and os.path.exists(self.thumbnail_path(digest)):
+            return self.thumbnail_path(digest)
+        return None
+
+    def refresh(self, project_path):
+        """Scan the project on a worker thread, then queue a thumbnail for every scene with no cached image"""
+        if self.scan_worker is not None:
+            # Scan again once the running one is done, in case files changed meanwhile
+            self.rescan_path = project_path
+            return
+        self.scan_worker = ThumbnailScanWorker(project_path, self.source_keys, self.cache_dir, self)
+        self.scan_worker.finished.connect(self.scan_finished)
+        self.scan_worker.start()
+
+    def scan_finished(self):
+        worker, self.scan_worker = self.scan_worker, None
+        worker.deleteLater()
+        if self.rescan_path is not None:
+            project_path, self.rescan_path = self.rescan_path, None
+            self.refresh(project_path)
+            return
+        self.queue.clear()
+        self.scenes = {}
+        in_flight = {job[2] for job in self.running.values()}
+        for filepath, scene, digest, cached in worker.found:
+            self.scenes[(filepath, scene)] = digest
+            if cached:
+                self.thumbnail_ready.emit(filepath, scene, self.thumbnail_path(digest))
+            elif digest not in in_flight:
+                in_flight.add(digest)
+                self.queue.append((filepath, scene, digest))
+        self.scanned.emit()
+        self.start_next()
+
+    def start_next(self):
+        while self.queue and len(self.running) < THUMBNAIL_WORKERS:
+            filepath, scene, digest = self.queue.popleft()
+            media_dir = tempfile.mkdtemp(prefix="render-", dir=self.cache_dir)
+            args = ["manim", "-s", "-ql", "--media_dir", media_dir, filepath, scene]
+            process = QProcess(self)
+            if shutil.which("nice"):
+                args = ["nice", "-n", "19"] + args
+            process.setProgram(args[0])
+            process.setArguments(args[1:])
+            process.setWorkingDirectory(os.path.dirname(filepath))
+            process.setStandardOutputFile(QProcess.nullDevice())
+            process.setStandardErrorFile(QProcess.nullDevice())
+            process.finished.connect(lambda code, status, p=process: self.job_finished(p, code))
+            process.errorOccurred.connect(lambda error, p=process: self.job_error(p, error))
+            self.running[process] = (filepath, scene, digest, media_dir)
+            process.start()
+
+    def job_error(self, process, error):
+        if error == QProcess.ProcessError.FailedToStart:
+            self.queue.clear()
+            self.failed.emit("Could not start manim for scene thumbnails")
+            self.job_finished(process, -1)
+
+    def job_finished(self, process, exit_code):
+        job = self.running.pop(process, None)
+        if job is None:
+            return
+        filepath, scene, digest, media_dir = job
+        if exit_code == 0:
+            images = glob.glob(os.path.join(media_dir, "**", "*.png"), recursive=True)
+            if images:
+                shutil.move(max(images, key=os.path.getmtime), self.thumbnail_path(digest))
+                self.thumbnail_ready.emit(filepath, scene, self.thumbnail_path(digest))
+        shutil.rmtree(media_dir, ignore_errors=True)
+        process.deleteLater()
+        self.start_next()
+
+    def stop(self):
+        self.queue.clear()
+        self.rescan_path = None
+        if self.scan_worker is not None:
+            self.scan_worker.wait()
+        # Reap them here; a finished signal arriving after the window is gone would hit deleted objects
+        for process, (_, _, _, media_dir) in list(self.running.items()):
+            process.finished.disconnect()
+            process.kill()
+            process.waitForFinished(1000)
+            shutil.rmtree(media_dir, ignore_errors=True)
+        self.running.clear()
+
+class MediaProbe(QObject):
+    """Fill in duration and resolution of indexed videos with ffprobe, one file at a time"""
+    probed = pyqtSignal(str)
+
+    def __init__(self, index, parent=None):
+        super().__init__(parent)
+        self.index = index
+        self.queue = deque()
+        self.process = None
+        self.available = shutil.which("ffprobe") is not None
+
+    def enqueue(self, paths):
+        if not self.available:
+            return
+        self.queue.extend(p for p in paths if p not in self.queue)
+        self.start_next()
+
+    def start_next(self):
+        if self.process or not self.queue:
+            return
+        path = self.queue.popleft()
+        self.process = QProcess(self)
+        self.process.finished.connect(lambda code, status, p=path: self.probe_finished(p, code))
+        self.process.start("ffprobe", [
+            "-v", "error", "-select_streams", "v:0",
+            "-show_entries", "stream=width,height:format=duration",
+            "-of", "json", path
+        ])
+
+    def probe_finished(self, path, exit_code):
+        output = self.process.readAllStandardOutput().data().decode(errors="replace")
+        self.process.deleteLater()
+        self.process = None
+        if exit_code == 0:
+            try:
+                info = json.loads(output)
+                stream = (info.get("streams") or [{}])[0]
+                duration = float(info.get("format", {}).get("duration", 0)) or None
+                self.index.set_media_info(path, duration, stream.get("width"), stream.get("height"))
+                self.probed.emit(path)
+            except (ValueError, TypeError, sqlite3.Error):
+                pass
+        self.start_next()
+
+class FarmBridge(QObject):
+    """Carries render farm callbacks from scheduler threads to the GUI thread"""
+    line = pyqtSignal(object, str)
+    done = pyqtSignal(object, object, object, object)
+
 class ManimGUI(QWidget):
     def __init__(self):
         super().__init__()
@@ -104,15 +1253,30 @@ class ManimGUI(QWidget):
 
         self.setWindowIcon(QIcon.fromTheme("application-x-python"))
         self.project_path = ""
-        self.scene_tabs = {}
+        self.scene_tabs = TabRegistry()
+        self.tab_memory = {}
+        self.saved_hashes = {}
+        self.tab_last_active = {}
+        self.hibernated_tabs = {}
+        self.active_editor = None
         self.render_process = None
         self.animation_count = 0
         self.completed_animations = 0
         self.last_output_path = ""
         self.last_output_dir = ""
         self.recent_projects = []
-        self.snippets = self.load_snippets()
-        self.log_history = []
+        cache_dir = QStandardPaths.writableLocation(QStandardPaths.StandardLocation.CacheLocation)
+        self.snippet_library = SnippetLibrary(os.path.join(cache_dir, "snippet_index.json"), self.load_snippets())
+        self.log_history = deque(maxlen=LOG_VIEW_MAX_LINES)
+        self.log_run = None
+        self.scan_cache = ScanCache()
+        self.scan_worker = None
+        self.update_process = None
+        self.update_output = []
+        self.update_timed_out = False
+        self.update_timer = QTimer(self)
+        self.update_timer.setSingleShot(True)
+        self.update_timer.timeout.connect(self.update_timeout)
         self.init_ui()
         self.init_menu_bar()
         self.init_toolbar()
@@ -151,10 +1315,10 @@ class ManimGUI(QWidget):
         snippets_btn.setObjectName("actionBtn")
         snippets_btn.clicked.connect(self.show_snippets_panel)
 
-        update_btn = QPushButton("🔄 Update App")
-        update_btn.setObjectName("actionBtn")
-        update_btn.setToolTip("Pull the latest code from GitHub")
-        update_btn.clicked.connect(self.update_from_github)
+        self.update_btn = QPushButton("🔄 Update App")
+        self.update_btn.setObjectName("actionBtn")
+        self.update_btn.setToolTip("Pull the latest code from GitHub")
+        self.update_btn.clicked.connect(self.update_from_github)
 
         fullscreen_btn = QToolButton()
         fullscreen_btn.setText("⛶")
@@ -171,7 +1335,7 @@ class ManimGUI(QWidget):
         top_layout.addWidget(select_btn)
         top_layout.addWidget(new_file_btn)
         top_layout.addWidget(snippets_btn)
-        top_layout.addWidget(update_btn)
+        top_layout.addWidget(self.update_btn)
         top_layout.addWidget(fullscreen_btn)
         layout.addWidget(top_bar)
 
@@ -192,7 +1356,7 @@ class ManimGUI(QWidget):
         explorer_layout.addWidget(explorer_header)
         
         self.file_model = QFileSystemModel()
-        self.file_model.setFilter(QDir.Filter.NoDotAndDotdot | QDir.Filter.AllEntries)
+        self.file_model.setFilter(QDir.Filter.NoDotAndDotDot | QDir.Filter.AllEntries)
         self.file_tree = QTreeView()
         self.file_tree.setModel(self.file_model)
         self.file_tree.doubleClicked.connect(self.file_tree_double_clicked)
@@ -221,7 +1385,30 @@ class ManimGUI(QWidget):
         self.tabs.tabCloseRequested.connect(self.close_tab)
         self.tabs.currentChanged.connect(self.tab_changed)
         self.tabs.setObjectName("codeTabs")
-        v_splitter.addWidget(self.tabs)
+
+        editor_container = QWidget()
+        editor_layout = QVBoxLayout(editor_container)
+        editor_layout.setContentsMargins(0, 0, 0, 0)
+        editor_layout.setSpacing(0)
+        editor_layout.addWidget(self.tabs)
+
+        # Problems found by the background linter in the current tab
+        self.problems_list = QListWidget()
+        self.problems_list.setObjectName("problemsList")
+        self.problems_list.setMaximumHeight(110)
+        self.problems_list.setStyleSheet("""
+            QListWidget#problemsList {
+                background-color: #181825;
+                color: #cdd6f4;
+                border-top: 1px solid #45475a;
+                font-family: 'Consolas', monospace;
+            }
+        """)
+        self.problems_list.itemActivated.connect(self.goto_problem)
+        self.problems_list.itemClicked.connect(self.goto_problem)
+        self.problems_list.hide()
+        editor_layout.addWidget(self.problems_list)
+        v_splitter.addWidget(editor_container)
 
         # Output log area with modern design
         log_container = QFrame()
@@ -281,8 +1468,48 @@ class ManimGUI(QWidget):
         self.output_log = QTextEdit()
         self.output_log.setReadOnly(True)
         self.output_log.setObjectName("outputLog")
+        self.output_log.document().setMaximumBlockCount(LOG_VIEW_MAX_LINES)
+
+        log_search_layout = QHBoxLayout()
+        self.log_search_input = QLineEdit()
+        self.log_search_input.setPlaceholderText("🔍 Search render logs, including lines no longer shown (Enter: next)")
+        self.log_search_input.setClearButtonEnabled(True)
+        self.log_search_input.textChanged.connect(self.schedule_log_search)
+        self.log_search_input.returnPressed.connect(lambda: self.step_log_hit(1))
+        self.log_search_scope = QComboBox()
+        self.log_search_scope.addItems(["This Render", "All Renders"])
+        self.log_search_scope.currentIndexChanged.connect(self.schedule_log_search)
+        self.log_search_status = QLabel("")
+        prev_hit_btn = QToolButton()
+        prev_hit_btn.setText("◀")
+        prev_hit_btn.setToolTip("Previous match (Shift+Enter)")
+        prev_hit_btn.clicked.connect(lambda: self.step_log_hit(-1))
+        next_hit_btn = QToolButton()
+        next_hit_btn.setText("▶")
+        next_hit_btn.setToolTip("Next match (Enter)")
+        next_hit_btn.clicked.connect(lambda: self.step_log_hit(1))
+        previous_hit_shortcut = QShortcut(QKeySequence("Shift+Return"), self.log_search_input)
+        previous_hit_shortcut.setContext(Qt.ShortcutContext.WidgetShortcut)
+        previous_hit_shortcut.activated.connect(lambda: self.step_log_hit(-1))
+        log_search_layout.addWidget(self.log_search_input, 1)
+        log_search_layout.addWidget(self.log_search_scope)
+        log_search_layout.addWidget(self.log_search_status)
+        log_search_layout.addWidget(prev_hit_btn)
+        log_search_layout.addWidget(next_hit_btn)
+
+        self.log_search_results = QListWidget()
+        self.log_search_results.setMaximumHeight(150)
+        self.log_search_results.currentItemChanged.connect(self.show_log_hit)
+        self.log_search_results.hide()
+        self.log_search_context = QTextEdit()
+        self.log_search_context.setReadOnly(True)
+        self.log_search_context.setMaximumHeight(140)
+        self.log_search_context.hide()
         
         log_layout.addLayout(log_header_layout)
+        log_layout.addLayout(log_search_layout)
+        log_layout.addWidget(self.log_search_results)
+        log_layout.addWidget(self.log_search_context)
         log_layout.addWidget(self.output_log)
         log_container.setLayout(log_layout)
         v_splitter.addWidget(log_container)
@@ -317,10 +1544,13 @@ class ManimGUI(QWidget):
         render_bar.addWidget(detect_btn, 0, 2)
 
         # Row 2: Quality and output type
-        render_bar.addWidget(QLabel("⚙️ Quality:"), 1, 0)
+        render_bar.addWidget(QLabel("⚙️ Profile:"), 1, 0)
         self.quality_combo = QComboBox()
-        self.quality_combo.addItems(["📱 Low (480p)", "💻 High (1080p)", "🎥 4K (2160p)", "🖼️ Custom"])
         self.quality_combo.setObjectName("qualityCombo")
+        self.quality_combo.setToolTip("Render profile (Tools → Render Profiles to edit)")
+        self.quality_combo.currentTextChanged.connect(self.remember_profile)
+        self.profiles = {}
+        self.reload_profiles()
         render_bar.addWidget(self.quality_combo, 1, 1)
 
         render_bar.addWidget(QLabel("📤 Output:"), 1, 2)
@@ -341,6 +1571,9 @@ class ManimGUI(QWidget):
         self.stop_render_btn.setObjectName("stopBtn")
         self.stop_render_btn.clicked.connect(self.stop_rendering)
         self.stop_render_btn.setMinimumHeight(40)
+        self.stop_render_btn.setEnabled(False)
+        self.scene_class_input.textChanged.connect(self.update_render_button)
+        self.tabs.currentChanged.connect(self.update_render_button)
         
         self.open_output_btn = QPushButton("🎬 Open Output")
         self.open_output_btn.setObjectName("openOutputBtn")
@@ -362,7 +1595,7 @@ class ManimGUI(QWidget):
         action_buttons_layout.addWidget(self.render_btn)
         action_buttons_layout.addWidget(self.open_output_btn)
         action_buttons_layout.addWidget(self.open_output_folder_btn)
-        action_buttons_layout.addWidget(self.preview_btn)
+        action_buttons_layout.addWidget(preview_btn)
         action_buttons_layout.addWidget(self.stop_render_btn)
         
         render_bar.addLayout(action_buttons_layout, 2, 0, 1, 4)
@@ -393,6 +1626,12 @@ class ManimGUI(QWidget):
         progress_layout.addWidget(self.status_indicator)
         progress_layout.addWidget(self.progress_bar, 1)
         progress_layout.addWidget(self.animation_counter)
+
+        self.eta_label = QLabel(format_eta(None))
+        self.eta_label.setObjectName("animationCounter")
+        self.eta_label.setMinimumWidth(110)
+        self.eta_label.setAlignment(Qt.AlignmentFlag.AlignRight)
+        progress_layout.addWidget(self.eta_label)
         layout.addWidget(progress_frame)
 
         self.setLayout(layout)
@@ -402,9 +1641,264 @@ class ManimGUI(QWidget):
         self.status_timer.timeout.connect(self.update_progress)
         self.last_progress = 0
 
+        self.hibernate_minutes = int(QSettings("ManimGUI", "Editor").value("hibernate_minutes", DEFAULT_HIBERNATE_MINUTES))
+        self.hibernate_timer = QTimer(self)
+        self.hibernate_timer.timeout.connect(self.hibernate_idle_tabs)
+        self.hibernate_timer.start(30000)
+
+        self.autosave_seconds = int(QSettings("ManimGUI", "Editor").value("autosave_seconds", 0))
+        self.autosave_timer = QTimer(self)
+        self.autosave_timer.setSingleShot(True)
+        self.autosave_timer.timeout.connect(self.autosave_all)
+
+        cache_root = QStandardPaths.writableLocation(QStandardPaths.StandardLocation.CacheLocation)
+        self.thumbnailer = ThumbnailGenerator(os.path.join(cache_root, "thumbnails"), self)
+        self.thumbnailer.failed.connect(lambda message: self.append_to_log(f"⚠️ {message}", "warning"))
+        self.thumbnail_timer = QTimer(self)
+        self.thumbnail_timer.setSingleShot(True)
+        self.thumbnail_timer.timeout.connect(lambda: self.thumbnailer.refresh(self.project_path))
+
+        data_root = QStandardPaths.writableLocation(QStandardPaths.StandardLocation.AppDataLocation)
+        self.output_index = OutputIndex(os.path.join(data_root, "outputs.sqlite"))
+        self.media_probe = MediaProbe(self.output_index, self)
+        self.output_scan_worker = None
+        self.benchmark_workers = set()
+        self.render_timings = RenderTimings(os.path.join(data_root, "outputs.sqlite"))
+        self.render_estimate = None
+        self.render_timing_key = None
+        self.render_events = None
+        self.render_events_percent = -1
+        self.render_history = RenderHistory()
+        self.history_writer = HistoryWriter(self.render_history, self)
+        self.history_writer.failed.connect(
+            lambda message: self.append_to_log(f"⚠️ Could not record render history: {message}", "warning")
+        )
+        self.history_writer.start()
+        self.render_record = None
+        self.render_started_at = None
+        self.render_stop = None
+        self.render_job = None
+        self.render_queue = deque()
+        self.preempt_renders = QSettings("ManimGUI", "Render").value("preempt", True, type=bool)
+
+        farm_settings = QSettings("ManimGUI", "RenderFarm")
+        self.farm_bridge = FarmBridge(self)
+        self.farm_bridge.line.connect(self.farm_job_line)
+        self.farm_bridge.done.connect(self.farm_job_done)
+        self.farm = None
+        self.configure_farm_workers(
+            [w for w in str(farm_settings.value("workers", "")).split(",") if w.strip()],
+            farm_settings.value("token", "") or None
+        )
+
+        # Open files and project folders are watched so external edits show up
+        self.file_watcher = QFileSystemWatcher(self)
+        self.file_watcher.fileChanged.connect(self.watched_file_changed)
+        self.file_watcher.directoryChanged.connect(self.watched_directory_changed)
+        self.pending_file_changes = set()
+        self.file_change_timer = QTimer(self)
+        self.file_change_timer.setSingleShot(True)
+        self.file_change_timer.timeout.connect(self.process_file_changes)
+
+        # Completion from the installed manim's symbol index, shared by every editor
+        self.symbol_index = SymbolIndex()
+        self.symbol_process = None
+        self.completion_model = QStandardItemModel(self)
+        self.completer = QCompleter(self.completion_model, self)
+        self.completer.setCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
+        self.completer.setCompletionMode(QCompleter.CompletionMode.PopupCompletion)
+        self.completer.setMaxVisibleItems(12)
+        self.completer.activated.connect(self.insert_completion)
+        QTimer.singleShot(0, self.load_symbol_index)
+
+        self.diagnostics = {}
+        self.preflight_cache = {}
+        self.lint_generation = {}
+        self.lint_target = None
+        self.lint_timer = QTimer(self)
+        self.lint_timer.setSingleShot(True)
+        self.lint_timer.timeout.connect(self.run_lint)
+        self.lint_worker = LintWorker(self)
+        self.lint_worker.linted.connect(self.lint_finished)
+        self.lint_worker.start()
+
+        self.log_store = LogStore()
+        self.log_flush_timer = QTimer(self)
+        self.log_flush_timer.setSingleShot(True)
+        self.log_flush_timer.timeout.connect(self.log_store.flush)
+        self.log_search_generation = 0
+        self.log_search_pattern = None
+        self.log_search_timer = QTimer(self)
+        self.log_search_timer.setSingleShot(True)
+        self.log_search_timer.timeout.connect(self.run_log_search)
+        self.log_search_worker = LogSearchWorker(self.log_store.db_path, self)
+        self.log_search_worker.searched.connect(self.log_search_finished)
+        self.log_search_worker.start()
+
         # Create default project folder and file if none exists
         self.create_default_project()
 
+    def schedule_lint(self, editor):
+        """Mark the editor's text as changed and lint it once typing pauses"""
+        self.lint_generation[editor] = self.lint_generation.get(editor, 0) + 1
+        if editor is self.tabs.currentWidget():
+            self.lint_target = editor
+            self.lint_timer.start(LINT_DEBOUNCE_MS)
+
+    def run_lint(self):
+        editor = self.lint_target
+        if editor is None or self.scene_tabs.path_for(editor) is None or editor.isReadOnly():
+            return
+        self.lint_worker.submit(
+            editor, self.lint_generation.get(editor, 0), editor.toPlainText(), self.symbol_index.star_names
+        )
+
+    def lint_finished(self, editor, generation, diagnostics):
+        if generation != self.lint_generation.get(editor) or self.scene_tabs.path_for(editor) is None:
+            # The text changed (or the tab closed) while this ran
+            return
+        self.diagnostics[editor] = diagnostics
+        self.show_diagnostics(editor)
+
+    def show_diagnostics(self, editor):
+        """Underline diagnostics in the editor and list them under the tabs"""
+        diagnostics = self.diagnostics.get(editor, [])
+        selections = []
+        document = editor.document()
+        for item in diagnostics:
+            block = document.findBlockByNumber(item["line"] - 1)
+            if not block.isValid():
+                continue
+            text = block.text()
+            col = min(item["col"], max(len(text) - 1, 0))
+            match = re.compile(r"\w+|\S").search(text, col)
+            start, end = (match.start(), match.end()) if match else (0, len(text))
+            selection = QTextEdit.ExtraSelection()
+            selection.format.setUnderlineStyle(QTextCharFormat.UnderlineStyle.WaveUnderline)
+            selection.format.setUnderlineColor(QColor("#ff4444" if item["severity"] == "error" else "#ffbb33"))
+            cursor = QTextCursor(block)
+            cursor.setPosition(block.position() + start)
+            cursor.setPosition(block.position() + max(end, start + 1), QTextCursor.MoveMode.KeepAnchor)
+            selection.cursor = cursor
+            selections.append(selection)
+        editor.setExtraSelections(selections)
+
+        if editor is not self.tabs.currentWidget():
+            return
+        self.problems_list.clear()
+        for item in diagnostics:
+            icon = "❌" if item["severity"] == "error" else "⚠️"
+            entry = QListWidgetItem(f"{icon} {item['line']}:{item['col'] + 1}  {item['message']}")
+            entry.setData(Qt.ItemDataRole.UserRole, item["line"])
+            self.problems_list.addItem(entry)
+        self.problems_list.setVisible(bool(diagnostics))
+
+    def goto_problem(self, item):
+        editor = self.tabs.currentWidget()
+        if not isinstance(editor, QPlainTextEdit):
+            return
+        block = editor.document().findBlockByNumber(item.data(Qt.ItemDataRole.UserRole) - 1)
+        if block.isValid():
+            editor.setTextCursor(QTextCursor(block))
+            editor.centerCursor()
+            editor.setFocus()
+
+    def load_symbol_index(self):
+        """Load the cached manim symbol index, building it in a background process the first time"""
+        version = installed_manim_version()
+        if not version:
+            return
+        cache_dir = QStandardPaths.writableLocation(QStandardPaths.StandardLocation.CacheLocation)
+        path = index_path(cache_dir, version)
+        if os.path.exists(path):
+            try:
+                self.symbol_index = SymbolIndex.load(path)
+            except (OSError, ValueError, KeyError):
+                os.remove(path)
+            else:
+                PythonSyntaxHighlighter.manim_names = self.symbol_index.highlight_names or PythonSyntaxHighlighter.manim_names
+                for _, _, highlighter in self.scene_tabs.items():
+                    if highlighter:
+                        highlighter.rehighlight()
+                return
+        if self.symbol_process:
+            return
+        self.append_to_log(f"🔤 Indexing manim {version} symbols for completion...", "info")
+        self.symbol_process = QProcess(self)
+        self.symbol_process.setProcessChannelMode(QProcess.ProcessChannelMode.MergedChannels)
+        self.symbol_process.finished.connect(lambda code, status: self.symbol_index_built(code, path))
+        self.symbol_process.start(sys.executable, [
+            os.path.join(os.path.dirname(os.path.abspath(__file__)), "manimgui_symbols.py"), path
+        ])
+
+    def symbol_index_built(self, exit_code, path):
+        output = self.symbol_process.readAllStandardOutput().data().decode(errors="replace").strip()
+        self.symbol_process.deleteLater()
+        self.symbol_process = None
+        if exit_code == 0 and os.path.exists(path):
+            self.load_symbol_index()
+            self.append_to_log(f"🔤 Completion ready: {len(self.symbol_index)} manim symbols", "info")
+        else:
+            self.append_to_log(f"⚠️ Could not index manim symbols:\n{output[-2000:]}", "warning")
+
+    def completion_prefix(self, editor):
+        cursor = editor.textCursor()
+        block_text = cursor.block().text()[:cursor.positionInBlock()]
+        match = re.search(r"[A-Za-z_]\w*$", block_text)
+        return match.group() if match else ""
+
+    def update_completion(self, editor, forced=False):
+        """Show or refresh the completion popup for the word being typed"""
+        if editor is not self.tabs.currentWidget() or editor.isReadOnly():
+            return
+        prefix = self.completion_prefix(editor)
+        popup = self.completer.popup()
+        if len(prefix) < (1 if forced else 2) or not len(self.symbol_index):
+            popup.hide()
+            return
+        matches = self.symbol_index.complete(prefix)
+        if not matches or (len(matches) == 1 and matches[0]["name"] == prefix):
+            popup.hide()
+            return
+        self.completion_model.clear()
+        for symbol in matches:
+            item = QStandardItem(symbol["name"])
+            item.setToolTip(f"{symbol['kind']} {symbol['name']}{symbol['signature']}\n{symbol['doc']}".strip())
+            self.completion_model.appendRow(item)
+        self.completer.setWidget(editor)
+        self.completer.setCompletionPrefix(prefix)
+        popup.setCurrentIndex(self.completer.completionModel().index(0, 0))
+        rect = editor.cursorRect()
+        rect.setWidth(popup.sizeHintForColumn(0) + popup.verticalScrollBar().sizeHint().width() + 16)
+        self.completer.complete(rect)
+
+    def insert_completion(self, text):
+        editor = self.completer.widget()
+        if not isinstance(editor, QPlainTextEdit):
+            return
+        prefix = self.completion_prefix(editor)
+        cursor = editor.textCursor()
+        cursor.movePosition(QTextCursor.MoveOperation.Left, QTextCursor.MoveMode.KeepAnchor, len(prefix))
+        cursor.insertText(text)
+        editor.setTextCursor(cursor)
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Type.KeyPress and isinstance(obj, QPlainTextEdit):
+            popup = self.completer.popup()
+            if popup.isVisible() and event.key() in (
+                Qt.Key.Key_Return, Qt.Key.Key_Enter, Qt.Key.Key_Tab, Qt.Key.Key_Escape, Qt.Key.Key_Backtab
+            ):
+                # The completer's popup handles these
+                event.ignore()
+                return True
+            if event.key() == Qt.Key.Key_Space and event.modifiers() & Qt.KeyboardModifier.ControlModifier:
+                self.update_completion(obj, forced=True)
+                return True
+            if event.text() and (event.text().isalnum() or event.text() == "_" or popup.isVisible()):
+                # Look at the text after the editor has applied the key
+                QTimer.singleShot(0, lambda: self.update_completion(obj))
+        return super().eventFilter(obj, event)
+
     def toggle_fullscreen(self):
         if self.isFullScreen():
             self.showNormal()
@@ -698,14 +2192,14 @@ class ManimGUI(QWidget):
                 padding: 10px;
             }
             
-            QLineEdit, QTextEdit, QTreeView, QComboBox {
+            QLineEdit, QTextEdit, QPlainTextEdit, QTreeView, QComboBox {
                 background-color: #313244;
                 color: #cdd6f4;
                 border: 1px solid #45475a;
                 border-radius: 4px;
                 padding: 5px;
             }
-            QLineEdit:focus, QTextEdit:focus, QComboBox:focus {
+            QLineEdit:focus, QTextEdit:focus, QPlainTextEdit:focus, QComboBox:focus {
                 border-color: #89b4fa;
             }
             
@@ -875,7 +2369,9 @@ class ManimGUI(QWidget):
         
         self.project_path = default_path
         self.project_label.setText(f"📁 {os.path.basename(default_path)}")
+        self.reload_profiles()
         self.file_tree.setRootIndex(self.file_model.setRootPath(default_path))
+        self.watch_project(default_path)
         
         default_file = os.path.join(default_path, "default_scene.py")
         if not os.path.exists(default_file):
@@ -938,6 +2434,10 @@ class ManimGUI(QWidget):
         save_action.setShortcut(QKeySequence("Ctrl+S"))
         save_action.triggered.connect(self.save_current_file)
         file_menu.addAction(save_action)
+
+        autosave_action = QAction("⏱️ Autosave...", self)
+        autosave_action.triggered.connect(self.configure_autosave)
+        file_menu.addAction(autosave_action)
         
         file_menu.addSeparator()
         
@@ -1002,6 +2502,16 @@ class ManimGUI(QWidget):
         zoom_out_action.setShortcut(QKeySequence("Ctrl+-"))
         zoom_out_action.triggered.connect(self.zoom_out)
         view_menu.addAction(zoom_out_action)
+
+        view_menu.addSeparator()
+
+        memory_action = QAction("📈 Tab Memory", self)
+        memory_action.triggered.connect(self.show_tab_memory)
+        view_menu.addAction(memory_action)
+
+        hibernate_action = QAction("💤 Tab Hibernation...", self)
+        hibernate_action.triggered.connect(self.configure_hibernation)
+        view_menu.addAction(hibernate_action)
         
         # Tools menu
         tools_menu = menubar.addMenu("🔧 Tools")
@@ -1021,6 +2531,32 @@ class ManimGUI(QWidget):
         count_action = QAction("📊 Count Animations", self)
         count_action.triggered.connect(self.count_animations)
         tools_menu.addAction(count_action)
+
+        benchmark_action = QAction("⏱️ Benchmark Scene...", self)
+        benchmark_action.triggered.connect(self.show_benchmark)
+        tools_menu.addAction(benchmark_action)
+
+        profiles_action = QAction("🎛️ Render Profiles...", self)
+        profiles_action.triggered.connect(self.edit_profiles)
+        tools_menu.addAction(profiles_action)
+
+        history_action = QAction("📈 Render History", self)
+        history_action.triggered.connect(self.show_render_history)
+        tools_menu.addAction(history_action)
+
+        gallery_action = QAction("🎞️ Output Gallery", self)
+        gallery_action.setShortcut(QKeySequence("Ctrl+Shift+G"))
+        gallery_action.triggered.connect(self.show_output_gallery)
+        tools_menu.addAction(gallery_action)
+
+        browser_action = QAction("🖼️ Scene Browser", self)
+        browser_action.setShortcut(QKeySequence("Ctrl+Shift+B"))
+        browser_action.triggered.connect(self.show_scene_browser)
+        tools_menu.addAction(browser_action)
+
+        scan_action = QAction("🩺 Deep Error Scan", self)
+        scan_action.triggered.connect(self.deep_error_scan)
+        tools_menu.addAction(scan_action)
         
         tools_menu.addSeparator()
         
@@ -1033,6 +2569,22 @@ class ManimGUI(QWidget):
         stop_action.setShortcut(QKeySequence("Ctrl+Break"))
         stop_action.triggered.connect(self.stop_rendering)
         tools_menu.addAction(stop_action)
+
+        preempt_action = QAction("🔁 Re-render Replaces Running Render", self)
+        preempt_action.setCheckable(True)
+        preempt_action.setChecked(self.preempt_renders)
+        preempt_action.setToolTip("Rendering the scene that is already rendering restarts it with the newest code; other scenes are queued")
+        preempt_action.toggled.connect(self.set_preempt_renders)
+        tools_menu.addAction(preempt_action)
+
+        farm_render_action = QAction("🖧 Render on Farm", self)
+        farm_render_action.setShortcut(QKeySequence("Shift+F5"))
+        farm_render_action.triggered.connect(self.render_on_farm)
+        tools_menu.addAction(farm_render_action)
+
+        farm_workers_action = QAction("🖧 Render Farm Workers...", self)
+        farm_workers_action.triggered.connect(self.edit_farm_workers)
+        tools_menu.addAction(farm_workers_action)
         
         # Help menu
         help_menu = menubar.addMenu("❓ Help")
@@ -1139,11 +2691,19 @@ class ManimGUI(QWidget):
             return json.loads(saved)
         return default_snippets
 
+    def snippet_folders(self):
+        """User snippets first, then the open project's .manimgui/snippets"""
+        data_root = QStandardPaths.writableLocation(QStandardPaths.StandardLocation.AppDataLocation)
+        folders = [os.path.join(data_root, "snippets")]
+        if self.project_path:
+            folders.append(os.path.join(self.project_path, ".manimgui", "snippets"))
+        return folders
+
     def show_snippets_panel(self):
         """Show a dialog with available code snippets"""
         dialog = QDialog(self)
         dialog.setWindowTitle("📝 Code Snippets")
-        dialog.setMinimumSize(500, 400)
+        dialog.setMinimumSize(560, 480)
         dialog.setStyleSheet("""
             QDialog {
                 background-color: #1e1e2e;
@@ -1175,6 +2735,13 @@ class ManimGUI(QWidget):
                 border-radius: 8px;
                 padding: 10px;
             }
+            QLineEdit {
+                background-color: #313244;
+                color: #cdd6f4;
+                border: 1px solid #45475a;
+                border-radius: 6px;
+                padding: 6px;
+            }
             QPushButton {
                 background-color: #89b4fa;
                 color: #1e1e2e;
@@ -1189,18 +2756,39 @@ class ManimGUI(QWidget):
         """)
         
         layout = QVBoxLayout(dialog)
+        library = self.snippet_library
+        library.refresh(self.snippet_folders())
         
+        search_input = QLineEdit()
+        search_input.setPlaceholderText("🔎 Search snippets by name, tag or code...")
+        layout.addWidget(search_input)
+
         # Snippet list
         list_label = QLabel("📋 Available Snippets:")
         list_label.setStyleSheet("font-weight: bold; color: #89b4fa;")
         layout.addWidget(list_label)
         
         snippet_list = QListWidget()
-        for name in self.snippets.keys():
-            item = QListWidgetItem(f"📝 {name}")
-            snippet_list.addItem(item)
         snippet_list.currentRowChanged.connect(lambda idx: self.preview_snippet(snippet_list, preview_text, idx))
+        snippet_list.itemDoubleClicked.connect(lambda item: self.insert_snippet(snippet_list, dialog))
         layout.addWidget(snippet_list)
+
+        def show_matches(query):
+            snippet_list.clear()
+            for key in library.search(query):
+                entry = library.entries[key]
+                item = QListWidgetItem(f"📝 {entry['name']}")
+                item.setData(Qt.ItemDataRole.UserRole, key)
+                item.setToolTip(f"{entry['tags']}\n{entry['source']}".strip())
+                snippet_list.addItem(item)
+            list_label.setText(f"📋 Snippets ({snippet_list.count()} of {len(library.entries)}):")
+            if snippet_list.count() > 0:
+                snippet_list.setCurrentRow(0)
+            else:
+                preview_text.clear()
+
+        search_input.textChanged.connect(show_matches)
+        search_input.returnPressed.connect(lambda: self.insert_snippet(snippet_list, dialog))
         
         # Preview area
         preview_label = QLabel("👁️ Preview:")
@@ -1219,31 +2807,43 @@ class ManimGUI(QWidget):
         insert_btn.clicked.connect(lambda: self.insert_snippet(snippet_list, dialog))
         btn_layout.addWidget(insert_btn)
         
-        close_btn = QPushButton("❌ Close")
+        def open_snippets_folder():
+            folder = self.snippet_folders()[0]
+            os.makedirs(folder, exist_ok=True)
+            QDesktopServices.openUrl(QUrl.fromLocalFile(folder))
+
+        folder_btn = QPushButton("📂 Snippets Folder")
+        folder_btn.setToolTip(
+            "Add .py files here or in <project>/.manimgui/snippets.\n"
+            "Optional first lines: # name: ..., # tags: ..., # description: ..."
+        )
+        folder_btn.clicked.connect(open_snippets_folder)
+        btn_layout.addWidget(folder_btn)
+        
+        close_btn = QPushButton("❌ Close")
         close_btn.clicked.connect(dialog.close)
         btn_layout.addWidget(close_btn)
         
         layout.addLayout(btn_layout)
         
-        # Select first item by default
-        if snippet_list.count() > 0:
-            snippet_list.setCurrentRow(0)
+        show_matches("")
+        search_input.setFocus()
         
         dialog.exec()
 
     def preview_snippet(self, list_widget, preview_text, index):
         """Preview the selected snippet"""
-        if index >= 0 and index < len(self.snippets):
-            name = list_widget.item(index).text().replace("📝 ", "")
-            code = self.snippets.get(name, "")
-            preview_text.setPlainText(code)
+        if index >= 0 and index < list_widget.count():
+            key = list_widget.item(index).data(Qt.ItemDataRole.UserRole)
+            preview_text.setPlainText(self.snippet_library.body(key))
 
     def insert_snippet(self, list_widget, dialog):
         """Insert the selected snippet at cursor position"""
         current_row = list_widget.currentRow()
         if current_row >= 0:
-            name = list_widget.item(current_row).text().replace("📝 ", "")
-            code = self.snippets.get(name, "")
+            key = list_widget.item(current_row).data(Qt.ItemDataRole.UserRole)
+            name = self.snippet_library.name(key)
+            code = self.snippet_library.body(key)
             
             filepath, editor = self.get_current_file_path()
             if editor:
@@ -1266,7 +2866,14 @@ class ManimGUI(QWidget):
         if filename:
             try:
                 with open(filename, 'w', encoding='utf-8') as f:
-                    f.write(self.output_log.toPlainText())
+                    if self.log_run is not None and self.output_log.document().blockCount() >= LOG_VIEW_MAX_LINES:
+                        # The view dropped older lines; the store has the whole render
+                        self.log_store.flush()
+                        for kind, text in self.log_store.run_lines(self.log_run):
+                            if self._log_type_allowed(kind):
+                                f.write(text + "\n")
+                    else:
+                        f.write(self.output_log.toPlainText())
                 self.append_to_log(f"💾 Logs exported to: {filename}", "info")
             except Exception as e:
                 QMessageBox.critical(self, "Export Failed", f"Could not export logs:\n{e}")
@@ -1286,7 +2893,7 @@ class ManimGUI(QWidget):
                 background-color: #1e1e2e;
                 color: #cdd6f4;
             }
-            QTextEdit {
+            QPlainTextEdit {
                 background-color: #11111b;
                 color: #a6adc8;
                 font-family: 'Consolas', monospace;
@@ -1314,7 +2921,7 @@ class ManimGUI(QWidget):
         preview_label.setStyleSheet("font-weight: bold; color: #89b4fa; font-size: 12pt;")
         layout.addWidget(preview_label)
         
-        preview_editor = QTextEdit()
+        preview_editor = QPlainTextEdit()
         preview_editor.setReadOnly(True)
         preview_editor.setPlainText(editor.toPlainText())
         PythonSyntaxHighlighter(preview_editor.document())
@@ -1336,14 +2943,63 @@ class ManimGUI(QWidget):
     def save_current_file(self):
         """Save the current file"""
         filepath, editor = self.get_current_file_path()
+        if editor in self.hibernated_tabs:
+            QMessageBox.warning(self, "File Unavailable", "This tab's file could not be reloaded, so there is nothing to save.")
+            return
+        if editor and editor.isReadOnly():
+            QMessageBox.warning(self, "Still Loading", "Wait for the file to finish loading before saving.")
+            return
         if filepath and editor:
             try:
-                with open(filepath, 'w', encoding='utf-8') as f:
-                    f.write(editor.toPlainText())
-                self.append_to_log(f"💾 Saved: {os.path.basename(filepath)}", "info")
-            except Exception as e:
+                if not self.save_editor(filepath, editor):
+                    self.append_to_log(f"💾 No changes to save: {os.path.basename(filepath)}", "info")
+            except OSError as e:
                 QMessageBox.critical(self, "Save Failed", f"Could not save file:\n{e}")
 
+    def save_editor(self, filepath, editor):
+        """Atomically write an editor to disk unless its content is unchanged; returns True if written"""
+        document = editor.document()
+        if not document.isModified() and filepath in self.saved_hashes and os.path.exists(filepath):
+            return False
+        text = editor.toPlainText()
+        digest = content_hash(text)
+        if digest == self.saved_hashes.get(filepath) and os.path.exists(filepath):
+            document.setModified(False)
+            return False
+        atomic_write_text(filepath, text)
+        self.saved_hashes[filepath] = digest
+        document.setModified(False)
+        self.schedule_thumbnail_refresh()
+        self.append_to_log(f"💾 Saved: {os.path.basename(filepath)}", "info")
+        return True
+
+    def schedule_autosave(self):
+        if self.autosave_seconds > 0:
+            self.autosave_timer.start(self.autosave_seconds * 1000)
+
+    def autosave_all(self):
+        """Save every loaded tab with unsaved changes"""
+        for path, editor, _ in list(self.scene_tabs.items()):
+            if editor.isReadOnly() or editor in self.hibernated_tabs or not editor.document().isModified():
+                continue
+            try:
+                self.save_editor(path, editor)
+            except OSError as e:
+                self.append_to_log(f"⚠️ Autosave failed for {os.path.basename(path)}: {e}", "warning")
+
+    def configure_autosave(self):
+        """Set the idle delay after which edited tabs are saved automatically"""
+        seconds, ok = QInputDialog.getInt(
+            self, "Autosave",
+            "Save edited files after this many idle seconds (0 = off):",
+            self.autosave_seconds, 0, 3600
+        )
+        if ok:
+            self.autosave_seconds = seconds
+            QSettings("ManimGUI", "Editor").setValue("autosave_seconds", seconds)
+            if seconds == 0:
+                self.autosave_timer.stop()
+
     def undo_edit(self):
         """Undo last edit in current editor"""
         filepath, editor = self.get_current_file_path()
@@ -1417,7 +3073,11 @@ class ManimGUI(QWidget):
         )
 
     def update_from_github(self):
-        """Update the local app by pulling the latest changes from git remote"""
+        """Pull the latest changes from the git remote without blocking the UI; cancels if running"""
+        if self.update_process:
+            self.cancel_update()
+            return
+
         repo_dir = os.path.dirname(os.path.abspath(__file__))
         git_dir = os.path.join(repo_dir, ".git")
 
@@ -1429,21 +3089,76 @@ class ManimGUI(QWidget):
             )
             return
 
+        # Never let git wait on a credential or host-key prompt nobody can see.
+        env = QProcessEnvironment.systemEnvironment()
+        env.insert("GIT_TERMINAL_PROMPT", "0")
+        env.insert("GCM_INTERACTIVE", "never")
+        if not env.contains("GIT_SSH_COMMAND"):
+            env.insert("GIT_SSH_COMMAND", "ssh -o BatchMode=yes")
+
         self.append_to_log("🔄 Checking for updates from GitHub...", "info")
-        result = subprocess.run(
-            ["git", "pull", "--ff-only"],
-            cwd=repo_dir,
-            capture_output=True,
-            text=True
-        )
+        self.update_output = []
+        self.update_timed_out = False
+        self.update_process = QProcess(self)
+        self.update_process.setProgram("git")
+        self.update_process.setArguments(["pull", "--ff-only"])
+        self.update_process.setWorkingDirectory(repo_dir)
+        self.update_process.setProcessEnvironment(env)
+        self.update_process.setProcessChannelMode(QProcess.ProcessChannelMode.MergedChannels)
+        self.update_process.setStandardInputFile(QProcess.nullDevice())
+        self.update_process.readyReadStandardOutput.connect(self.handle_update_output)
+        self.update_process.finished.connect(self.update_finished)
+        self.update_process.errorOccurred.connect(self.update_error)
+        self.update_process.start()
+        self.update_timer.start(UPDATE_TIMEOUT_MS)
+        self.update_btn.setText("⏹️ Cancel Update")
+        self.update_btn.setToolTip("Stop the running git pull")
+
+    def handle_update_output(self):
+        if not self.update_process:
+            return
+        data = self.update_process.readAllStandardOutput().data().decode(errors="replace")
+        for line in data.splitlines():
+            if line.strip():
+                self.update_output.append(line)
+                self.append_to_log(line, "normal")
 
-        stdout = result.stdout.strip()
-        stderr = result.stderr.strip()
-        details = "\n".join(part for part in [stdout, stderr] if part).strip()
-        if details:
-            self.append_to_log(details, "normal")
+    def cancel_update(self):
+        """Stop a running update"""
+        if self.update_process and self.update_process.state() != QProcess.ProcessState.NotRunning:
+            self.append_to_log("🛑 Update cancelled by user", "warning")
+            self.update_process.kill()
 
-        if result.returncode == 0:
+    def update_timeout(self):
+        if self.update_process and self.update_process.state() != QProcess.ProcessState.NotRunning:
+            self.update_timed_out = True
+            self.append_to_log(f"⏱️ Update timed out after {UPDATE_TIMEOUT_MS // 1000}s", "error")
+            self.update_process.kill()
+
+    def update_error(self, error):
+        if error == QProcess.ProcessError.FailedToStart:
+            self.append_to_log("❌ Could not start git. Is it installed and on PATH?", "error")
+            self.reset_update_state()
+
+    def reset_update_state(self):
+        self.update_timer.stop()
+        if self.update_process:
+            self.update_process.deleteLater()
+        self.update_process = None
+        self.update_btn.setText("🔄 Update App")
+        self.update_btn.setToolTip("Pull the latest code from GitHub")
+
+    def update_finished(self, exit_code, exit_status):
+        self.handle_update_output()
+        crashed = exit_status == QProcess.ExitStatus.CrashExit
+        details = "\n".join(self.update_output).strip()
+        timed_out = self.update_timed_out
+        self.reset_update_state()
+
+        if crashed and not timed_out:
+            # Killed by the cancel button; already logged.
+            return
+        if exit_code == 0 and not crashed:
             self.append_to_log("✅ Update completed successfully.", "info")
             QMessageBox.information(
                 self,
@@ -1458,6 +3173,544 @@ class ManimGUI(QWidget):
                 f"Could not update from GitHub.\n\n{details or 'Unknown git error.'}"
             )
 
+    def deep_error_scan(self):
+        """Scan the app repository for merge markers and syntax errors in the background"""
+        if self.scan_worker and self.scan_worker.isRunning():
+            self.append_to_log("⚠️ A deep scan is already running", "warning")
+            return
+
+        repo_dir = os.path.dirname(os.path.abspath(__file__))
+        self.append_to_log("🩺 Running deep error scan...", "info")
+        self.scan_worker = DeepScanWorker(repo_dir, self.scan_cache, self)
+        self.scan_worker.scan_done.connect(self.deep_scan_finished)
+        self.scan_worker.start()
+
+    def deep_scan_finished(self, conflict_files, syntax_errors):
+        for path in conflict_files:
+            self.append_to_log(f"❌ Unresolved merge markers: {path}", "error")
+        for error in syntax_errors:
+            self.append_to_log(f"❌ Syntax error: {error}", "error")
+
+        if conflict_files or syntax_errors:
+            QMessageBox.warning(
+                self,
+                "Deep Scan",
+                f"Found {len(conflict_files)} file(s) with merge markers and "
+                f"{len(syntax_errors)} syntax error(s).\nSee the log for details."
+            )
+        else:
+            self.append_to_log("✅ Deep scan complete: no merge markers or syntax errors found.", "info")
+
+    def show_scene_browser(self):
+        """Show every scene in the project with its last-frame thumbnail"""
+        dialog = QDialog(self)
+        dialog.setWindowTitle("🖼️ Scene Browser")
+        dialog.setMinimumSize(760, 520)
+        dialog.setStyleSheet("""
+            QDialog {
+                background-color: #1e1e2e;
+                color: #cdd6f4;
+            }
+            QListWidget {
+                background-color: #11111b;
+                color: #cdd6f4;
+                border: 1px solid #45475a;
+                border-radius: 8px;
+                padding: 10px;
+            }
+            QListWidget::item:selected {
+                background-color: #45475a;
+                color: #89b4fa;
+            }
+        """)
+        layout = QVBoxLayout(dialog)
+
+        scene_list = QListWidget()
+        scene_list.setViewMode(QListWidget.ViewMode.IconMode)
+        scene_list.setIconSize(QSize(192, 108))
+        scene_list.setResizeMode(QListWidget.ResizeMode.Adjust)
+        scene_list.setSpacing(10)
+        scene_list.setWordWrap(True)
+        layout.addWidget(scene_list)
+
+        items = {}
+
+        def populate():
+            scene_list.clear()
+            items.clear()
+            for (filepath, scene) in sorted(self.thumbnailer.scenes):
+                rel_path = os.path.relpath(filepath, self.project_path)
+                item = QListWidgetItem(f"{scene}\n{rel_path}")
+                item.setData(Qt.ItemDataRole.UserRole, (filepath, scene))
+                thumbnail = self.thumbnailer.thumbnail_for(filepath, scene)
+                if thumbnail:
+                    item.setIcon(QIcon(thumbnail))
+                scene_list.addItem(item)
+                items[(filepath, scene)] = item
+            pending = len(self.thumbnailer.queue) + len(self.thumbnailer.running)
+            status.setText(f"⏳ {pending} thumbnail(s) rendering" if pending else f"{len(items)} scene(s)")
+
+        def thumbnail_ready(filepath, scene, png):
+            item = items.get((filepath, scene))
+            if item is not None:
+                item.setIcon(QIcon(png))
+
+        def open_scene(item):
+            filepath, scene = item.data(Qt.ItemDataRole.UserRole)
+            self.open_scene_file(filepath)
+            self.scene_class_input.setText(scene)
+            dialog.accept()
+
+        self.thumbnailer.thumbnail_ready.connect(thumbnail_ready)
+        self.thumbnailer.scanned.connect(populate)
+        scene_list.itemDoubleClicked.connect(open_scene)
+
+        btn_layout = QHBoxLayout()
+        status = QLabel()
+        btn_layout.addWidget(status)
+        btn_layout.addStretch()
+        refresh_btn = QPushButton("🔄 Refresh")
+        refresh_btn.clicked.connect(lambda: self.thumbnailer.refresh(self.project_path))
+        btn_layout.addWidget(refresh_btn)
+        close_btn = QPushButton("❌ Close")
+        close_btn.clicked.connect(dialog.close)
+        btn_layout.addWidget(close_btn)
+        layout.addLayout(btn_layout)
+
+        populate()
+        dialog.exec()
+        self.thumbnailer.thumbnail_ready.disconnect(thumbnail_ready)
+        self.thumbnailer.scanned.disconnect(populate)
+
+    def show_benchmark(self):
+        """Render the current scene under a matrix of renderer, caching and fps settings and compare them"""
+        filepath, editor = self.get_current_file_path()
+        scene_class = self.scene_class_input.text().strip()
+        if not filepath or not scene_class:
+            QMessageBox.warning(self, "No Scene Selected", "Open a scene file and enter the SceneClassName first.")
+            return
+        try:
+            self.save_editor(filepath, editor)
+        except OSError as e:
+            QMessageBox.critical(self, "Save Failed", f"Could not save file before benchmarking:\n{e}")
+            return
+        if not self.preflight_check(filepath, editor, scene_class):
+            return
+
+        dialog = QDialog(self)
+        dialog.setWindowTitle(f"⏱️ Benchmark {scene_class}")
+        dialog.setMinimumSize(760, 460)
+        layout = QVBoxLayout(dialog)
+
+        options = QGridLayout()
+        renderer_boxes = {name: QCheckBox(name) for name in RENDERERS}
+        renderer_boxes["cairo"].setChecked(True)
+        cache_on = QCheckBox("with caching")
+        cache_on.setChecked(True)
+        cache_off = QCheckBox("--disable_caching")
+        cache_off.setChecked(True)
+        fps_input = QLineEdit("15, 30")
+        repeat_spin = QSpinBox()
+        repeat_spin.setRange(1, 20)
+        repeat_spin.setValue(3)
+        quality_combo = QComboBox()
+        quality_combo.addItems(["-ql", "-qm", "-qh"])
+        options.addWidget(QLabel("Renderer:"), 0, 0)
+        for column, box in enumerate(renderer_boxes.values(), start=1):
+            options.addWidget(box, 0, column)
+        options.addWidget(QLabel("Caching:"), 1, 0)
+        options.addWidget(cache_on, 1, 1)
+        options.addWidget(cache_off, 1, 2)
+        options.addWidget(QLabel("Frame rates:"), 2, 0)
+        options.addWidget(fps_input, 2, 1, 1, 2)
+        options.addWidget(QLabel("Repetitions:"), 3, 0)
+        options.addWidget(repeat_spin, 3, 1)
+        options.addWidget(QLabel("Quality:"), 3, 2)
+        options.addWidget(quality_combo, 3, 3)
+        layout.addLayout(options)
+
+        headers = ["Configuration", "Median", "Best", "Render FPS", "Output Size", "Runs"]
+        model = QStandardItemModel(0, len(headers), dialog)
+        model.setHorizontalHeaderLabels(headers)
+        table = QTableView()
+        table.setModel(model)
+        table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        table.horizontalHeader().setStretchLastSection(True)
+        table.verticalHeader().setVisible(False)
+        layout.addWidget(table)
+        status = QLabel("Runs are sequential; the fastest configuration is listed first.")
+        layout.addWidget(status)
+
+        results = []
+        worker_holder = []
+
+        def show_summary():
+            model.removeRows(0, model.rowCount())
+            for row in summarize(results):
+                if row["skipped"]:
+                    cells = [row["config"], "skipped", row["skipped"], "", "", ""]
+                else:
+                    cells = [
+                        row["config"],
+                        f"{row['median_seconds']:.2f}s" if row["median_seconds"] is not None else "-",
+                        f"{row['best_seconds']:.2f}s" if row["best_seconds"] is not None else "-",
+                        f"{row['render_fps']:.1f}" if row["render_fps"] else "-",
+                        f"{row['size'] / (1024 * 1024):.1f} MB" if row["size"] else "-",
+                        f"{row['runs']}" + (f" ({row['failed']} failed)" if row["failed"] else ""),
+                    ]
+                model.appendRow([QStandardItem(cell) for cell in cells])
+            table.resizeColumnsToContents()
+
+        def run_done(result):
+            results.append(result)
+            label = config_label(result["config"])
+            if "skipped" in result:
+                self.append_to_log(f"⏱️ {label}: skipped ({result['skipped']})", "warning")
+            else:
+                self.append_to_log(
+                    f"⏱️ {label} #{result['repetition'] + 1}: {result['wall_seconds']:.2f}s, exit {result['exit_code']}",
+                    "info" if result["exit_code"] == 0 else "error"
+                )
+                if result["exit_code"] != 0 and result["tail"]:
+                    self.append_to_log(result["tail"], "error")
+            status.setText(f"{len(results)} run(s) finished...")
+            show_summary()
+
+        def benchmark_done(_):
+            status.setText(f"Done: {len(results)} run(s).")
+            start_btn.setText("▶️ Start")
+
+        def start():
+            if worker_holder and worker_holder[0].isRunning():
+                worker_holder[0].stopping = True
+                status.setText("Stopping after the current run...")
+                return
+            try:
+                fps_values = [int(value) for value in fps_input.text().replace(",", " ").split()]
+            except ValueError:
+                QMessageBox.warning(dialog, "Invalid Frame Rates", "Enter frame rates as numbers, e.g. 15, 30, 60.")
+                return
+            renderers = [name for name, box in renderer_boxes.items() if box.isChecked()]
+            caching = [value for value, box in ((True, cache_on), (False, cache_off)) if box.isChecked()]
+            configs = build_matrix(renderers, caching, fps_values)
+            if not configs:
+                QMessageBox.warning(dialog, "Nothing To Run", "Pick at least one renderer, caching mode and frame rate.")
+                return
+            results.clear()
+            show_summary()
+            worker = BenchmarkWorker(filepath, scene_class, configs, repeat_spin.value(), quality_combo.currentText(), self)
+            worker.run_done.connect(run_done)
+            worker.benchmark_done.connect(benchmark_done)
+            # Kept until it exits, even after the dialog closes, so closing the window can stop it
+            self.benchmark_workers.add(worker)
+            worker.finished.connect(lambda: self.benchmark_workers.discard(worker))
+            worker.finished.connect(worker.deleteLater)
+            worker_holder[:] = [worker]
+            status.setText(f"Running {len(configs)} configuration(s) × {repeat_spin.value()}...")
+            start_btn.setText("⏹️ Stop")
+            worker.start()
+
+        btn_layout = QHBoxLayout()
+        btn_layout.addStretch()
+        start_btn = QPushButton("▶️ Start")
+        start_btn.clicked.connect(start)
+        close_btn = QPushButton("❌ Close")
+        close_btn.clicked.connect(dialog.close)
+        btn_layout.addWidget(start_btn)
+        btn_layout.addWidget(close_btn)
+        layout.addLayout(btn_layout)
+
+        dialog.exec()
+        if worker_holder and worker_holder[0].isRunning():
+            worker_holder[0].stopping = True
+            worker_holder[0].run_done.disconnect(run_done)
+            worker_holder[0].benchmark_done.disconnect(benchmark_done)
+
+    def show_render_history(self):
+        """Recent renders, or only those slower than the previous render of the same scene"""
+        dialog = QDialog(self)
+        dialog.setWindowTitle("📈 Render History")
+        dialog.setMinimumSize(900, 520)
+        dialog.setStyleSheet("""
+            QDialog {
+                background-color: #1e1e2e;
+                color: #cdd6f4;
+            }
+            QTableView {
+                background-color: #11111b;
+                color: #cdd6f4;
+                gridline-color: #313244;
+                border: 1px solid #45475a;
+                border-radius: 8px;
+                selection-background-color: #45475a;
+                selection-color: #89b4fa;
+            }
+            QHeaderView::section {
+                background-color: #313244;
+                color: #89b4fa;
+                padding: 6px;
+                border: none;
+            }
+        """)
+        layout = QVBoxLayout(dialog)
+
+        controls = QHBoxLayout()
+        regressions_checkbox = QCheckBox("Only regressions slower than")
+        threshold_spin = QSpinBox()
+        threshold_spin.setRange(1, 1000)
+        threshold_spin.setSuffix(" %")
+        threshold_spin.setValue(int(DEFAULT_THRESHOLD_PERCENT))
+        scene_filter = QLineEdit()
+        scene_filter.setPlaceholderText("Scene (empty = all)")
+        controls.addWidget(regressions_checkbox)
+        controls.addWidget(threshold_spin)
+        controls.addStretch()
+        controls.addWidget(scene_filter)
+        layout.addLayout(controls)
+
+        model = QStandardItemModel(dialog)
+        table = QTableView()
+        table.setModel(model)
+        table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        table.horizontalHeader().setStretchLastSection(True)
+        table.verticalHeader().setVisible(False)
+        layout.addWidget(table)
+
+        def when(timestamp):
+            return datetime.fromtimestamp(timestamp).strftime("%Y-%m-%d %H:%M")
+
+        def populate():
+            model.clear()
+            scene = scene_filter.text().strip() or None
+            if regressions_checkbox.isChecked():
+                model.setHorizontalHeaderLabels(["Rendered", "Scene", "Quality", "Baseline", "Now", "Slower", "Commits"])
+                for started_at, name, quality, wall, baseline, percent, commit, baseline_commit in \
+                        self.render_history.regressions(threshold_spin.value(), scene):
+                    model.appendRow([QStandardItem(text) for text in [
+                        when(started_at), name, quality or "", f"{baseline:.1f}s", f"{wall:.1f}s",
+                        f"+{percent:.0f}%", f"{(baseline_commit or '?')[:8]} → {(commit or '?')[:8]}"
+                    ]])
+            else:
+                model.setHorizontalHeaderLabels(
+                    ["Rendered", "Scene", "Quality", "Wall Time", "Peak RSS", "Exit", "Output", "Commit", "Manim"]
+                )
+                for started_at, name, quality, wall, rss, exit_code, size, commit, _, version, _ in \
+                        self.render_history.renders(scene, limit=500):
+                    model.appendRow([QStandardItem(text) for text in [
+                        when(started_at), name, quality or "", f"{wall:.1f}s",
+                        f"{rss / (1024 * 1024):.0f} MB" if rss else "", str(exit_code),
+                        f"{size / (1024 * 1024):.1f} MB" if size else "", (commit or "")[:8], version or ""
+                    ]])
+            table.resizeColumnsToContents()
+
+        regressions_checkbox.toggled.connect(populate)
+        threshold_spin.valueChanged.connect(populate)
+        scene_filter.returnPressed.connect(populate)
+
+        hint = QLabel(f"CLI: python manimgui_history.py report --threshold 20   •   {self.render_history.db_path}")
+        hint.setStyleSheet("color: #6c7086;")
+        close_btn = QPushButton("❌ Close")
+        close_btn.clicked.connect(dialog.close)
+        btn_layout = QHBoxLayout()
+        btn_layout.addWidget(hint)
+        btn_layout.addStretch()
+        btn_layout.addWidget(close_btn)
+        layout.addLayout(btn_layout)
+
+        populate()
+        dialog.exec()
+
+    def scan_outputs(self, on_done):
+        """Index the project's outputs on a worker thread, then call on_done; False if a scan is already running"""
+        if self.output_scan_worker is not None:
+            return False
+        project = self.project_path
+        worker = OutputScanWorker(self.output_index.db_path, project, self)
+
+        def finished():
+            self.output_scan_worker = None
+            worker.deleteLater()
+            if worker.error:
+                self.append_to_log(f"⚠️ Could not index outputs: {worker.error}", "warning")
+            self.media_probe.enqueue(self.output_index.missing_durations(project))
+            on_done()
+
+        worker.finished.connect(finished)
+        self.output_scan_worker = worker
+        worker.start()
+        return True
+
+    def show_output_gallery(self):
+        """Browse, filter and sort every indexed render output of the project"""
+        if not self.project_path:
+            QMessageBox.warning(self, "No Project Selected", "Select a project folder first.")
+            return
+        if self.output_index.needs_scan(self.project_path):
+            project = self.project_path
+            if self.scan_outputs(lambda: self.open_output_gallery() if self.project_path == project else None):
+                self.append_to_log("🎞️ Indexing existing outputs...", "info")
+            return
+        self.media_probe.enqueue(self.output_index.missing_durations(self.project_path))
+        self.open_output_gallery()
+
+    def open_output_gallery(self):
+        dialog = QDialog(self)
+        dialog.setWindowTitle("🎞️ Output Gallery")
+        dialog.setMinimumSize(900, 560)
+        dialog.setStyleSheet("""
+            QDialog {
+                background-color: #1e1e2e;
+                color: #cdd6f4;
+            }
+            QTableView {
+                background-color: #11111b;
+                color: #cdd6f4;
+                gridline-color: #313244;
+                border: 1px solid #45475a;
+                border-radius: 8px;
+                selection-background-color: #45475a;
+                selection-color: #89b4fa;
+            }
+            QHeaderView::section {
+                background-color: #313244;
+                color: #89b4fa;
+                padding: 6px;
+                border: none;
+            }
+        """)
+        layout = QVBoxLayout(dialog)
+
+        filter_input = QLineEdit()
+        filter_input.setPlaceholderText("🔎 Filter by scene, quality or file...")
+        layout.addWidget(filter_input)
+
+        headers = ["Scene", "Quality", "Resolution", "Duration", "Size", "Rendered", "Render Time", "File"]
+        model = QStandardItemModel(0, len(headers), dialog)
+        model.setHorizontalHeaderLabels(headers)
+
+        def sortable(text, value):
+            item = QStandardItem(text)
+            item.setData(value, Qt.ItemDataRole.UserRole)
+            item.setEditable(False)
+            return item
+
+        def row_items(record):
+            path, scene, quality, width, height, fps, duration, size, mtime, render_seconds = record
+            resolution = f"{width}x{height}" if width and height else ""
+            return [
+                sortable(scene or "", scene or ""),
+                sortable(quality or "", height or 0),
+                sortable(resolution, (width or 0) * (height or 0)),
+                sortable(f"{duration:.1f}s" if duration else "", duration or 0),
+                sortable(f"{size / (1024 * 1024):.1f} MB", size or 0),
+                sortable(datetime.fromtimestamp(mtime).strftime("%Y-%m-%d %H:%M"), mtime or 0),
+                sortable(f"{render_seconds:.1f}s" if render_seconds else "", render_seconds or 0),
+                sortable(os.path.relpath(path, self.project_path), path),
+            ]
+
+        # Source model row of each output, so a probe result only touches its own row
+        row_of = {}
+
+        def populate():
+            model.removeRows(0, model.rowCount())
+            row_of.clear()
+            for record in self.output_index.rows(self.project_path):
+                row_of[record[0]] = model.rowCount()
+                model.appendRow(row_items(record))
+            count_label.setText(f"{proxy.rowCount()} of {model.rowCount()} output(s)")
+
+        def update_probed(path):
+            row = row_of.get(path)
+            record = self.output_index.row(path) if row is not None else None
+            if record is None:
+                return
+            for column, item in enumerate(row_items(record)):
+                model.setItem(row, column, item)
+
+        proxy = QSortFilterProxyModel(dialog)
+        proxy.setSourceModel(model)
+        proxy.setFilterKeyColumn(-1)
+        proxy.setFilterCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
+        proxy.setSortRole(Qt.ItemDataRole.UserRole)
+
+        table = QTableView()
+        table.setModel(proxy)
+        table.setSortingEnabled(True)
+        table.sortByColumn(5, Qt.SortOrder.DescendingOrder)
+        table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
+        table.horizontalHeader().setStretchLastSection(True)
+        table.verticalHeader().setVisible(False)
+        layout.addWidget(table)
+
+        def selected_path():
+            rows = table.selectionModel().selectedRows(7)
+            return proxy.data(rows[0], Qt.ItemDataRole.UserRole) if rows else None
+
+        def open_selected(*_):
+            path = selected_path()
+            if path and os.path.exists(path):
+                QDesktopServices.openUrl(QUrl.fromLocalFile(path))
+
+        def open_selected_folder():
+            path = selected_path()
+            if path and os.path.exists(os.path.dirname(path)):
+                QDesktopServices.openUrl(QUrl.fromLocalFile(os.path.dirname(path)))
+
+        def filter_changed(text):
+            proxy.setFilterFixedString(text)
+            count_label.setText(f"{proxy.rowCount()} of {model.rowCount()} output(s)")
+
+        def rescan():
+            if self.scan_outputs(rescanned):
+                rescan_button.setEnabled(False)
+                count_label.setText("⏳ Rescanning...")
+
+        def rescanned():
+            if dialog.isVisible():
+                rescan_button.setEnabled(True)
+                populate()
+
+        table.doubleClicked.connect(open_selected)
+        filter_input.textChanged.connect(filter_changed)
+
+        btn_layout = QHBoxLayout()
+        count_label = QLabel()
+        btn_layout.addWidget(count_label)
+        btn_layout.addStretch()
+        for text, handler in [("🎬 Open", open_selected), ("📁 Open Folder", open_selected_folder),
+                              ("🔄 Rescan", rescan), ("❌ Close", dialog.close)]:
+            button = QPushButton(text)
+            button.clicked.connect(handler)
+            btn_layout.addWidget(button)
+            if handler is rescan:
+                rescan_button = button
+        layout.addLayout(btn_layout)
+
+        populate()
+        self.media_probe.probed.connect(update_probed)
+        dialog.exec()
+        self.media_probe.probed.disconnect(update_probed)
+
+    def closeEvent(self, event):
+        if self.render_process and self.render_process.state() == QProcess.ProcessState.Running:
+            pid = self.render_process.processId()
+            signal_tree(pid, descendants(pid), force=True)
+            self.render_process.waitForFinished(1000)
+        self.thumbnailer.stop()
+        for worker in list(self.benchmark_workers):
+            worker.stop()
+        if self.scan_worker is not None:
+            self.scan_worker.stop()
+        if self.output_scan_worker is not None:
+            self.output_scan_worker.wait()
+        self.lint_worker.stop()
+        self.log_search_worker.stop()
+        self.history_writer.stop()
+        self.log_store.close()
+        super().closeEvent(event)
+
     def file_tree_double_clicked(self, index):
         path = self.file_model.filePath(index)
         if os.path.isfile(path) and path.endswith('.py'):
@@ -1466,18 +3719,139 @@ class ManimGUI(QWidget):
     def close_tab(self, index):
         widget = self.tabs.widget(index)
         if widget:
-            for filename, (filepath, editor, highlighter) in list(self.scene_tabs.items()):
-                if editor == widget:
-                    del self.scene_tabs[filename]
-                    break
+            filepath, relabel = self.scene_tabs.remove(widget)
+            if filepath:
+                self.tab_memory.pop(filepath, None)
+                self.saved_hashes.pop(filepath, None)
+                self.file_watcher.removePath(filepath)
+            self.tab_last_active.pop(widget, None)
+            self.hibernated_tabs.pop(widget, None)
+            self.diagnostics.pop(widget, None)
+            self.lint_generation.pop(widget, None)
+            if self.lint_target is widget:
+                self.lint_target = None
+            if self.active_editor is widget:
+                self.active_editor = None
             widget.deleteLater()
             self.tabs.removeTab(index)
+            self.refresh_tab_labels(relabel)
+
+    def refresh_tab_labels(self, paths):
+        for path in paths:
+            self.update_tab_title(self.scene_tabs.editor(path))
+
+    def update_tab_title(self, editor):
+        """Show the tab's label, marked with a dot while it has unsaved changes"""
+        path = self.scene_tabs.path_for(editor)
+        index = self.tabs.indexOf(editor)
+        if path is None or index < 0:
+            return
+        label = self.scene_tabs.label(path)
+        if editor.document().isModified():
+            label = f"● {label}"
+        self.tabs.setTabText(index, label)
 
     def tab_changed(self, index):
         """When tab changes, try to auto-detect the scene class"""
+        now = time.monotonic()
+        if self.active_editor is not None:
+            self.tab_last_active[self.active_editor] = now
+        self.active_editor = self.tabs.widget(index)
+        if self.active_editor is not None:
+            self.tab_last_active[self.active_editor] = now
+            if self.active_editor in self.hibernated_tabs:
+                self.rehydrate_tab(self.active_editor)
+                return
         if index >= 0:
             self.detect_scene_class()
             self.count_animations()
+            if self.active_editor in self.diagnostics:
+                self.show_diagnostics(self.active_editor)
+            else:
+                self.problems_list.hide()
+                self.schedule_lint(self.active_editor)
+        else:
+            self.problems_list.hide()
+
+    def configure_hibernation(self):
+        """Set how long a clean inactive tab is kept in memory"""
+        minutes, ok = QInputDialog.getInt(
+            self, "Tab Hibernation",
+            "Release inactive, saved tabs after this many minutes (0 = never):",
+            self.hibernate_minutes, 0, 24 * 60
+        )
+        if ok:
+            self.hibernate_minutes = minutes
+            QSettings("ManimGUI", "Editor").setValue("hibernate_minutes", minutes)
+
+    def hibernate_idle_tabs(self):
+        if self.hibernate_minutes <= 0:
+            return
+        cutoff = time.monotonic() - self.hibernate_minutes * 60
+        for path, editor, highlighter in list(self.scene_tabs.items()):
+            if (editor is self.tabs.currentWidget() or editor in self.hibernated_tabs
+                    or editor.isReadOnly() or editor.document().isModified()):
+                continue
+            if self.tab_last_active.get(editor, 0) < cutoff:
+                self.hibernate_tab(path)
+
+    def hibernate_tab(self, path):
+        """Drop a tab's document, undo history and highlighter, keeping only its position"""
+        editor = self.scene_tabs.editor(path)
+        self.hibernated_tabs[editor] = (
+            editor.textCursor().position(),
+            editor.verticalScrollBar().value(),
+            editor.horizontalScrollBar().value(),
+        )
+        old_document = editor.document()
+        # setDocument() deletes the editor's built-in document itself; only the
+        # ones created here (on an earlier hibernation) are left for us to free.
+        owned = old_document.parent() is editor
+        document = QTextDocument(editor)
+        document.setDocumentLayout(QPlainTextDocumentLayout(document))
+        editor.setDocument(document)
+        # The highlighter is a child of the old document and goes with it.
+        if owned:
+            old_document.deleteLater()
+        self.scene_tabs.set_highlighter(path, None)
+        self.tab_memory[path] = 0
+
+    def rehydrate_tab(self, editor):
+        """Reload a hibernated tab from disk and restore its cursor and scroll position"""
+        cursor_pos, v_scroll, h_scroll = self.hibernated_tabs.pop(editor)
+        path = self.scene_tabs.path_for(editor)
+        if path is None:
+            return
+
+        def restore():
+            cursor = editor.textCursor()
+            cursor.setPosition(min(cursor_pos, editor.document().characterCount() - 1))
+            editor.setTextCursor(cursor)
+            editor.verticalScrollBar().setValue(v_scroll)
+            editor.horizontalScrollBar().setValue(h_scroll)
+            self.status_indicator.setText("⚪ Ready")
+            if self.tabs.currentWidget() is editor:
+                self.detect_scene_class()
+                self.count_animations()
+
+        # A reload that failed earlier left the editor read-only so its empty document can't be saved
+        editor.setReadOnly(False)
+        try:
+            highlighter = self.load_editor_contents(path, editor, restore)
+        except OSError as e:
+            # The file went away or became unreadable while the tab slept: keep it asleep
+            self.hibernated_tabs[editor] = (cursor_pos, v_scroll, h_scroll)
+            editor.setReadOnly(True)
+            self.status_indicator.setText("⚠️ File unavailable")
+            self.append_to_log(f"⚠️ Could not reload {path}: {e}", "warning")
+            answer = QMessageBox.question(
+                self, "File Unavailable",
+                f"Could not reload {os.path.basename(path)}:\n{e}\n\nClose this tab?"
+            )
+            if answer == QMessageBox.StandardButton.Yes:
+                self.close_tab(self.tabs.indexOf(editor))
+            return
+        self.scene_tabs.set_highlighter(path, highlighter)
 
     def detect_scene_class(self):
         """Attempt to detect the scene class name from the current file"""
@@ -1504,8 +3878,8 @@ class ManimGUI(QWidget):
         code = editor.toPlainText()
         
         # Count self.play() and self.wait() calls
-        play_count = len(re.findall(r"\bself\\.play\b", code))
-        wait_count = len(re.findall(r"\bself\\.wait\b", code))
+        play_count = len(re.findall(r"\bself\.play\b", code))
+        wait_count = len(re.findall(r"\bself\.wait\b", code))
         
         self.animation_count = play_count + wait_count
         self.completed_animations = 0
@@ -1519,7 +3893,107 @@ class ManimGUI(QWidget):
         if folder:
             self.project_path = folder
             self.project_label.setText(f"📂 {os.path.basename(folder)}")
+            self.reload_profiles()
             self.file_tree.setRootIndex(self.file_model.setRootPath(folder))
+            self.watch_project(folder)
+
+    def watch_project(self, folder):
+        """Watch the project's folders, skipping media, caches and virtualenvs"""
+        watched = self.file_watcher.directories()
+        if watched:
+            self.file_watcher.removePaths(watched)
+        self.watch_directories(folder)
+        self.schedule_thumbnail_refresh()
+
+    def schedule_thumbnail_refresh(self):
+        if self.project_path:
+            self.thumbnail_timer.start(THUMBNAIL_REFRESH_DELAY_MS)
+
+    def watch_directories(self, folder):
+        dirs = []
+        for root, dirnames, _ in os.walk(folder):
+            dirnames[:] = [d for d in dirnames if not is_ignored_dir(root, d)]
+            dirs.append(root)
+            if len(dirs) >= MAX_WATCHED_DIRS:
+                self.append_to_log(f"⚠️ Watching only the first {MAX_WATCHED_DIRS} project folders", "warning")
+                break
+        new_dirs = [d for d in dirs if d not in self.file_watcher.directories()]
+        if new_dirs:
+            self.file_watcher.addPaths(new_dirs)
+
+    def watched_directory_changed(self, path):
+        # New subfolders need watching too; files replaced by rename-on-save
+        # drop out of the watcher and are picked up again here.
+        if os.path.isdir(path) and len(self.file_watcher.directories()) < MAX_WATCHED_DIRS:
+            self.watch_directories(path)
+        self.schedule_thumbnail_refresh()
+        for filepath, editor, _ in self.scene_tabs.items():
+            if os.path.dirname(filepath) == path and filepath not in self.file_watcher.files():
+                self.watched_file_changed(filepath)
+
+    def watched_file_changed(self, path):
+        # Editors often write in several steps; coalesce the burst.
+        self.pending_file_changes.add(path)
+        self.file_change_timer.start(200)
+
+    def process_file_changes(self):
+        paths, self.pending_file_changes = self.pending_file_changes, set()
+        self.schedule_thumbnail_refresh()
+        for path in paths:
+            editor = self.scene_tabs.editor(path)
+            if editor is None:
+                continue
+            if not os.path.exists(path):
+                self.append_to_log(f"⚠️ {os.path.basename(path)} was deleted or moved on disk", "warning")
+                continue
+            if path not in self.file_watcher.files():
+                self.file_watcher.addPath(path)
+            if editor in self.hibernated_tabs or editor.isReadOnly():
+                # Hibernated tabs re-read the file when activated.
+                continue
+            try:
+                with open(path, 'r', encoding='utf-8', errors='replace') as f:
+                    disk_text = f.read()
+            except OSError:
+                continue
+            digest = content_hash(disk_text)
+            if digest == self.saved_hashes.get(path):
+                # Our own save, or a touch that didn't change the content.
+                continue
+
+            name = os.path.basename(path)
+            if editor.document().isModified():
+                reply = QMessageBox.question(
+                    self, "File Changed on Disk",
+                    f"'{name}' was changed outside the editor, and you have unsaved changes.\n\n"
+                    "Reload the version on disk? (Your edits stay available through Undo.)",
+                    QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+                    QMessageBox.StandardButton.No
+                )
+                if reply == QMessageBox.StandardButton.No:
+                    # Keep the editor's version; the next save overwrites the disk copy.
+                    self.saved_hashes[path] = digest
+                    self.append_to_log(f"⚠️ Kept your version of {name}; the file on disk differs", "warning")
+                    continue
+
+            self.reload_editor_from_text(editor, disk_text)
+            self.saved_hashes[path] = digest
+            self.append_to_log(f"🔄 Reloaded {name} (changed on disk)", "info")
+
+    def reload_editor_from_text(self, editor, text):
+        """Patch only the changed lines into the editor, as one undoable step"""
+        v_scroll = editor.verticalScrollBar().value()
+        h_scroll = editor.horizontalScrollBar().value()
+        cursor = QTextCursor(editor.document())
+        cursor.beginEditBlock()
+        for start, end, replacement in text_diff_edits(editor.toPlainText(), text):
+            cursor.setPosition(start)
+            cursor.setPosition(end, QTextCursor.MoveMode.KeepAnchor)
+            cursor.insertText(replacement)
+        cursor.endEditBlock()
+        editor.document().setModified(False)
+        editor.verticalScrollBar().setValue(v_scroll)
+        editor.horizontalScrollBar().setValue(h_scroll)
 
     def create_new_file(self):
         if not self.project_path:
@@ -1556,68 +4030,456 @@ class ManimGUI(QWidget):
                 QMessageBox.critical(self, "Error Creating File", f"Could not create the file:\n{e}")
 
     def open_scene_file(self, filepath):
-        for name, (path, editor, _) in self.scene_tabs.items():
-            if path == filepath:
-                self.tabs.setCurrentWidget(editor)
-                return
+        filepath = os.path.abspath(filepath)
+        editor = self.scene_tabs.editor(filepath)
+        if editor:
+            self.tabs.setCurrentWidget(editor)
+            return
 
-        tab = QTextEdit()
+        rss_before = process_rss_bytes()
+        tab = QPlainTextEdit()
         tab.setFont(QFont("Courier New", 10))
-        with open(filepath, 'r') as f:
-            tab.setPlainText(f.read())
-        
-        highlighter = PythonSyntaxHighlighter(tab.document())
+        tab.setLineWrapMode(QPlainTextEdit.LineWrapMode.NoWrap)
+        tab.textChanged.connect(self.schedule_autosave)
+        tab.textChanged.connect(lambda: self.schedule_lint(tab))
+        tab.installEventFilter(self)
+
+        highlighter = self.load_editor_contents(filepath, tab, lambda: self.file_loaded(filepath, tab, rss_before))
 
-        filename = os.path.basename(filepath)
-        self.scene_tabs[filename] = (filepath, tab, highlighter)
-        index = self.tabs.addTab(tab, filename)
+        relabel = self.scene_tabs.add(filepath, tab, highlighter)
+        self.file_watcher.addPath(filepath)
+        index = self.tabs.addTab(tab, self.scene_tabs.label(filepath))
+        self.refresh_tab_labels(relabel)
         self.tabs.setCurrentIndex(index)
 
+    def load_editor_contents(self, filepath, editor, on_loaded):
+        """Fill an editor from disk, in chunks for large files; returns its highlighter if any"""
+        def finish():
+            self.saved_hashes[filepath] = content_hash(editor.toPlainText())
+            editor.document().modificationChanged.connect(lambda _: self.update_tab_title(editor))
+            on_loaded()
+
+        if os.path.getsize(filepath) > LARGE_FILE_BYTES:
+            self.append_to_log(f"📄 Large file, loading without highlighting: {os.path.basename(filepath)}", "info")
+            loader = ChunkedFileLoader(filepath, editor)
+            loader.progress.connect(lambda pct: self.status_indicator.setText(f"⏳ Loading {pct}%"))
+            loader.loaded.connect(finish)
+            loader.start()
+            return None
+
+        with open(filepath, 'r', encoding='utf-8', errors='replace') as f:
+            editor.setPlainText(f.read())
+        editor.document().setModified(False)
+        highlighter = PythonSyntaxHighlighter(editor.document())
+        finish()
+        return highlighter
+
+    def file_loaded(self, filepath, editor, rss_before):
+        """Record how much memory opening a tab cost"""
+        self.status_indicator.setText("⚪ Ready")
+        self.tab_memory[filepath] = max(0, process_rss_bytes() - rss_before)
+        document = editor.document()
+        editor.setToolTip(
+            f"{filepath}\n{document.blockCount()} lines, "
+            f"~{self.tab_memory[filepath] / (1024 * 1024):.1f} MB resident"
+        )
+        try:
+            large = os.path.getsize(filepath) > LARGE_FILE_BYTES
+        except OSError:
+            large = False
+        if large:
+            self.append_to_log(f"📄 Loaded {os.path.basename(filepath)}: {document.blockCount()} lines", "info")
+            # Detection ran on the empty document when the tab opened.
+            if self.tabs.currentWidget() is editor:
+                self.detect_scene_class()
+                self.count_animations()
+
+    def show_tab_memory(self):
+        """Report the measured memory cost of each open tab"""
+        if not self.scene_tabs:
+            QMessageBox.information(self, "Tab Memory", "No files are open.")
+            return
+        lines = []
+        for path, editor, _ in self.scene_tabs.items():
+            name = self.scene_tabs.label(path)
+            if editor in self.hibernated_tabs:
+                lines.append(f"{name}: 💤 hibernated")
+                continue
+            size_mb = self.tab_memory.get(path, 0) / (1024 * 1024)
+            lines.append(f"{name}: {editor.document().blockCount()} lines, ~{size_mb:.1f} MB")
+        total_mb = process_rss_bytes() / (1024 * 1024)
+        lines.append(f"\nProcess total: {total_mb:.1f} MB")
+        self.append_to_log("📈 Tab memory:\n" + "\n".join(lines), "info")
+        QMessageBox.information(self, "Tab Memory", "\n".join(lines))
+
     def get_current_file_path(self):
-        current_index = self.tabs.currentIndex()
-        if current_index == -1:
+        editor = self.tabs.currentWidget()
+        filepath = self.scene_tabs.path_for(editor)
+        if filepath is None:
             return None, None
-        tab_name = self.tabs.tabText(current_index)
-        if tab_name in self.scene_tabs:
-            return self.scene_tabs[tab_name][0], self.scene_tabs[tab_name][1]
-        return None, None
+        return filepath, editor
 
-    def render_scene(self):
-        if self.render_process and self.render_process.state() == QProcess.ProcessState.Running:
-            QMessageBox.warning(self, "Render in Progress", "A rendering process is already running. Please wait for it to complete.")
+    def current_profile(self):
+        return self.profiles.get(self.quality_combo.currentText()) or self.profiles[DEFAULT_PROFILE]
+
+    def reload_profiles(self):
+        """Fill the profile picker from the built-in and current project's profiles"""
+        self.profiles = load_profiles(self.project_path or None)
+        selected = self.quality_combo.currentText() or QSettings("ManimGUI", "Render").value("profile", DEFAULT_PROFILE)
+        self.quality_combo.blockSignals(True)
+        self.quality_combo.clear()
+        for name, profile in self.profiles.items():
+            self.quality_combo.addItem(name)
+            self.quality_combo.setItemData(
+                self.quality_combo.count() - 1, " ".join(profile_flags(profile)), Qt.ItemDataRole.ToolTipRole
+            )
+        index = self.quality_combo.findText(selected)
+        self.quality_combo.setCurrentIndex(index if index >= 0 else self.quality_combo.findText(DEFAULT_PROFILE))
+        self.quality_combo.blockSignals(False)
+
+    def remember_profile(self, name):
+        if name:
+            QSettings("ManimGUI", "Render").setValue("profile", name)
+
+    def edit_profiles(self):
+        """Create, change and delete the current project's render profiles"""
+        if not self.project_path:
+            QMessageBox.warning(self, "No Project", "Open a project folder first; profiles are saved per project.")
             return
 
+        dialog = QDialog(self)
+        dialog.setWindowTitle("🎛️ Render Profiles")
+        dialog.setMinimumSize(560, 360)
+        layout = QHBoxLayout(dialog)
+
+        profile_list = QListWidget()
+        layout.addWidget(profile_list, 1)
+
+        form = QGridLayout()
+        name_input = QLineEdit()
+        quality_input = QComboBox()
+        quality_input.addItems(QUALITY_PRESETS)
+        resolution_input = QLineEdit()
+        resolution_input.setPlaceholderText("preset default, e.g. 854,480")
+        fps_input = QSpinBox()
+        fps_input.setRange(0, 240)
+        fps_input.setSpecialValueText("preset default")
+        caching_box = QCheckBox("--disable_caching")
+        movie_box = QCheckBox("--write_to_movie")
+        last_frame_box = QCheckBox("--save_last_frame")
+        flags_label = QLabel()
+        flags_label.setWordWrap(True)
+        form.addWidget(QLabel("Name:"), 0, 0)
+        form.addWidget(name_input, 0, 1)
+        form.addWidget(QLabel("Quality preset:"), 1, 0)
+        form.addWidget(quality_input, 1, 1)
+        form.addWidget(QLabel("Resolution:"), 2, 0)
+        form.addWidget(resolution_input, 2, 1)
+        form.addWidget(QLabel("Frame rate:"), 3, 0)
+        form.addWidget(fps_input, 3, 1)
+        form.addWidget(caching_box, 4, 1)
+        form.addWidget(movie_box, 5, 1)
+        form.addWidget(last_frame_box, 6, 1)
+        form.addWidget(flags_label, 7, 0, 1, 2)
+        form.setRowStretch(8, 1)
+
+        buttons = QHBoxLayout()
+        save_btn = QPushButton("💾 Save")
+        delete_btn = QPushButton("🗑️ Delete")
+        close_btn = QPushButton("❌ Close")
+        buttons.addWidget(save_btn)
+        buttons.addWidget(delete_btn)
+        buttons.addStretch()
+        buttons.addWidget(close_btn)
+        form.addLayout(buttons, 9, 0, 1, 2)
+        layout.addLayout(form, 2)
+
+        def form_profile():
+            return {
+                "quality": quality_input.currentText(),
+                "resolution": resolution_input.text(),
+                "fps": fps_input.value(),
+                "disable_caching": caching_box.isChecked(),
+                "write_to_movie": movie_box.isChecked(),
+                "save_last_frame": last_frame_box.isChecked(),
+            }
+
+        def show_flags():
+            try:
+                flags_label.setText("manim " + " ".join(profile_flags(form_profile())))
+            except ProfileError as e:
+                flags_label.setText(f"⚠️ {e}")
+
+        def fill(name):
+            profile = self.profiles.get(name)
+            if profile is None:
+                return
+            name_input.setText(name)
+            quality_input.setCurrentText(profile["quality"])
+            resolution_input.setText(profile["resolution"])
+            fps_input.setValue(profile["fps"])
+            caching_box.setChecked(profile["disable_caching"])
+            movie_box.setChecked(profile["write_to_movie"])
+            last_frame_box.setChecked(profile["save_last_frame"])
+            show_flags()
+
+        def refresh(select=None):
+            self.reload_profiles()
+            profile_list.clear()
+            profile_list.addItems(list(self.profiles))
+            matches = profile_list.findItems(select or self.quality_combo.currentText(), Qt.MatchFlag.MatchExactly)
+            if matches:
+                profile_list.setCurrentItem(matches[0])
+
+        def save():
+            try:
+                save_profile(self.project_path, name_input.text(), form_profile())
+            except (ProfileError, OSError) as e:
+                QMessageBox.warning(dialog, "Profile Not Saved", str(e))
+                return
+            name = name_input.text().strip()
+            refresh(name)
+            self.quality_combo.setCurrentText(name)
+            self.append_to_log(f"🎛️ Saved render profile '{name}'", "info")
+
+        def delete():
+            name = name_input.text().strip()
+            try:
+                removed = delete_profile(self.project_path, name)
+            except OSError as e:
+                QMessageBox.warning(dialog, "Profile Not Deleted", str(e))
+                return
+            if not removed:
+                QMessageBox.information(dialog, "Built-in Profile", f"'{name}' is built in and can't be deleted.")
+                return
+            refresh()
+            self.append_to_log(f"🎛️ Deleted render profile '{name}'", "info")
+
+        profile_list.currentTextChanged.connect(fill)
+        resolution_input.textChanged.connect(show_flags)
+        quality_input.currentTextChanged.connect(show_flags)
+        fps_input.valueChanged.connect(show_flags)
+        for box in (caching_box, movie_box, last_frame_box):
+            box.toggled.connect(show_flags)
+        save_btn.clicked.connect(save)
+        delete_btn.clicked.connect(delete)
+        close_btn.clicked.connect(dialog.close)
+        refresh()
+        dialog.exec()
+
+    def render_args(self, preview=False):
+        """Manim flags for the selected profile and output type"""
+        flags = profile_flags(self.current_profile())
+
+        output_type = self.output_type_combo.currentText()
+        if output_type == "🖼️ PNG Image":
+            return flags if "-s" in flags else ["-s"] + flags
+        if output_type == "📐 SVG Vector":
+            return (flags if "-s" in flags else ["-s"] + flags) + ["--format=svg"]
+        return ["-p"] + flags if preview else flags
+
+    def configure_farm_workers(self, workers, token=None):
+        self.farm_workers = [w.strip() for w in workers if w.strip()]
+        self.farm_token = token
+        self.farm = FarmScheduler(self.farm_workers, token) if self.farm_workers else None
+
+    def edit_farm_workers(self):
+        """Set the host:port list of render farm workers"""
+        text, ok = QInputDialog.getText(
+            self, "Render Farm Workers",
+            "Workers as host:port, separated by commas\n"
+            "(start one with: python manimgui_worker.py --host 0.0.0.0 --port 8765 --token SECRET):",
+            QLineEdit.EchoMode.Normal, ", ".join(self.farm_workers)
+        )
+        if not ok:
+            return
+        token, ok = QInputDialog.getText(
+            self, "Render Farm Token", "Shared worker token (leave empty if the workers don't use one):",
+            QLineEdit.EchoMode.Password, self.farm_token or ""
+        )
+        if not ok:
+            return
+        settings = QSettings("ManimGUI", "RenderFarm")
+        settings.setValue("workers", text)
+        settings.setValue("token", token)
+        self.configure_farm_workers(text.split(","), token or None)
+        self.append_to_log(f"🖧 Render farm: {len(self.farm_workers)} worker(s) configured", "info")
+
+    def render_on_farm(self):
+        """Queue the current scene on the render farm; jobs go to the least loaded worker"""
+        if not self.farm:
+            self.edit_farm_workers()
+            if not self.farm:
+                return
         filepath, editor = self.get_current_file_path()
         if not filepath or not self.project_path:
             QMessageBox.warning(self, "No Scene Selected", "Open or create a scene file first.")
             return
+        if editor.isReadOnly():
+            QMessageBox.warning(self, "Still Loading", "Wait for the file to finish loading before rendering.")
+            return
+        scene_class = self.scene_class_input.text().strip()
+        if not scene_class:
+            QMessageBox.warning(self, "Missing Scene Name", "Enter the SceneClassName to render.")
+            return
+        try:
+            self.save_editor(filepath, editor)
+        except OSError as e:
+            QMessageBox.critical(self, "Save Failed", f"Could not save file before rendering:\n{e}")
+            return
 
-        with open(filepath, 'w') as f:
-            f.write(editor.toPlainText())
+        job = FarmJob(
+            filepath, self.project_path, scene_class, self.render_args(),
+            on_line=self.farm_bridge.line.emit, on_done=self.farm_bridge.done.emit
+        )
+        job.started_at = time.monotonic()
+        self.append_to_log(f"🖧 Queued {scene_class} on the render farm", "info")
+        # Picking a worker talks to every worker, so keep it off the GUI thread
+        threading.Thread(target=self.farm.submit, args=(job,), daemon=True).start()
+
+    def farm_job_line(self, job, line):
+        if "ERROR" in line or "Exception" in line:
+            msg_type = "error"
+        elif "WARNING" in line:
+            msg_type = "warning"
+        else:
+            msg_type = "info" if "INFO" in line else "normal"
+        self.append_to_log(f"[{job.worker}] {line}", msg_type)
+
+    def farm_job_done(self, job, returncode, outputs, error):
+        if error:
+            self.append_to_log(f"❌ Farm render of {job.scene} failed: {error}", "error")
+            return
+        if returncode != 0:
+            self.append_to_log(f"❌ Farm render of {job.scene} on {job.worker} exited with code {returncode}", "error")
+            return
+        render_seconds = time.monotonic() - job.started_at
+        for path in outputs:
+            if self.output_index.add_output(job.project_dir, path, render_seconds):
+                self.media_probe.enqueue([path])
+        if outputs:
+            self.last_output_path = outputs[-1]
+            self.last_output_dir = os.path.dirname(self.last_output_path)
+            self.open_output_btn.setEnabled(True)
+            self.open_output_folder_btn.setEnabled(True)
+        self.append_to_log(
+            f"✅ Farm render of {job.scene} finished on {job.worker} in {render_seconds:.1f}s "
+            f"({len(outputs)} file(s))", "info"
+        )
+
+    def preflight_check(self, filepath, editor, scene_class):
+        """Catch errors that would fail the render before paying for manim's startup"""
+        source = editor.toPlainText()
+        key = (content_hash(source), scene_class, len(self.symbol_index))
+        if key not in self.preflight_cache:
+            if len(self.preflight_cache) > 256:
+                self.preflight_cache.clear()
+            self.preflight_cache[key] = preflight(
+                source, scene_class, filepath, self.symbol_index.star_names,
+                search_paths=[os.path.dirname(filepath), self.project_path]
+            )
+        problem = self.preflight_cache[key]
+        if problem is None:
+            return True
+
+        self.append_to_log(f"❌ Pre-flight check failed at line {problem['line']}: {problem['message']}", "error")
+        self.diagnostics[editor] = [problem] + [
+            item for item in self.diagnostics.get(editor, []) if item != problem
+        ]
+        self.show_diagnostics(editor)
+        block = editor.document().findBlockByNumber(problem["line"] - 1)
+        if block.isValid():
+            cursor = QTextCursor(block)
+            cursor.movePosition(QTextCursor.MoveOperation.EndOfBlock, QTextCursor.MoveMode.KeepAnchor)
+            editor.setTextCursor(cursor)
+            editor.centerCursor()
+        QMessageBox.warning(self, "Render Blocked", f"Line {problem['line']}: {problem['message']}")
+        return False
+
+    def render_busy(self):
+        return self.render_stop is not None or (
+            self.render_process is not None and self.render_process.state() != QProcess.ProcessState.NotRunning
+        )
+
+    def set_preempt_renders(self, enabled):
+        self.preempt_renders = enabled
+        QSettings("ManimGUI", "Render").setValue("preempt", enabled)
+        self.update_render_button()
+
+    def update_render_button(self, *_):
+        """Show whether pressing Render now would start, replace or queue a render"""
+        busy = self.render_busy()
+        self.stop_render_btn.setEnabled(busy)
+        if not busy:
+            self.render_btn.setText("▶️ Render Animation")
+            self.render_btn.setToolTip("Render the current scene (F5)")
+            return
+        filepath, _ = self.get_current_file_path()
+        key = (os.path.abspath(filepath) if filepath else None, self.scene_class_input.text().strip())
+        if self.preempt_renders and self.render_job and self.render_job["key"] == key:
+            self.render_btn.setText("🔁 Replace Render")
+            self.render_btn.setToolTip("Stop the running render of this scene and render the current code instead (F5)")
+        else:
+            queued = f" ({len(self.render_queue)} waiting)" if self.render_queue else ""
+            self.render_btn.setText(f"➕ Queue Render{queued}")
+            self.render_btn.setToolTip("Render this scene after the running render finishes (F5)")
+
+    def render_scene(self):
+        """Render the current scene now, or replace or queue behind a running render"""
+        filepath, editor = self.get_current_file_path()
+        if not filepath or not self.project_path:
+            QMessageBox.warning(self, "No Scene Selected", "Open or create a scene file first.")
+            return
+        if editor.isReadOnly():
+            QMessageBox.warning(self, "Still Loading", "Wait for the file to finish loading before rendering.")
+            return
+
+        try:
+            self.save_editor(filepath, editor)
+        except OSError as e:
+            QMessageBox.critical(self, "Save Failed", f"Could not save file before rendering:\n{e}")
+            return
 
         scene_class = self.scene_class_input.text().strip()
         if not scene_class:
             QMessageBox.warning(self, "Missing Scene Name", "Enter the SceneClassName to render.")
             return
 
-        quality_map = {
-            "📱 Low (480p)": "-ql",
-            "💻 High (1080p)": "-qh",
-            "🎥 4K (2160p)": "-qk",
-            "🖼️ Custom": "-qm"
+        if not self.preflight_check(filepath, editor, scene_class):
+            return
+
+        job = {
+            "key": (os.path.abspath(filepath), scene_class), "filepath": filepath, "scene": scene_class,
+            "args": self.render_args(preview=True), "quality": describe(self.current_profile()),
+            "source_hash": content_hash(editor.toPlainText()), "animation_count": self.animation_count,
         }
-        quality = self.quality_combo.currentText()
-        flag = quality_map.get(quality, "-qh")
-        
-        output_type = self.output_type_combo.currentText()
-        if output_type == "🎬 MP4 Video":
-            cmd = f"manim -p {flag} \"{filepath}\" {scene_class}"
-        elif output_type == "🖼️ PNG Image":
-            cmd = f"manim -s {flag} \"{filepath}\" {scene_class}"
-        elif output_type == "📐 SVG Vector":
-            cmd = f"manim -s --format=svg {flag} \"{filepath}\" {scene_class}"
+        if not self.render_busy():
+            self.start_render(job)
+            return
+
+        # Only the newest request per scene is worth rendering
+        self.render_queue = deque(queued for queued in self.render_queue if queued["key"] != job["key"])
+        if self.preempt_renders and self.render_job and self.render_job["key"] == job["key"]:
+            self.render_queue.appendleft(job)
+            self.append_to_log(f"🔁 Replacing the running render of {scene_class} with the current code", "info")
+            self.stop_render_tree(replaced=True)
         else:
-            cmd = f"manim -p {flag} \"{filepath}\" {scene_class}"
+            self.render_queue.append(job)
+            self.append_to_log(f"➕ Queued {scene_class} (position {len(self.render_queue)})", "info")
+        self.update_render_button()
+
+    def start_next_render(self):
+        if self.render_queue and not self.render_busy():
+            self.start_render(self.render_queue.popleft())
+        self.update_render_button()
+
+    def start_render(self, job):
+        filepath, scene_class, args = job["filepath"], job["scene"], job["args"]
+        cmd = f"manim {' '.join(args)} \"{filepath}\" {scene_class}"
+        self.render_job = job
+        self.animation_count = job["animation_count"]
+        self.log_store.flush()
+        self.log_run = self.log_store.start_run(scene_class, filepath)
 
         self.log_history.clear()
         self.output_log.clear()
@@ -1629,32 +4491,69 @@ class ManimGUI(QWidget):
         self.last_output_dir = ""
         self.open_output_btn.setEnabled(False)
         self.open_output_folder_btn.setEnabled(False)
+        quality = job["quality"]
+        source_hash = job["source_hash"]
+        self.render_timing_key = (f"{os.path.abspath(filepath)}::{scene_class}", quality, source_hash)
+        history = self.render_timings.load(self.render_timing_key[0], quality)
+        self.render_estimate = RenderEstimate(self.animation_count, history, source_hash)
+        if history and not self.animation_count:
+            self.animation_count = len(history[1])
         self.animation_counter.setText(f"Animations: 0/{self.animation_count}")
+        self.eta_label.setText(format_eta(None))
         
         self.append_to_log(f"▶️ Starting render: {cmd}\n", "info")
+        self.render_started_at = time.monotonic()
+        stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+        self.render_events = EventLogWriter(
+            os.path.join(self.project_path, "media", "render_logs", f"{scene_class}-{stamp}.ndjson")
+        )
+        self.render_events_percent = -1
+        self.render_record = {
+            "project": self.project_path, "file": filepath, "scene": scene_class,
+            "quality": quality, "flags": args, "started_at": time.time(), "peak_rss": None,
+        }
+        self.render_events.emit(
+            "start", command=cmd, file=filepath, scene=scene_class, quality=quality,
+            flags=args, source_hash=source_hash,
+            expected_animations=self.animation_count
+        )
         
         self.render_process = QProcess()
         self.render_process.setProcessChannelMode(QProcess.ProcessChannelMode.MergedChannels)
         self.render_process.readyReadStandardOutput.connect(self.handle_stdout)
         self.render_process.finished.connect(self.render_finished)
         self.render_process.setWorkingDirectory(self.project_path)
-        self.render_process.startCommand(cmd)
+        # Own session, so stopping can signal manim's ffmpeg and latex children as one group
+        prefix = " ".join(session_prefix())
+        self.render_process.startCommand(f"{prefix} {cmd}" if prefix else cmd)
         self.status_timer.start(100)
-        self.render_controls_widget.setEnabled(False)
+        self.update_render_button()
 
     def handle_stdout(self):
         if not self.render_process:
             return
             
-        data = self.render_process.readAllStandardOutput().data().decode()
-        for line in data.split('\n'):
+        data = self.render_process.readAllStandardOutput().data().decode(errors="replace")
+        # Progress bars redraw with carriage returns rather than newlines
+        for line in re.split(r"[\r\n]", data):
             if line.strip():
                 self.process_output_line(line)
 
     def process_output_line(self, line):
-        if "Animation" in line and "finished" in line:
+        if "Animation" in line and ("finished" in line or "Partial movie file written" in line):
             self.completed_animations += 1
-            progress = int((self.completed_animations / max(1, self.animation_count)) * 100)
+            if self.render_estimate:
+                match = re.search(r"Animation\s+(\d+)", line)
+                index = int(match.group(1)) if match else self.completed_animations - 1
+                self.render_estimate.animation_finished(index)
+                progress = int(self.render_estimate.progress() * 100)
+                if self.render_events:
+                    self.render_events.emit(
+                        "animation_finished", index=index,
+                        seconds=round(self.render_estimate.durations.get(index, 0), 3), progress=progress
+                    )
+            else:
+                progress = int((self.completed_animations / max(1, self.animation_count)) * 100)
             self.last_progress = progress
             self.animation_counter.setText(f"Animations: {self.completed_animations}/{self.animation_count}")
             self.progress_bar.setValue(progress)
@@ -1665,8 +4564,22 @@ class ManimGUI(QWidget):
                 anim_num = int(anim_part) if anim_part.isdigit() else self.completed_animations
                 percent_part = line.split("%")[0].split(":")[-1].strip()
                 anim_progress = float(percent_part)
+                frames = re.search(r"\|\s*\d+/(\d+)", line)
                 
-                if self.animation_count > 0:
+                if self.render_estimate:
+                    self.render_estimate.animation_progress(
+                        anim_num, anim_progress, int(frames.group(1)) if frames else None
+                    )
+                    self.last_progress = int(self.render_estimate.progress() * 100)
+                    self.progress_bar.setValue(self.last_progress)
+                    # Progress bars redraw many times a second; record every 10%
+                    if self.render_events and self.last_progress // 10 != self.render_events_percent // 10:
+                        self.render_events_percent = self.last_progress
+                        self.render_events.emit(
+                            "progress", animation=anim_num, animation_percent=anim_progress,
+                            frames=int(frames.group(1)) if frames else None, progress=self.last_progress
+                        )
+                elif self.animation_count > 0:
                     anim_weight = 100 / self.animation_count
                     base_progress = anim_num * anim_weight
                     current_anim_progress = (anim_progress / 100) * anim_weight
@@ -1677,22 +4590,39 @@ class ManimGUI(QWidget):
                 pass
         
         elif "File ready at" in line:
-            match = re.search(r"File ready at:\s*(.*\\.(mp4|png|svg))", line)
+            match = re.search(r"File ready at:?\s*'?(.*?\.(mp4|mov|webm|gif|png|svg))", line)
             if match:
                 # Manim gives a relative path, make it absolute
                 relative_path = match.group(1).strip()
                 self.last_output_path = os.path.join(self.project_path, relative_path)
                 self.last_output_dir = os.path.dirname(self.last_output_path)
                 self.append_to_log(f"🎥 Output available at: {self.last_output_path}", "info")
+                render_seconds = time.monotonic() - self.render_started_at if self.render_started_at else None
+                if self.render_events:
+                    self.render_events.emit("file_ready", path=os.path.abspath(self.last_output_path))
+                if self.output_index.add_output(self.project_path, self.last_output_path, render_seconds):
+                    self.media_probe.enqueue([os.path.abspath(self.last_output_path)])
 
         if "INFO" in line: self.append_to_log(line, "info")
-        elif "WARNING" in line: self.append_to_log(line, "warning")
-        elif "ERROR" in line or "Exception" in line: self.append_to_log(line, "error")
+        elif "WARNING" in line:
+            self.append_to_log(line, "warning")
+            if self.render_events: self.render_events.emit("warning", message=line.strip())
+        elif "ERROR" in line or "Exception" in line:
+            self.append_to_log(line, "error")
+            if self.render_events: self.render_events.emit("error", message=line.strip())
         else: self.append_to_log(line, "normal")
 
     def append_to_log(self, text, msg_type):
         self.log_history.append((text, msg_type))
-        self.refresh_log_display()
+        if self.log_run is not None:
+            self.log_store.append(self.log_run, text, msg_type)
+            if not self.log_flush_timer.isActive():
+                self.log_flush_timer.start(LOG_FLUSH_MS)
+        if hasattr(self, "output_log") and self._log_type_allowed(msg_type):
+            self.write_log_line(text, msg_type)
+            if self.autoscroll_checkbox.isChecked():
+                self.output_log.moveCursor(QTextCursor.MoveOperation.End)
+                self.output_log.ensureCursorVisible()
 
     def _log_type_allowed(self, msg_type):
         current_filter = self.log_level_combo.currentText() if hasattr(self, "log_level_combo") else "All Logs"
@@ -1704,38 +4634,166 @@ class ManimGUI(QWidget):
             return msg_type == "error"
         return True
 
+    def write_log_line(self, text, msg_type):
+        cursor = QTextCursor(self.output_log.document())
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        format = QTextCharFormat()
+        if msg_type == "error":
+            format.setForeground(QColor("#ff4444"))
+            format.setFontWeight(75)
+        elif msg_type == "warning":
+            format.setForeground(QColor("#ffbb33"))
+        elif msg_type == "info":
+            format.setForeground(QColor("#33b5e5"))
+        else:
+            format.setForeground(QColor("#f8f8f8"))
+
+        cursor.setCharFormat(format)
+        cursor.insertText(text + "\n")
+
     def refresh_log_display(self):
         if not hasattr(self, "output_log"):
             return
         self.output_log.clear()
-        cursor = self.output_log.textCursor()
         for text, msg_type in self.log_history:
-            if not self._log_type_allowed(msg_type):
-                continue
-            cursor.movePosition(QTextCursor.MoveOperation.End)
-            format = QTextCharFormat()
-            if msg_type == "error":
-                format.setForeground(QColor("#ff4444"))
-                format.setFontWeight(75)
-            elif msg_type == "warning":
-                format.setForeground(QColor("#ffbb33"))
-            elif msg_type == "info":
-                format.setForeground(QColor("#33b5e5"))
-            else:
-                format.setForeground(QColor("#f8f8f8"))
-
-            cursor.setCharFormat(format)
-            cursor.insertText(text + "\n")
+            if self._log_type_allowed(msg_type):
+                self.write_log_line(text, msg_type)
 
         if self.autoscroll_checkbox.isChecked():
+            self.output_log.moveCursor(QTextCursor.MoveOperation.End)
+            self.output_log.ensureCursorVisible()
+
+    def schedule_log_search(self, *_):
+        self.log_search_timer.start(LOG_SEARCH_DEBOUNCE_MS)
+
+    def run_log_search(self):
+        """Search the log store on the search thread; only the newest query's results are shown"""
+        query = self.log_search_input.text().strip()
+        self.log_search_generation += 1
+        self.log_search_pattern = highlight_pattern(query)
+        if self.log_search_pattern is None:
+            self.log_search_results.clear()
+            self.log_search_results.hide()
+            self.log_search_context.hide()
+            self.log_search_status.setText("")
+            self.output_log.setExtraSelections([])
+            return
+        # Lines still buffered for the current render must be searchable too
+        self.log_store.flush()
+        run = self.log_run if self.log_search_scope.currentText() == "This Render" else None
+        if run is None and self.log_search_scope.currentText() == "This Render":
+            self.log_search_status.setText("No render yet")
+            return
+        self.log_search_status.setText("Searching...")
+        self.log_search_worker.submit(self.log_search_generation, query, run)
+
+    def log_search_finished(self, generation, counts, hits):
+        if generation != self.log_search_generation:
+            return
+        total = sum(count for *_, count in counts)
+        shown = f", newest {len(hits)} listed" if total > len(hits) else ""
+        self.log_search_status.setText(
+            f"{total} match(es) in {len(counts)} render(s){shown}" if total else "No matches"
+        )
+        runs = {run: (scene, started_at, count) for run, scene, started_at, count in counts}
+        self.log_search_results.clear()
+        colors = {"error": "#ff4444", "warning": "#ffbb33", "info": "#33b5e5"}
+        current_run = None
+        for line_id, run, seq, kind, text in hits:
+            if run != current_run:
+                current_run = run
+                scene, started_at, count = runs.get(run, ("?", 0, 0))
+                header = QListWidgetItem(
+                    f"🎬 {scene or '?'} · {datetime.fromtimestamp(started_at).strftime('%Y-%m-%d %H:%M')} · {count} match(es)"
+                )
+                header.setFlags(Qt.ItemFlag.NoItemFlags)
+                self.log_search_results.addItem(header)
+            item = QListWidgetItem(f"    {seq + 1}: {text[:300]}")
+            item.setData(Qt.ItemDataRole.UserRole, line_id)
+            item.setData(Qt.ItemDataRole.UserRole + 1, run)
+            item.setToolTip(text[:2000])
+            if kind in colors:
+                item.setForeground(QColor(colors[kind]))
+            self.log_search_results.addItem(item)
+        self.log_search_results.setVisible(bool(hits))
+        self.log_search_context.setVisible(False)
+        self.highlight_log_matches()
+
+    def highlight_log_matches(self):
+        """Mark the query's matches among the lines the log view still shows"""
+        selections = []
+        if self.log_search_pattern is not None:
+            block = self.output_log.document().firstBlock()
+            while block.isValid() and len(selections) < 2000:
+                for match in self.log_search_pattern.finditer(block.text()):
+                    selection = QTextEdit.ExtraSelection()
+                    selection.format.setBackground(QColor("#665c00"))
+                    cursor = QTextCursor(block)
+                    cursor.setPosition(block.position() + match.start())
+                    cursor.setPosition(block.position() + match.end(), QTextCursor.MoveMode.KeepAnchor)
+                    selection.cursor = cursor
+                    selections.append(selection)
+                block = block.next()
+        self.output_log.setExtraSelections(selections)
+
+    def step_log_hit(self, step):
+        """Move to the next (step 1) or previous (step -1) match, wrapping around"""
+        results = self.log_search_results
+        rows = [row for row in range(results.count()) if results.item(row).data(Qt.ItemDataRole.UserRole) is not None]
+        if not rows:
+            return
+        current = results.currentRow()
+        if step > 0:
+            row = next((r for r in rows if r > current), rows[0])
+        else:
+            row = next((r for r in reversed(rows) if r < current), rows[-1])
+        results.setCurrentRow(row)
+
+    def show_log_hit(self, item, _previous=None):
+        """Show a match with the lines around it, and select it in the log view if it is still there"""
+        if item is None or item.data(Qt.ItemDataRole.UserRole) is None:
+            return
+        line_id = item.data(Qt.ItemDataRole.UserRole)
+        try:
+            context = self.log_store.context(line_id, radius=5)
+        except sqlite3.Error:
+            return
+        html = []
+        for other_id, seq, kind, text in context:
+            escaped, last = "", 0
+            for match in (self.log_search_pattern.finditer(text) if self.log_search_pattern else ()):
+                escaped += html_escape(text[last:match.start()])
+                escaped += f'<span style="background:#665c00">{html_escape(match.group(0))}</span>'
+                last = match.end()
+            escaped += html_escape(text[last:])
+            weight = "font-weight:bold;" if other_id == line_id else "color:#999;"
+            html.append(f'<div style="{weight}white-space:pre">{seq + 1:>6}  {escaped}</div>')
+        self.log_search_context.setHtml("".join(html))
+        self.log_search_context.show()
+
+        if item.data(Qt.ItemDataRole.UserRole + 1) != self.log_run:
+            return
+        text = next((text for other_id, _, _, text in context if other_id == line_id), None)
+        if not text:
+            return
+        document = self.output_log.document()
+        found = document.find(text, document.characterCount(), QTextDocument.FindFlag.FindBackward)
+        if not found.isNull():
+            self.autoscroll_checkbox.setChecked(False)
+            self.output_log.setTextCursor(found)
             self.output_log.ensureCursorVisible()
 
     def update_progress(self):
         self.progress_bar.setValue(self.last_progress)
+        if self.render_record and self.render_process:
+            rss = peak_rss_bytes(self.render_process.processId())
+            if rss:
+                self.render_record["peak_rss"] = max(rss, self.render_record["peak_rss"] or 0)
+        if self.render_estimate:
+            self.eta_label.setText(format_eta(self.render_estimate.remaining_seconds()))
 
     def render_finished(self, exit_code, exit_status):
         self.status_timer.stop()
-        self.render_controls_widget.setEnabled(True)
         
         if exit_code == 0:
             self.append_to_log("✅ Render completed successfully!", "info")
@@ -1744,19 +4802,93 @@ class ManimGUI(QWidget):
                 self.open_output_btn.setEnabled(True)
                 self.open_output_folder_btn.setEnabled(True)
             self.animation_counter.setText(f"Animations: {self.animation_count}/{self.animation_count}")
-        else:
+            if self.render_estimate and self.render_timing_key:
+                durations, frames = self.render_estimate.timings()
+                if durations:
+                    scene_key, quality, source_hash = self.render_timing_key
+                    self.render_timings.save(scene_key, quality, source_hash, durations, frames)
+        elif not (self.render_job and self.render_job.get("stopped")):
             self.append_to_log(f"❌ Render failed with exit code {exit_code}", "error")
             self.progress_bar.setStyleSheet("QProgressBar::chunk { background-color: #ff4444; }")
         
+        if self.render_events:
+            durations = self.render_estimate.timings()[0] if self.render_estimate else []
+            self.render_events.emit(
+                "finish", exit_code=exit_code, crashed=exit_status == QProcess.ExitStatus.CrashExit,
+                wall_seconds=round(time.monotonic() - self.render_started_at, 3),
+                animation_seconds=[round(d, 3) if d is not None else None for d in durations],
+                output=os.path.abspath(self.last_output_path) if self.last_output_path else None
+            )
+            self.render_events.close()
+            self.render_events = None
+        if self.render_record:
+            record = self.render_record
+            self.render_record = None
+            self.history_writer.submit(
+                record["project"], record["file"], record["scene"], record["quality"], record["flags"],
+                time.monotonic() - self.render_started_at, exit_code,
+                started_at=record["started_at"], peak_rss=record["peak_rss"],
+                output_path=self.last_output_path or None
+            )
+
         self.render_process = None
+        self.render_estimate = None
+        self.eta_label.setText(format_eta(None))
+        if self.render_stop:
+            self.finish_stop(self.render_stop)
+        if self.render_stop is None:
+            self.start_next_render()
 
     def stop_rendering(self):
-        if self.render_process and self.render_process.state() == QProcess.ProcessState.Running:
-            self.render_process.terminate()
-            self.append_to_log("🛑 Render process stopped by user", "warning")
-            self.progress_bar.setValue(0)
-            self.status_timer.stop()
-            self.render_controls_widget.setEnabled(True)
+        """Stop the running render and drop the queued ones"""
+        if self.render_queue:
+            self.append_to_log(f"🗑️ Dropped {len(self.render_queue)} queued render(s)", "warning")
+            self.render_queue.clear()
+        self.stop_render_tree()
+        self.update_render_button()
+
+    def stop_render_tree(self, replaced=False):
+        """Ask the render's whole process tree to exit; kill what is left after a grace period"""
+        if self.render_stop or not self.render_process or self.render_process.state() != QProcess.ProcessState.Running:
+            return
+        pid = self.render_process.processId()
+        record = self.render_record or {}
+        stop = self.render_stop = {
+            "pid": pid, "tree": descendants(pid),
+            "scene": record.get("scene"), "since": record.get("started_at", time.time()), "replaced": replaced,
+        }
+        signal_tree(pid, stop["tree"])
+        if self.render_job:
+            self.render_job["stopped"] = True
+        self.append_to_log(f"🛑 Stopping render ({len(stop['tree']) + 1} process(es))...", "warning")
+        if self.render_events:
+            self.render_events.emit("stopped")
+        self.progress_bar.setValue(0)
+        self.status_timer.stop()
+        QTimer.singleShot(int(STOP_GRACE_SECONDS * 1000), lambda: self.finish_stop(stop, force=True))
+
+    def finish_stop(self, stop, force=False):
+        """Once the stopped render's processes are gone (or killed, with force), clean up after them"""
+        if stop is not self.render_stop:
+            return
+        survivors = [pid for pid in [stop["pid"]] + stop["tree"] if pid_alive(pid)]
+        if survivors and not force:
+            return
+        if survivors:
+            signal_tree(stop["pid"], stop["tree"], force=True)
+            self.append_to_log(f"💀 Killed {len(survivors)} process(es) that ignored the stop request", "warning")
+        self.render_stop = None
+        if stop["scene"] and self.project_path:
+            removed = remove_partial_outputs(os.path.join(self.project_path, "media"), stop["scene"], stop["since"])
+            if removed:
+                self.append_to_log(f"🧹 Removed {len(removed)} partial file(s) left by the stopped render", "info")
+        if stop["replaced"]:
+            self.append_to_log("🔁 Stale render stopped", "info")
+        else:
+            self.append_to_log("🛑 Render stopped by user", "warning")
+        # The next render starts once the old QProcess has reported finishing
+        if self.render_process is None:
+            self.start_next_render()
 
     def open_last_output(self):
         if self.last_output_path and os.path.exists(self.last_output_path):
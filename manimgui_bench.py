@@ -0,0 +1,239 @@
+"""Render one scene under a matrix of renderer, caching and fps settings and compare timings.
+
+    python manimgui_bench.py scene.py MyScene --renderers cairo,opengl \\
+        --caching on,off --fps 15,30 --repeat 3 --quality l
+
+Runs are sequential so they don't compete for the CPU. Every configuration
+gets its own media folder, so with caching on the later repetitions measure
+manim's partial-movie cache. OpenGL needs a display: on a headless Linux box
+it runs under xvfb-run when that is installed and is reported as skipped
+otherwise. Cairo always works headless.
+"""
+import argparse
+import itertools
+import json
+import os
+import shlex
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+from manimgui_process import process_group_kwargs, stop_process_tree
+
+RENDERERS = ("cairo", "opengl")
+QUALITY_FLAGS = {"l": "-ql", "m": "-qm", "h": "-qh", "p": "-qp", "k": "-qk"}
+
+
+def has_display():
+    if sys.platform != "linux":
+        return True
+    return bool(os.environ.get("DISPLAY") or os.environ.get("WAYLAND_DISPLAY"))
+
+
+def build_matrix(renderers=RENDERERS, caching=(True, False), fps_values=(15, 30)):
+    """Every (renderer, caching, fps) combination as a dict."""
+    return [
+        {"renderer": renderer, "caching": cache, "fps": fps}
+        for renderer, cache, fps in itertools.product(renderers, caching, fps_values)
+    ]
+
+
+def config_label(config):
+    return f"{config['renderer']} · {'cache' if config['caching'] else 'no cache'} · {config['fps']} fps"
+
+
+def bench_command(file_path, scene, config, quality_flag, media_dir, manim_cmd=("manim",)):
+    """Command for one run, or None when it can't run on this machine."""
+    cmd = list(manim_cmd) + [
+        quality_flag, "--renderer", config["renderer"], "--fps", str(config["fps"]),
+        "--media_dir", media_dir, "--progress_bar", "none",
+    ]
+    if not config["caching"]:
+        cmd.append("--disable_caching")
+    if config["renderer"] == "opengl":
+        cmd.append("--write_to_movie")
+        if not has_display():
+            if not shutil.which("xvfb-run"):
+                return None
+            cmd = ["xvfb-run", "-a"] + cmd
+    return cmd + [str(file_path), scene]
+
+
+def newest_output(media_dir):
+    newest, newest_mtime = None, 0
+    for root, dirnames, filenames in os.walk(media_dir):
+        dirnames[:] = [d for d in dirnames if d not in ("partial_movie_files", "Tex", "texts")]
+        for name in filenames:
+            if name.endswith((".mp4", ".mov", ".webm", ".gif")):
+                path = os.path.join(root, name)
+                mtime = os.path.getmtime(path)
+                if mtime > newest_mtime:
+                    newest, newest_mtime = path, mtime
+    return newest
+
+
+def count_frames(path):
+    """Frames in a video via ffprobe, or None without it."""
+    if not path or not shutil.which("ffprobe"):
+        return None
+    try:
+        result = subprocess.run(
+            ["ffprobe", "-v", "error", "-select_streams", "v:0", "-count_packets",
+             "-show_entries", "stream=nb_read_packets", "-of", "csv=p=0", path],
+            capture_output=True, text=True, timeout=60,
+        )
+        return int(result.stdout.strip())
+    except (OSError, subprocess.SubprocessError, ValueError):
+        return None
+
+
+def _stop_when(process, should_stop):
+    """Stop the run's process tree as soon as should_stop() is true, even if manim prints nothing."""
+    while process.poll() is None:
+        if should_stop():
+            stop_process_tree(process)
+            return
+        time.sleep(0.2)
+
+
+def run_once(file_path, scene, config, quality_flag, media_dir, cwd, manim_cmd=("manim",), should_stop=None):
+    cmd = bench_command(file_path, scene, config, quality_flag, media_dir, manim_cmd)
+    if cmd is None:
+        return {"skipped": "no display and xvfb-run is not installed"}
+    started = time.perf_counter()
+    try:
+        process = subprocess.Popen(cmd, cwd=cwd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True,
+                                   errors="replace", **process_group_kwargs())
+    except OSError as e:
+        return {"skipped": str(e)}
+    if should_stop:
+        threading.Thread(target=_stop_when, args=(process, should_stop), daemon=True).start()
+    output = list(process.stdout)
+    exit_code = process.wait()
+    wall = time.perf_counter() - started
+    video = newest_output(media_dir) if exit_code == 0 else None
+    frames = count_frames(video)
+    return {
+        "exit_code": exit_code,
+        "wall_seconds": wall,
+        "frames": frames,
+        "render_fps": frames / wall if frames and wall > 0 else None,
+        "output_size": os.path.getsize(video) if video else None,
+        "tail": "".join(output[-20:]) if exit_code else "",
+    }
+
+
+def run_benchmark(file_path, scene, configs, repetitions=3, quality_flag="-ql", manim_cmd=("manim",),
+                  on_result=None, should_stop=None):
+    """Run every configuration `repetitions` times; returns the list of run results."""
+    results = []
+    cwd = os.path.dirname(os.path.abspath(file_path))
+    root = tempfile.mkdtemp(prefix="manimgui-bench-")
+    try:
+        for index, config in enumerate(configs):
+            media_dir = os.path.join(root, f"config{index}")
+            for repetition in range(repetitions):
+                if should_stop and should_stop():
+                    return results
+                result = run_once(file_path, scene, config, quality_flag, media_dir, cwd, manim_cmd, should_stop)
+                result.update(config=config, repetition=repetition)
+                results.append(result)
+                if on_result:
+                    on_result(result)
+                if "skipped" in result:
+                    break
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+    return results
+
+
+def summarize(results):
+    """One row per configuration, fastest median wall time first."""
+    rows = {}
+    for result in results:
+        key = config_label(result["config"])
+        row = rows.setdefault(key, {"config": key, "runs": 0, "failed": 0, "walls": [], "fps": [], "size": None,
+                                    "skipped": None})
+        if "skipped" in result:
+            row["skipped"] = result["skipped"]
+            continue
+        row["runs"] += 1
+        if result["exit_code"] != 0:
+            row["failed"] += 1
+            continue
+        row["walls"].append(result["wall_seconds"])
+        if result["render_fps"]:
+            row["fps"].append(result["render_fps"])
+        row["size"] = result["output_size"] or row["size"]
+    summary = []
+    for row in rows.values():
+        walls = row.pop("walls")
+        fps = row.pop("fps")
+        row["median_seconds"] = statistics.median(walls) if walls else None
+        row["best_seconds"] = min(walls) if walls else None
+        row["render_fps"] = statistics.median(fps) if fps else None
+        summary.append(row)
+    summary.sort(key=lambda r: (r["median_seconds"] is None, r["median_seconds"] or 0))
+    return summary
+
+
+def format_summary(summary):
+    lines = [f"{'configuration':<32} {'median':>8} {'best':>8} {'fps':>7} {'size':>9}  runs"]
+    for row in summary:
+        if row["skipped"]:
+            lines.append(f"{row['config']:<32} skipped: {row['skipped']}")
+            continue
+        median = f"{row['median_seconds']:.2f}s" if row["median_seconds"] is not None else "-"
+        best = f"{row['best_seconds']:.2f}s" if row["best_seconds"] is not None else "-"
+        fps = f"{row['render_fps']:.1f}" if row["render_fps"] else "-"
+        size = f"{row['size'] / 2**20:.1f} MB" if row["size"] else "-"
+        failed = f" ({row['failed']} failed)" if row["failed"] else ""
+        lines.append(f"{row['config']:<32} {median:>8} {best:>8} {fps:>7} {size:>9}  {row['runs']}{failed}")
+    return "\n".join(lines)
+
+
+def _csv(value):
+    return [item.strip() for item in value.split(",") if item.strip()]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark manim renderer, caching and fps settings for a scene")
+    parser.add_argument("file")
+    parser.add_argument("scene")
+    parser.add_argument("--renderers", default="cairo", help="comma-separated: cairo,opengl")
+    parser.add_argument("--caching", default="on,off", help="comma-separated: on,off")
+    parser.add_argument("--fps", default="15,30", help="comma-separated frame rates")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--quality", choices=sorted(QUALITY_FLAGS), default="l")
+    parser.add_argument("--manim", default="manim", help="command used to run manim")
+    parser.add_argument("--json", action="store_true", help="print raw results as JSON")
+    args = parser.parse_args(argv)
+
+    configs = build_matrix(
+        [r for r in _csv(args.renderers) if r in RENDERERS],
+        [c == "on" for c in _csv(args.caching)],
+        [int(f) for f in _csv(args.fps)],
+    )
+
+    def progress(result):
+        if "skipped" in result:
+            status = f"skipped ({result['skipped']})"
+        else:
+            status = f"{result['wall_seconds']:.2f}s, exit {result['exit_code']}"
+        print(f"  {config_label(result['config'])} #{result['repetition'] + 1}: {status}", file=sys.stderr, flush=True)
+
+    results = run_benchmark(args.file, args.scene, configs, args.repeat, QUALITY_FLAGS[args.quality],
+                            shlex.split(args.manim), on_result=progress)
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print(format_summary(summarize(results)))
+    return 0 if any(r.get("exit_code") == 0 for r in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,222 @@
+"""Render history shared by the desktop and web apps, with a regression report.
+
+Every finished render is stored in a local SQLite database. The report lists
+renders that took longer than the previous successful render of the same
+scene (same project and file) and quality by more than a threshold:
+
+    python manimgui_history.py report --threshold 20
+    python manimgui_history.py list --scene MyScene
+
+`report` exits with status 1 when it finds regressions, so it can gate a batch.
+"""
+import argparse
+import hashlib
+import os
+import sqlite3
+import subprocess
+import sys
+import threading
+import time
+
+DEFAULT_THRESHOLD_PERCENT = 20.0
+# Renders shorter than this are mostly startup noise
+MIN_BASELINE_SECONDS = 2.0
+
+_manim_version = None
+
+
+def default_db_path():
+    """Per-user data folder, overridable with $MANIMGUI_HISTORY_DB."""
+    if os.environ.get("MANIMGUI_HISTORY_DB"):
+        return os.environ["MANIMGUI_HISTORY_DB"]
+    if sys.platform == "win32":
+        root = os.environ.get("APPDATA", os.path.expanduser("~"))
+    elif sys.platform == "darwin":
+        root = os.path.expanduser("~/Library/Application Support")
+    else:
+        root = os.environ.get("XDG_DATA_HOME", os.path.expanduser("~/.local/share"))
+    return os.path.join(root, "ManimGUI", "render_history.sqlite")
+
+
+def file_hash(path):
+    try:
+        with open(path, "rb") as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except OSError:
+        return None
+
+
+def git_commit(directory):
+    """HEAD of the repository containing directory, or None."""
+    try:
+        result = subprocess.run(
+            ["git", "-C", str(directory), "rev-parse", "HEAD"],
+            capture_output=True, text=True, timeout=5,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    if result.returncode != 0:
+        return None
+    return result.stdout.strip() or None
+
+
+def manim_version():
+    global _manim_version
+    if _manim_version is None:
+        try:
+            from importlib.metadata import PackageNotFoundError, version
+            _manim_version = version("manim")
+        except (ImportError, PackageNotFoundError):
+            _manim_version = ""
+    return _manim_version or None
+
+
+def peak_rss_bytes(pid):
+    """Peak resident memory of a running process, or None when it can't be read."""
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) * 1024
+    except (OSError, ValueError):
+        pass
+    try:
+        import psutil
+    except ImportError:
+        return None
+    try:
+        memory = psutil.Process(pid).memory_info()
+    except psutil.Error:
+        return None
+    return getattr(memory, "peak_wset", None) or memory.rss
+
+
+class RenderHistory:
+    """Finished renders; one instance may be shared between threads (the web app does)."""
+
+    def __init__(self, db_path=None):
+        self.db_path = db_path or default_db_path()
+        self.lock = threading.Lock()
+        os.makedirs(os.path.dirname(self.db_path) or ".", exist_ok=True)
+        self.db = sqlite3.connect(self.db_path, check_same_thread=False)
+        self.db.executescript("""
+            CREATE TABLE IF NOT EXISTS renders (
+                id INTEGER PRIMARY KEY,
+                started_at REAL NOT NULL,
+                project TEXT,
+                file TEXT,
+                scene TEXT NOT NULL,
+                file_hash TEXT,
+                git_commit TEXT,
+                quality TEXT,
+                flags TEXT,
+                manim_version TEXT,
+                wall_seconds REAL,
+                peak_rss INTEGER,
+                exit_code INTEGER,
+                output_path TEXT,
+                output_size INTEGER
+            );
+            CREATE INDEX IF NOT EXISTS renders_scene ON renders(scene, quality, started_at);
+            CREATE INDEX IF NOT EXISTS renders_target ON renders(project, file, scene, quality, started_at);
+        """)
+
+    def record(self, project, file, scene, quality, flags, wall_seconds, exit_code,
+               started_at=None, peak_rss=None, output_path=None):
+        output_size = None
+        if output_path:
+            try:
+                output_size = os.path.getsize(output_path)
+            except OSError:
+                pass
+        row = (started_at or time.time() - wall_seconds, project, file, scene, file_hash(file),
+               git_commit(project) if project else None, quality, " ".join(flags), manim_version(),
+               wall_seconds, peak_rss, exit_code, output_path, output_size)
+        with self.lock, self.db:
+            self.db.execute(
+                "INSERT INTO renders (started_at, project, file, scene, file_hash, git_commit, quality, flags,"
+                " manim_version, wall_seconds, peak_rss, exit_code, output_path, output_size)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", row
+            )
+
+    def renders(self, scene=None, limit=100):
+        query = (
+            "SELECT started_at, scene, quality, wall_seconds, peak_rss, exit_code, output_size,"
+            " git_commit, file_hash, manim_version, flags FROM renders"
+        )
+        params = []
+        if scene:
+            query += " WHERE scene=?"
+            params.append(scene)
+        query += " ORDER BY started_at DESC LIMIT ?"
+        params.append(limit)
+        with self.lock:
+            return self.db.execute(query, params).fetchall()
+
+    def regressions(self, threshold_percent=DEFAULT_THRESHOLD_PERCENT, scene=None):
+        """Successful renders slower than the previous successful one of the same scene and quality.
+
+        Scenes are told apart by project and file too, so two projects that
+        both have a MainScene are never compared with each other.
+
+        Rows are (started_at, scene, quality, wall_seconds, baseline_seconds,
+        percent_slower, git_commit, baseline_commit), newest first.
+        """
+        with self.lock:
+            rows = self.db.execute("""
+                SELECT started_at, scene, quality, wall_seconds, baseline, git_commit, baseline_commit FROM (
+                    SELECT started_at, scene, quality, wall_seconds, git_commit,
+                           LAG(wall_seconds) OVER w AS baseline,
+                           LAG(git_commit) OVER w AS baseline_commit
+                    FROM renders
+                    WHERE exit_code = 0 AND (? IS NULL OR scene = ?)
+                    WINDOW w AS (PARTITION BY project, file, scene, quality ORDER BY started_at)
+                )
+                WHERE baseline >= ? AND wall_seconds > baseline * (1 + ? / 100.0)
+                ORDER BY started_at DESC
+            """, (scene, scene, MIN_BASELINE_SECONDS, threshold_percent)).fetchall()
+        return [
+            (started_at, scene_name, quality, wall, baseline, (wall / baseline - 1) * 100, commit, baseline_commit)
+            for started_at, scene_name, quality, wall, baseline, commit, baseline_commit in rows
+        ]
+
+
+def _format_time(timestamp):
+    return time.strftime("%Y-%m-%d %H:%M", time.localtime(timestamp))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="ManimGUI render history")
+    parser.add_argument("--db", default=None, help="history database (default: per-user data folder)")
+    commands = parser.add_subparsers(dest="command", required=True)
+    report = commands.add_parser("report", help="renders that got slower than their previous baseline")
+    report.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD_PERCENT,
+                        help="percent slower that counts as a regression (default: %(default)s)")
+    report.add_argument("--scene")
+    listing = commands.add_parser("list", help="most recent renders")
+    listing.add_argument("--scene")
+    listing.add_argument("--limit", type=int, default=20)
+    args = parser.parse_args(argv)
+
+    history = RenderHistory(args.db)
+    if args.command == "list":
+        for started_at, scene, quality, wall, rss, exit_code, size, commit, *_ in history.renders(args.scene, args.limit):
+            rss_text = f"{rss / 2**20:.0f} MB" if rss else "-"
+            print(f"{_format_time(started_at)}  {scene:<24} {quality or '-':<18} {wall:8.1f}s  "
+                  f"rss {rss_text:>8}  exit {exit_code}  {(commit or '')[:8]}")
+        return 0
+
+    regressions = history.regressions(args.threshold, args.scene)
+    if not regressions:
+        print(f"No renders regressed by more than {args.threshold:g}%.")
+        return 0
+    print(f"{len(regressions)} render(s) regressed by more than {args.threshold:g}%:")
+    for started_at, scene, quality, wall, baseline, percent, commit, baseline_commit in regressions:
+        commits = f"  {(baseline_commit or '?')[:8]} -> {(commit or '?')[:8]}" if commit or baseline_commit else ""
+        print(f"{_format_time(started_at)}  {scene:<24} {quality or '-':<18} "
+              f"{baseline:7.1f}s -> {wall:7.1f}s  (+{percent:.0f}%){commits}")
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
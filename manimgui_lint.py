@@ -0,0 +1,201 @@
+"""Fast static checks on scene source, shared by the desktop and web apps.
+
+lint_source() reports syntax errors, undefined names and unused imports. It
+uses pyflakes when installed and otherwise falls back to a simpler AST pass.
+Names that come from `from manim import *` are only recognised when the
+caller passes the manim symbol names as star_names.
+"""
+import ast
+import builtins
+import difflib
+import importlib.util
+import os
+
+try:
+    from pyflakes import checker as pyflakes_checker
+except ImportError:
+    pyflakes_checker = None
+
+# pyflakes message classes that mean "this name may not exist"
+UNDEFINED_MESSAGES = {"UndefinedName", "UndefinedLocal", "UndefinedExport"}
+MODULE_NAMES = {"__name__", "__file__", "__doc__", "__builtins__", "__spec__", "__loader__", "__package__"}
+
+
+def diagnostic(line, col, severity, message):
+    return {"line": line, "col": max(col, 0), "severity": severity, "message": message}
+
+
+def syntax_diagnostic(error):
+    return diagnostic(error.lineno or 1, (error.offset or 1) - 1, "error", f"SyntaxError: {error.msg}")
+
+
+def parse_source(source, filename="<editor>"):
+    """(tree, None) or (None, syntax error diagnostic)."""
+    try:
+        # compile() also catches errors ast.parse lets through, e.g. 'return' outside a function
+        compile(source, filename, "exec", dont_inherit=True)
+        return ast.parse(source, filename), None
+    except SyntaxError as e:
+        return None, syntax_diagnostic(e)
+    except ValueError as e:
+        # Null bytes in the source
+        return None, diagnostic(1, 0, "error", str(e))
+
+
+def star_imports(tree):
+    return [node.module or "" for node in ast.walk(tree)
+            if isinstance(node, ast.ImportFrom) and any(alias.name == "*" for alias in node.names)]
+
+
+def known_star_names(tree, star_names):
+    """Names provided by the file's star imports, or None if some can't be known."""
+    modules = star_imports(tree)
+    if not modules:
+        return frozenset()
+    if star_names and all(module == "manim" for module in modules):
+        return frozenset(star_names)
+    return None
+
+
+def _pyflakes_checks(tree, filename, star):
+    results = []
+    for message in pyflakes_checker.Checker(tree, filename=filename).messages:
+        kind = type(message).__name__
+        text = message.message % message.message_args
+        if kind == "ImportStarUsed":
+            continue
+        if kind == "ImportStarUsage":
+            name = message.message_args[0]
+            if star is None or name in star:
+                continue
+            kind, text = "UndefinedName", f"undefined name '{name}'"
+        severity = "error" if kind in UNDEFINED_MESSAGES else "warning"
+        results.append(diagnostic(message.lineno, getattr(message, "col", 0), severity, text))
+    return results
+
+
+def _ast_checks(tree, star):
+    """Flat, whole-module approximation of pyflakes' undefined-name and unused-import checks."""
+    imported = {}
+    bound = set(dir(builtins)) | MODULE_NAMES
+    used = {}
+    exported = set()
+    for node in ast.walk(tree):
+        if isinstance(node, (ast.Import, ast.ImportFrom)):
+            if isinstance(node, ast.ImportFrom) and node.module == "__future__":
+                continue
+            for alias in node.names:
+                if alias.name == "*":
+                    continue
+                name = alias.asname or alias.name.split(".")[0]
+                imported.setdefault(name, node)
+                bound.add(name)
+        elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            bound.add(node.name)
+        elif isinstance(node, ast.arg):
+            bound.add(node.arg)
+        elif isinstance(node, ast.Name):
+            if isinstance(node.ctx, ast.Load):
+                used.setdefault(node.id, node)
+            else:
+                bound.add(node.id)
+        elif isinstance(node, ast.ExceptHandler) and node.name:
+            bound.add(node.name)
+        elif isinstance(node, (ast.Global, ast.Nonlocal)):
+            bound.update(node.names)
+        elif hasattr(ast, "MatchAs") and isinstance(node, (ast.MatchAs, ast.MatchStar)) and node.name:
+            bound.add(node.name)
+        elif isinstance(node, ast.Assign) and any(isinstance(t, ast.Name) and t.id == "__all__" for t in node.targets):
+            if isinstance(node.value, (ast.List, ast.Tuple)):
+                exported.update(e.value for e in node.value.elts if isinstance(e, ast.Constant))
+
+    results = []
+    for name, node in imported.items():
+        if name not in used and name not in exported:
+            results.append(diagnostic(node.lineno, node.col_offset, "warning", f"'{name}' imported but unused"))
+    if star is not None:
+        for name, node in used.items():
+            if name not in bound and name not in star:
+                results.append(diagnostic(node.lineno, node.col_offset, "error", f"undefined name '{name}'"))
+    return results
+
+
+def lint_source(source, filename="<editor>", star_names=()):
+    """Diagnostics as dicts with line (1-based), col (0-based), severity and message."""
+    tree, error = parse_source(source, filename)
+    if error:
+        return [error]
+    return lint_tree(tree, filename, known_star_names(tree, star_names))
+
+
+def lint_tree(tree, filename, star):
+    if pyflakes_checker is not None:
+        results = _pyflakes_checks(tree, filename, star)
+    else:
+        results = _ast_checks(tree, star)
+    return sorted(results, key=lambda d: (d["line"], d["col"]))
+
+
+def missing_modules(tree, search_paths=()):
+    """(node, module) for top-level absolute imports that resolve neither locally nor on sys.path.
+
+    Only meaningful when this interpreter is the one manim renders with, so
+    nothing is reported when manim itself can't be found here.
+    """
+    if importlib.util.find_spec("manim") is None:
+        return []
+    missing = []
+    seen = set()
+    for node in tree.body:
+        if isinstance(node, ast.Import):
+            modules = [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom) and node.level == 0 and node.module:
+            modules = [node.module]
+        else:
+            continue
+        for module in modules:
+            top = module.split(".")[0]
+            if top in seen:
+                continue
+            seen.add(top)
+            if any(os.path.exists(os.path.join(path, top + ".py")) or os.path.isdir(os.path.join(path, top))
+                   for path in search_paths):
+                continue
+            try:
+                found = importlib.util.find_spec(top) is not None
+            except (ImportError, ValueError):
+                found = False
+            if not found:
+                missing.append((node, top))
+    return missing
+
+
+def preflight(source, scene_class, filename="<editor>", star_names=(), search_paths=()):
+    """First reason this file can't render scene_class, as a diagnostic, or None.
+
+    Cheap enough to run before every render: it compiles the source, checks
+    the scene class is defined at module level, that imported modules exist
+    and, when star imports can be resolved, that no name is undefined.
+    """
+    tree, error = parse_source(source, filename)
+    if error:
+        return error
+
+    classes = [node for node in tree.body if isinstance(node, ast.ClassDef)]
+    if scene_class not in {node.name for node in classes}:
+        close = difflib.get_close_matches(scene_class, [node.name for node in classes], n=1)
+        hint = f" Did you mean '{close[0]}'?" if close else ""
+        line = classes[0].lineno if classes else 1
+        return diagnostic(line, 0, "error", f"Scene class '{scene_class}' is not defined in this file.{hint}")
+
+    for node, module in missing_modules(tree, search_paths):
+        return diagnostic(node.lineno, node.col_offset, "error", f"No module named '{module}'")
+
+    star = known_star_names(tree, star_names)
+    if star is not None:
+        if not star_imports(tree) and not any(isinstance(n, (ast.Import, ast.ImportFrom)) for n in tree.body):
+            return diagnostic(1, 0, "error", "Nothing is imported; add 'from manim import *'")
+        for item in lint_tree(tree, filename, star):
+            if item["severity"] == "error":
+                return item
+    return None
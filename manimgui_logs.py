@@ -0,0 +1,255 @@
+"""Searchable store of render log lines, shared by the desktop and web apps.
+
+Every line of every render is kept in SQLite and indexed as it is written,
+so a search reads only the index entries for the query's words instead of
+scanning the log, and still finds lines the log view has already trimmed.
+The index is an FTS5 table; SQLite builds without FTS5 get a plain
+word -> line table instead.
+
+A query matches lines containing every word, each as a prefix:
+
+    python manimgui_logs.py search "latex err" --limit 20
+"""
+import argparse
+import os
+import re
+import sqlite3
+import sys
+import threading
+import time
+
+from manimgui_history import default_db_path as history_db_path
+
+# Older renders are dropped when a store is opened and as new ones start
+KEEP_RUNS = 500
+# A line's id is (run << RUN_SHIFT) | seq, so the index alone knows which run
+# a hit belongs to and a run is one contiguous id range
+RUN_SHIFT = 32
+WORD_RE = re.compile(r"\w+")
+
+
+def default_db_path():
+    """Next to the render history, overridable with $MANIMGUI_LOG_DB."""
+    if os.environ.get("MANIMGUI_LOG_DB"):
+        return os.environ["MANIMGUI_LOG_DB"]
+    return os.path.join(os.path.dirname(history_db_path()), "render_logs.sqlite")
+
+
+def query_words(query):
+    return [word.lower() for word in WORD_RE.findall(query or "")]
+
+
+def highlight_pattern(query):
+    """Regex matching what a query matches inside a line, or None for an empty query."""
+    words = query_words(query)
+    if not words:
+        return None
+    return re.compile(r"\b(?:" + "|".join(re.escape(word) for word in words) + r")\w*", re.IGNORECASE)
+
+
+def _has_fts5(db):
+    try:
+        db.execute("CREATE VIRTUAL TABLE temp.fts5_probe USING fts5(x)")
+        db.execute("DROP TABLE temp.fts5_probe")
+        return True
+    except sqlite3.OperationalError:
+        return False
+
+
+class LogStore:
+    """Log lines grouped by render run; one instance may be shared between threads.
+
+    append() only buffers; flush() writes the buffered lines and their index
+    entries in one transaction, which is what keeps appending cheap.
+    """
+
+    def __init__(self, db_path=None, keep_runs=KEEP_RUNS):
+        self.db_path = db_path or default_db_path()
+        self.keep_runs = keep_runs
+        self.lock = threading.Lock()
+        self.pending = []
+        self.next_seq = {}
+        os.makedirs(os.path.dirname(self.db_path) or ".", exist_ok=True)
+        self.db = sqlite3.connect(self.db_path, check_same_thread=False)
+        # Readers on other connections (the search thread) don't block the writer
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.executescript("""
+            CREATE TABLE IF NOT EXISTS runs (
+                id INTEGER PRIMARY KEY,
+                started_at REAL NOT NULL,
+                scene TEXT,
+                file TEXT
+            );
+            CREATE TABLE IF NOT EXISTS lines (
+                id INTEGER PRIMARY KEY,
+                kind TEXT,
+                text TEXT NOT NULL
+            );
+        """)
+        existing = {name for (name,) in self.db.execute("SELECT name FROM sqlite_master")}
+        if "line_index" in existing:
+            self.fts = True
+        elif "postings" in existing:
+            self.fts = False
+        else:
+            self.fts = _has_fts5(self.db)
+            if self.fts:
+                self.db.execute(
+                    "CREATE VIRTUAL TABLE line_index USING fts5(text, content='lines', content_rowid='id')"
+                )
+            else:
+                self.db.execute(
+                    "CREATE TABLE postings (word TEXT NOT NULL, line INTEGER NOT NULL, PRIMARY KEY (word, line))"
+                    " WITHOUT ROWID"
+                )
+            self.db.commit()
+        self.prune(keep_runs)
+
+    def start_run(self, scene=None, file=None):
+        with self.lock, self.db:
+            run = self.db.execute(
+                "INSERT INTO runs (started_at, scene, file) VALUES (?, ?, ?)", (time.time(), scene, file)
+            ).lastrowid
+        # A long-running app (the web server) would otherwise only prune on restart
+        self.prune(self.keep_runs)
+        return run
+
+    def append(self, run, text, kind="normal"):
+        with self.lock:
+            seq = self.next_seq.get(run, 0)
+            self.next_seq[run] = seq + 1
+            self.pending.append(((run << RUN_SHIFT) | seq, kind, text))
+
+    def flush(self):
+        with self.lock:
+            if not self.pending:
+                return
+            rows, self.pending = self.pending, []
+            with self.db:
+                self.db.executemany("INSERT INTO lines (id, kind, text) VALUES (?, ?, ?)", rows)
+                if self.fts:
+                    self.db.executemany(
+                        "INSERT INTO line_index (rowid, text) VALUES (?, ?)", ((line_id, text) for line_id, _, text in rows)
+                    )
+                else:
+                    self.db.executemany(
+                        "INSERT OR IGNORE INTO postings (word, line) VALUES (?, ?)",
+                        ((word, line_id) for line_id, _, text in rows for word in set(query_words(text)))
+                    )
+
+    def _matching_ids(self, words, run):
+        """SQL (and parameters) selecting, as id, the lines that match every word.
+
+        run is None for every run, a run id, or a list of run ids.
+        """
+        if self.fts:
+            match = " AND ".join('"{}"*'.format(word.replace('"', '""')) for word in words)
+            sql, params = "SELECT rowid AS id FROM line_index WHERE line_index MATCH ?", [match]
+            column = "rowid"
+        else:
+            parts, params = [], []
+            for word in words:
+                parts.append("SELECT line FROM postings WHERE word >= ? AND word < ?")
+                params += [word, word + "\U0010ffff"]
+            sql = f"SELECT line AS id FROM ({' INTERSECT '.join(parts)}) WHERE 1"
+            column = "line"
+        if run is not None:
+            runs = [run] if isinstance(run, int) else list(run)
+            if not runs:
+                sql += " AND 0"
+            else:
+                sql += " AND (" + " OR ".join(f"{column} BETWEEN ? AND ?" for _ in runs) + ")"
+                for one in runs:
+                    params += [one << RUN_SHIFT, ((one + 1) << RUN_SHIFT) - 1]
+        return sql, params, column
+
+    def search(self, query, run=None, limit=500):
+        """(per-run hit counts, newest hits) for lines matching every word of query.
+
+        run limits the search to one run id or a list of them. Counts are (run, scene, started_at, hits), newest run first; hits are
+        (line id, run, line number from 0, kind, text), newest line first, at most limit.
+        """
+        words = query_words(query)
+        if not words:
+            return [], []
+        sql, params, column = self._matching_ids(words, run)
+        with self.lock:
+            counts = self.db.execute(
+                f"SELECT r.id, r.scene, r.started_at, m.hits FROM"
+                f" (SELECT id >> {RUN_SHIFT} AS run, COUNT(*) AS hits FROM ({sql}) GROUP BY 1) AS m"
+                f" JOIN runs r ON r.id = m.run ORDER BY r.id DESC", params
+            ).fetchall()
+            # Ordering inside the index query lets FTS5 walk its doclists backwards and stop early
+            hits = self.db.execute(
+                f"SELECT l.id, l.id >> {RUN_SHIFT}, l.id & {(1 << RUN_SHIFT) - 1}, l.kind, l.text"
+                f" FROM ({sql} ORDER BY {column} DESC LIMIT ?) AS m JOIN lines l ON l.id = m.id"
+                f" ORDER BY l.id DESC", params + [limit]
+            ).fetchall()
+        return counts, hits
+
+    def context(self, line_id, radius=5):
+        """(line id, line number from 0, kind, text) for the lines around line_id in its run."""
+        run_start = line_id >> RUN_SHIFT << RUN_SHIFT
+        with self.lock:
+            return self.db.execute(
+                f"SELECT id, id & {(1 << RUN_SHIFT) - 1}, kind, text FROM lines"
+                f" WHERE id BETWEEN ? AND ? ORDER BY id",
+                (max(run_start, line_id - radius), min(run_start + (1 << RUN_SHIFT) - 1, line_id + radius))
+            ).fetchall()
+
+    def run_lines(self, run):
+        """(kind, text) for every stored line of run, in order."""
+        with self.lock:
+            rows = self.db.execute(
+                "SELECT kind, text FROM lines WHERE id BETWEEN ? AND ? ORDER BY id",
+                (run << RUN_SHIFT, ((run + 1) << RUN_SHIFT) - 1)
+            ).fetchall()
+        return rows
+
+    def prune(self, keep_runs=KEEP_RUNS):
+        """Drop every run but the newest keep_runs, with their lines and index entries."""
+        with self.lock, self.db:
+            row = self.db.execute("SELECT id FROM runs ORDER BY id DESC LIMIT 1 OFFSET ?", (keep_runs,)).fetchone()
+            if row is None:
+                return
+            first_kept = (row[0] + 1) << RUN_SHIFT
+            if self.fts:
+                # External-content FTS tables need the old values to remove index entries
+                self.db.execute(
+                    "INSERT INTO line_index (line_index, rowid, text)"
+                    " SELECT 'delete', id, text FROM lines WHERE id < ?", (first_kept,)
+                )
+            else:
+                self.db.execute("DELETE FROM postings WHERE line IN (SELECT id FROM lines WHERE id < ?)", (first_kept,))
+            self.db.execute("DELETE FROM lines WHERE id < ?", (first_kept,))
+            self.db.execute("DELETE FROM runs WHERE id <= ?", row)
+
+    def close(self):
+        self.flush()
+        self.db.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Search ManimGUI render logs")
+    parser.add_argument("--db", default=None, help="log database (default: next to the render history)")
+    commands = parser.add_subparsers(dest="command", required=True)
+    search = commands.add_parser("search", help="lines containing every word of the query")
+    search.add_argument("query")
+    search.add_argument("--limit", type=int, default=50)
+    args = parser.parse_args(argv)
+
+    store = LogStore(args.db)
+    counts, hits = store.search(args.query, limit=args.limit)
+    if not counts:
+        print("No matching lines.")
+        return 1
+    scenes = {run: scene for run, scene, _, _ in counts}
+    total = sum(count for *_, count in counts)
+    print(f"{total} matching line(s) in {len(counts)} render(s)")
+    for _, run, seq, _, text in hits:
+        print(f"{scenes.get(run) or '?'}:{seq + 1}: {text}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,200 @@
+"""Start renders in their own process group and stop the whole tree reliably.
+
+manim starts ffmpeg, latex and dvisvgm as children. Signalling only the
+process we launched leaves those running, so stopping a render signals the
+process group and every descendant: first politely, then, after a grace
+period, with SIGKILL (taskkill /F on Windows). Descendants are recorded
+before anything is signalled, because once their parent exits they are
+re-parented and can no longer be found by walking down from it.
+"""
+import multiprocessing
+import os
+import shutil
+import signal
+import subprocess
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+STOP_GRACE_SECONDS = 3.0
+VIDEO_EXTENSIONS = (".mp4", ".mov", ".webm", ".gif")
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+
+def process_pool(max_workers=None):
+    """ProcessPoolExecutor whose workers don't fork this process.
+
+    Both apps run threads (Qt workers, Streamlit sessions), and forking a
+    threaded process can copy a lock some other thread holds, deadlocking the
+    child. Workers come from a fork server where there is one, else are spawned.
+    """
+    method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+    return ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context(method))
+
+
+def process_group_kwargs():
+    """subprocess.Popen arguments that start the child in a new process group."""
+    if sys.platform == "win32":
+        return {"creationflags": subprocess.CREATE_NEW_PROCESS_GROUP}
+    return {"start_new_session": True}
+
+
+def session_prefix():
+    """Command prefix giving a QProcess child its own session, where setsid(1) exists."""
+    if sys.platform != "win32" and shutil.which("setsid"):
+        return ["setsid"]
+    return []
+
+
+def _parent_map():
+    """{pid: ppid} for every process on the machine."""
+    if psutil is not None:
+        parents = {}
+        for process in psutil.process_iter(["ppid"]):
+            parents[process.pid] = process.info["ppid"]
+        return parents
+    if os.path.isdir("/proc"):
+        parents = {}
+        for name in os.listdir("/proc"):
+            if not name.isdigit():
+                continue
+            try:
+                with open(f"/proc/{name}/stat", "rb") as f:
+                    stat = f.read()
+            except OSError:
+                continue
+            # The command name is parenthesised and may contain spaces
+            fields = stat[stat.rfind(b")") + 2:].split()
+            parents[int(name)] = int(fields[1])
+        return parents
+    try:
+        result = subprocess.run(["ps", "-A", "-o", "pid=", "-o", "ppid="], capture_output=True, text=True, timeout=5)
+    except (OSError, subprocess.SubprocessError):
+        return {}
+    parents = {}
+    for line in result.stdout.splitlines():
+        parts = line.split()
+        if len(parts) == 2 and parts[0].isdigit() and parts[1].isdigit():
+            parents[int(parts[0])] = int(parts[1])
+    return parents
+
+
+def descendants(pid):
+    """Pids of every process below pid, children first."""
+    children = {}
+    for child, parent in _parent_map().items():
+        children.setdefault(parent, []).append(child)
+    found = []
+    pending = list(children.get(pid, []))
+    while pending:
+        child = pending.pop(0)
+        if child in found or child == pid:
+            continue
+        found.append(child)
+        pending.extend(children.get(child, []))
+    return found
+
+
+def pid_alive(pid):
+    if psutil is not None:
+        try:
+            return psutil.Process(pid).status() != psutil.STATUS_ZOMBIE
+        except psutil.Error:
+            return False
+    if sys.platform == "win32":
+        try:
+            result = subprocess.run(["tasklist", "/FI", f"PID eq {pid}", "/NH"], capture_output=True, text=True,
+                                    timeout=5)
+        except (OSError, subprocess.SubprocessError):
+            return False
+        return str(pid) in result.stdout
+    try:
+        with open(f"/proc/{pid}/stat", "rb") as f:
+            stat = f.read()
+        # Killed but not yet reaped by its (new) parent
+        return stat[stat.rfind(b")") + 2:stat.rfind(b")") + 3] != b"Z"
+    except FileNotFoundError:
+        return False
+    except OSError:
+        pass
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def signal_tree(pid, tree=(), force=False):
+    """Ask (or, with force, make) pid, its process group and the given descendants exit."""
+    if sys.platform == "win32":
+        command = ["taskkill", "/PID", str(pid), "/T"] + (["/F"] if force else [])
+        try:
+            subprocess.run(command, capture_output=True, timeout=10)
+        except (OSError, subprocess.SubprocessError):
+            pass
+        if force:
+            for child in tree:
+                try:
+                    subprocess.run(["taskkill", "/PID", str(child), "/F"], capture_output=True, timeout=10)
+                except (OSError, subprocess.SubprocessError):
+                    pass
+        return
+
+    sig = signal.SIGKILL if force else signal.SIGTERM
+    try:
+        if os.getpgid(pid) == pid:
+            os.killpg(pid, sig)
+    except (ProcessLookupError, PermissionError):
+        pass
+    for target in [pid] + list(tree):
+        try:
+            os.kill(target, sig)
+        except (ProcessLookupError, PermissionError):
+            pass
+
+
+def stop_process_tree(process, grace=STOP_GRACE_SECONDS):
+    """Terminate a subprocess.Popen and all its descendants, escalating to kill after grace seconds."""
+    if process.poll() is not None:
+        return
+    tree = descendants(process.pid)
+    signal_tree(process.pid, tree)
+    deadline = time.monotonic() + grace
+    try:
+        process.wait(timeout=grace)
+    except subprocess.TimeoutExpired:
+        pass
+    while time.monotonic() < deadline and any(pid_alive(pid) for pid in tree):
+        time.sleep(0.05)
+    if process.poll() is None or any(pid_alive(pid) for pid in tree):
+        signal_tree(process.pid, tree, force=True)
+    process.wait()
+
+
+def remove_partial_outputs(media_dir, scene, since):
+    """Delete what an interrupted render of scene wrote under media_dir after since (a time.time()).
+
+    That is the scene's partial movie files, which manim would otherwise
+    reuse from its cache even if they were cut off, and a final movie that
+    may have been only partly combined. Returns the removed paths.
+    """
+    removed = []
+    for root, dirnames, filenames in os.walk(media_dir):
+        in_partials = os.path.basename(root) == scene and os.path.basename(os.path.dirname(root)) == "partial_movie_files"
+        for name in filenames:
+            if not in_partials and not (os.path.splitext(name)[0] == scene and name.endswith(VIDEO_EXTENSIONS)):
+                continue
+            path = os.path.join(root, name)
+            try:
+                if os.path.getmtime(path) >= since:
+                    os.remove(path)
+                    removed.append(path)
+            except OSError:
+                continue
+    return removed
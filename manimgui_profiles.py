@@ -0,0 +1,164 @@
+"""Named render profiles shared by the desktop and web apps.
+
+A profile bundles the manim settings that are usually changed together:
+quality preset, resolution, frame rate, caching and what gets written. The
+built-in profiles are always available. A project can override them or add
+its own in <project>/.manimgui/profiles.json, which both apps read and write.
+"""
+import json
+import os
+import re
+import tempfile
+
+PROFILES_FILE = os.path.join(".manimgui", "profiles.json")
+QUALITY_PRESETS = ("-ql", "-qm", "-qh", "-qp", "-qk")
+DEFAULT_PROFILE = "Low (480p)"
+
+PROFILE_FIELDS = {
+    "quality": "-ql",
+    "resolution": "",
+    "fps": 0,
+    "disable_caching": False,
+    "write_to_movie": False,
+    "save_last_frame": False,
+}
+
+BUILTIN_PROFILES = {
+    # Quarter of 480p at 10 fps: the fastest feedback while blocking out a scene
+    "Draft": {"quality": "-ql", "resolution": "427,240", "fps": 10},
+    "Low (480p)": {"quality": "-ql"},
+    "Medium (720p)": {"quality": "-qm"},
+    "High (1080p)": {"quality": "-qh"},
+    "4K (2160p)": {"quality": "-qk"},
+}
+
+
+class ProfileError(ValueError):
+    pass
+
+
+def profiles_path(project_dir):
+    return os.path.join(str(project_dir), PROFILES_FILE)
+
+
+def parse_resolution(text):
+    """(width, height) from 'W,H' or 'WxH', None for an empty string."""
+    text = (text or "").strip()
+    if not text:
+        return None
+    match = re.fullmatch(r"(\d+)\s*[,xX]\s*(\d+)", text)
+    if not match or not int(match.group(1)) or not int(match.group(2)):
+        raise ProfileError(f"Resolution must look like 1280,720, not {text!r}")
+    return int(match.group(1)), int(match.group(2))
+
+
+def normalize(profile):
+    """Profile with every field present and validated."""
+    result = dict(PROFILE_FIELDS)
+    result.update({key: value for key, value in (profile or {}).items() if key in PROFILE_FIELDS})
+    if result["quality"] not in QUALITY_PRESETS:
+        raise ProfileError(f"Unknown quality preset {result['quality']!r}")
+    resolution = parse_resolution(result["resolution"])
+    result["resolution"] = f"{resolution[0]},{resolution[1]}" if resolution else ""
+    try:
+        result["fps"] = int(result["fps"] or 0)
+    except (TypeError, ValueError):
+        raise ProfileError(f"Frame rate must be a number, not {result['fps']!r}")
+    if result["fps"] < 0:
+        raise ProfileError("Frame rate can't be negative")
+    for key in ("disable_caching", "write_to_movie", "save_last_frame"):
+        result[key] = bool(result[key])
+    return result
+
+
+def _read_project_profiles(project_dir):
+    try:
+        with open(profiles_path(project_dir), encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return data.get("profiles", {}) if isinstance(data, dict) else {}
+
+
+def load_profiles(project_dir=None):
+    """Built-in profiles followed by the project's, which may replace a built-in by name.
+
+    Invalid entries in the project file are skipped rather than failing the app.
+    """
+    profiles = {name: normalize(profile) for name, profile in BUILTIN_PROFILES.items()}
+    if project_dir:
+        for name, profile in _read_project_profiles(project_dir).items():
+            try:
+                profiles[str(name)] = normalize(profile)
+            except ProfileError:
+                continue
+    return profiles
+
+
+def _write_project_profiles(project_dir, profiles):
+    path = profiles_path(project_dir)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        json.dump({"profiles": profiles}, f, indent=2, sort_keys=True)
+        f.write("\n")
+    os.replace(tmp_path, path)
+
+
+def save_profile(project_dir, name, profile):
+    name = (name or "").strip()
+    if not name:
+        raise ProfileError("Profile name can't be empty")
+    profiles = _read_project_profiles(project_dir)
+    profiles[name] = normalize(profile)
+    _write_project_profiles(project_dir, profiles)
+
+
+def delete_profile(project_dir, name):
+    """Remove a project profile; a built-in it replaced comes back. Returns True if one was removed."""
+    profiles = _read_project_profiles(project_dir)
+    if profiles.pop(name, None) is None:
+        return False
+    _write_project_profiles(project_dir, profiles)
+    return True
+
+
+def profile_flags(profile):
+    """Manim flags for a profile, quality preset first."""
+    profile = normalize(profile)
+    flags = [profile["quality"]]
+    if profile["resolution"]:
+        flags += ["-r", profile["resolution"]]
+    if profile["fps"]:
+        flags += ["--fps", str(profile["fps"])]
+    if profile["disable_caching"]:
+        flags.append("--disable_caching")
+    if profile["write_to_movie"]:
+        flags.append("--write_to_movie")
+    if profile["save_last_frame"]:
+        flags.append("-s")
+    return flags
+
+
+def describe(profile):
+    """Short settings summary, also used as the 'quality' key in render history."""
+    profile = normalize(profile)
+    parts = [profile["quality"]]
+    if profile["resolution"]:
+        parts.append(profile["resolution"].replace(",", "x"))
+    if profile["fps"]:
+        parts.append(f"{profile['fps']}fps")
+    if profile["disable_caching"]:
+        parts.append("no-cache")
+    if profile["save_last_frame"]:
+        parts.append("last-frame")
+    return " ".join(parts)
+
+
+def is_heavy(profile):
+    """4K-class renders, which the web app limits to a share of its slots."""
+    profile = normalize(profile)
+    resolution = parse_resolution(profile["resolution"])
+    if resolution:
+        return resolution[0] * resolution[1] >= 3840 * 2160
+    return profile["quality"] == "-qk"
@@ -0,0 +1,200 @@
+"""Repository scanning shared by the desktop and web apps' Deep Error Scan."""
+import os
+import re
+import threading
+
+from manimgui_process import process_pool
+
+# Built rather than spelled out so this file doesn't flag itself.
+MERGE_MARKERS = tuple(char * 7 for char in "<=>")
+SCAN_SUFFIXES = (".py", ".md", ".txt", ".yml", ".yaml")
+
+# Folders never worth walking. Virtualenvs are also detected by their
+# pyvenv.cfg, whatever they are called.
+DEFAULT_IGNORED_DIRS = (
+    ".git", "__pycache__", "media", ".venv", "venv",
+    ".tox", ".nox", ".mypy_cache", ".pytest_cache", "node_modules",
+)
+
+# Below this many changed files, starting worker processes costs more than it saves.
+PARALLEL_SCAN_THRESHOLD = 16
+
+
+def is_ignored_dir(parent, name, ignored_dirs=DEFAULT_IGNORED_DIRS):
+    return name in ignored_dirs or os.path.isfile(os.path.join(parent, name, "pyvenv.cfg"))
+
+
+def _glob_to_regex(pattern):
+    i, out = 0, []
+    while i < len(pattern):
+        if pattern.startswith("**/", i):
+            out.append("(?:.*/)?")
+            i += 3
+        elif pattern.startswith("**", i):
+            out.append(".*")
+            i += 2
+        elif pattern[i] == "*":
+            out.append("[^/]*")
+            i += 1
+        elif pattern[i] == "?":
+            out.append("[^/]")
+            i += 1
+        elif pattern[i] == "[" and "]" in pattern[i + 1:]:
+            end = pattern.index("]", i + 1)
+            out.append("[" + pattern[i + 1:end].replace("!", "^", 1) + "]")
+            i = end + 1
+        else:
+            out.append(re.escape(pattern[i]))
+            i += 1
+    return re.compile("".join(out))
+
+
+class GitIgnore:
+    """Minimal .gitignore matcher: globs, `**`, `!` negation, dir-only and anchored rules."""
+
+    def __init__(self):
+        self.rules = []  # (base, regex, anchored, negate, dir_only)
+
+    def add_file(self, path, base=""):
+        try:
+            with open(path, encoding="utf-8") as f:
+                lines = f.read().splitlines()
+        except (UnicodeDecodeError, OSError):
+            return
+        for line in lines:
+            line = line.rstrip()
+            if not line or line.startswith("#"):
+                continue
+            negate = line.startswith("!")
+            if negate:
+                line = line[1:]
+            dir_only = line.endswith("/")
+            line = line.rstrip("/")
+            anchored = "/" in line
+            line = line.lstrip("/")
+            if line:
+                self.rules.append((base, _glob_to_regex(line), anchored, negate, dir_only))
+
+    def ignored(self, rel_path, is_dir=False):
+        ignored = False
+        for base, regex, anchored, negate, dir_only in self.rules:
+            if dir_only and not is_dir:
+                continue
+            if base:
+                if not rel_path.startswith(base + "/"):
+                    continue
+                sub_path = rel_path[len(base) + 1:]
+            else:
+                sub_path = rel_path
+            target = sub_path if anchored else sub_path.rsplit("/", 1)[-1]
+            if regex.fullmatch(target):
+                ignored = not negate
+        return ignored
+
+
+class ScanCache:
+    """Per-file scan results keyed by path, reused while mtime and size match."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.repos = {}  # repo_dir -> {path: (mtime_ns, size, has_markers, syntax_error)}
+
+
+def scan_file(path):
+    """Return (has_merge_markers, syntax_error) for one file; runs in worker processes."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            content = f.read()
+    except (UnicodeDecodeError, OSError):
+        return False, None
+    has_markers = any(marker in content for marker in MERGE_MARKERS)
+    syntax_error = None
+    if path.endswith(".py"):
+        try:
+            compile(content, path, "exec")
+        except SyntaxError as exc:
+            syntax_error = (exc.lineno, exc.msg)
+    return has_markers, syntax_error
+
+
+def iter_repo_files(repo_dir, suffixes=SCAN_SUFFIXES, ignored_dirs=DEFAULT_IGNORED_DIRS):
+    """Walk repo_dir once, pruning ignored folders and anything matched by .gitignore files."""
+    gitignore = GitIgnore()
+    for root, dirnames, filenames in os.walk(repo_dir):
+        rel_root = os.path.relpath(root, repo_dir).replace(os.sep, "/")
+        rel_root = "" if rel_root == "." else rel_root
+        if ".gitignore" in filenames:
+            gitignore.add_file(os.path.join(root, ".gitignore"), rel_root)
+        prefix = rel_root + "/" if rel_root else ""
+        dirnames[:] = [
+            d for d in dirnames
+            if not is_ignored_dir(root, d, ignored_dirs) and not gitignore.ignored(prefix + d, is_dir=True)
+        ]
+        for name in filenames:
+            if name.endswith(suffixes) and not gitignore.ignored(prefix + name):
+                yield os.path.join(root, name)
+
+
+def deep_repo_scan(repo_dir, cache=None, ignored_dirs=DEFAULT_IGNORED_DIRS, max_workers=None, should_stop=None):
+    """Scan repository files for unresolved merge markers and syntax issues.
+
+    Only files whose mtime or size changed since the last scan with the same
+    cache are read again; changed files are compiled in a process pool when
+    there are enough of them. Returns ([], []) without touching the cache
+    once should_stop() is true.
+    """
+    stopped = should_stop or (lambda: False)
+    repo_dir = str(repo_dir)
+    cache = cache or ScanCache()
+    with cache.lock:
+        previous = cache.repos.get(repo_dir, {})
+
+    results = {}
+    changed = []
+    for path in iter_repo_files(repo_dir, ignored_dirs=ignored_dirs):
+        if stopped():
+            return [], []
+        try:
+            stat = os.stat(path)
+        except OSError:
+            continue
+        entry = previous.get(path)
+        if entry and entry[0] == stat.st_mtime_ns and entry[1] == stat.st_size:
+            results[path] = entry
+        else:
+            changed.append((path, stat.st_mtime_ns, stat.st_size))
+
+    paths = [path for path, _, _ in changed]
+    outcomes = None
+    if len(paths) >= PARALLEL_SCAN_THRESHOLD and max_workers != 1:
+        try:
+            with process_pool(max_workers) as pool:
+                outcomes = []
+                for outcome in pool.map(scan_file, paths, chunksize=8):
+                    if stopped():
+                        pool.shutdown(wait=False, cancel_futures=True)
+                        return [], []
+                    outcomes.append(outcome)
+        except (OSError, RuntimeError):
+            outcomes = None
+    if outcomes is None:
+        outcomes = []
+        for path in paths:
+            if stopped():
+                return [], []
+            outcomes.append(scan_file(path))
+    for (path, mtime, size), (has_markers, syntax_error) in zip(changed, outcomes):
+        results[path] = (mtime, size, has_markers, syntax_error)
+
+    with cache.lock:
+        cache.repos[repo_dir] = results
+
+    marker_flagged = []
+    syntax_flagged = []
+    for path, (_, _, has_markers, syntax_error) in results.items():
+        rel_path = os.path.relpath(path, repo_dir)
+        if has_markers:
+            marker_flagged.append(rel_path)
+        if syntax_error:
+            syntax_flagged.append(f"{rel_path}:{syntax_error[0]} - {syntax_error[1]}")
+    return sorted(marker_flagged), sorted(syntax_flagged)
@@ -0,0 +1,136 @@
+"""Index of the installed manim package's public symbols for editor completion.
+
+Building the index imports manim, which is slow, so the desktop app runs it
+once per manim version in a separate process and afterwards only reads the
+cached JSON:
+
+    python manimgui_symbols.py OUTPUT.json
+"""
+import bisect
+import inspect
+import json
+import os
+import sys
+import tempfile
+
+# Scene methods worth completing and highlighting even though they aren't
+# top-level names.
+SCENE_METHODS = ("play", "wait", "add", "remove", "clear", "next_section", "add_updater")
+
+
+def installed_manim_version():
+    """Version of the installed manim distribution, without importing it."""
+    try:
+        from importlib.metadata import PackageNotFoundError, version
+    except ImportError:
+        return None
+    try:
+        return version("manim")
+    except PackageNotFoundError:
+        return None
+
+
+def index_path(cache_dir, manim_version):
+    return os.path.join(cache_dir, f"manim_symbols-{manim_version}.json")
+
+
+def _signature(obj):
+    try:
+        return str(inspect.signature(obj))
+    except (TypeError, ValueError):
+        return ""
+
+
+def _summary(obj):
+    doc = inspect.getdoc(obj) or ""
+    return doc.strip().split("\n", 1)[0][:200]
+
+
+def build_index():
+    """Introspect manim's top-level namespace (what `from manim import *` provides)."""
+    import manim
+
+    names = getattr(manim, "__all__", None) or [n for n in dir(manim) if not n.startswith("_")]
+    symbols = []
+    for name in sorted(set(names)):
+        try:
+            obj = getattr(manim, name)
+        except AttributeError:
+            continue
+        if inspect.ismodule(obj):
+            continue
+        if inspect.isclass(obj):
+            kind, signature = "class", _signature(obj)
+        elif callable(obj):
+            kind, signature = "function", _signature(obj)
+        else:
+            kind, signature = "constant", ""
+        symbols.append({
+            "name": name,
+            "kind": kind,
+            "signature": signature,
+            "doc": _summary(obj) if kind != "constant" else repr(obj)[:80],
+        })
+    for name in SCENE_METHODS:
+        method = getattr(manim.Scene, name, None)
+        if method is not None:
+            symbols.append({"name": name, "kind": "method", "signature": _signature(method), "doc": _summary(method)})
+    return {"manim_version": getattr(manim, "__version__", installed_manim_version()), "symbols": symbols}
+
+
+class SymbolIndex:
+    """Sorted, case-insensitive prefix lookup over a built index."""
+
+    def __init__(self, data=None):
+        symbols = (data or {}).get("symbols", [])
+        self.by_name = {s["name"]: s for s in symbols}
+        self.keys = sorted((name.lower(), name) for name in self.by_name)
+        self.lower_keys = [key for key, _ in self.keys]
+        self.classes = frozenset(s["name"] for s in symbols if s["kind"] == "class")
+        # What `from manim import *` binds
+        self.star_names = frozenset(s["name"] for s in symbols if s["kind"] != "method")
+        # Scene methods (add, play, clear...) are offered for completion only; highlighting
+        # them would also colour list.add, dict.clear and the like.
+        self.highlight_names = frozenset(
+            s["name"] for s in symbols if s["kind"] in ("class", "constant")
+        )
+
+    @classmethod
+    def load(cls, path):
+        with open(path, encoding="utf-8") as f:
+            return cls(json.load(f))
+
+    def __len__(self):
+        return len(self.by_name)
+
+    def complete(self, prefix, limit=50):
+        """Symbols starting with prefix (case-insensitive), exact-case matches first."""
+        lower = prefix.lower()
+        start = bisect.bisect_left(self.lower_keys, lower)
+        matches = []
+        for key, name in self.keys[start:start + limit * 4]:
+            if not key.startswith(lower):
+                break
+            matches.append(self.by_name[name])
+        matches.sort(key=lambda s: (not s["name"].startswith(prefix), s["name"].lower()))
+        return matches[:limit]
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if len(argv) != 1:
+        print("usage: python manimgui_symbols.py OUTPUT.json", file=sys.stderr)
+        return 2
+    output = argv[0]
+    data = build_index()
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(output)), suffix=".tmp")
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        json.dump(data, f)
+    os.replace(tmp_path, output)
+    print(f"Indexed {len(data['symbols'])} manim symbols into {output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
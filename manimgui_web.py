@@ -1,17 +1,26 @@
+import importlib
 import os
 import re
 import subprocess
+import sys
+import threading
+import time
+import uuid
+from collections import deque
 from pathlib import Path
 
 import streamlit as st
 
+from manimgui_history import DEFAULT_THRESHOLD_PERCENT, RenderHistory, peak_rss_bytes
+from manimgui_lint import preflight
+from manimgui_logs import LogStore, default_db_path as default_log_db_path, query_words
+from manimgui_process import process_group_kwargs, remove_partial_outputs, stop_process_tree
+from manimgui_profiles import (
+    DEFAULT_PROFILE, QUALITY_PRESETS, ProfileError, delete_profile, describe, is_heavy, load_profiles,
+    profile_flags, save_profile,
+)
+from manimgui_scan import DEFAULT_IGNORED_DIRS, ScanCache, deep_repo_scan, is_ignored_dir
 
-QUALITY_FLAGS = {
-    "📱 Low (480p)": "-ql",
-    "💻 High (1080p)": "-qh",
-    "🎥 4K (2160p)": "-qk",
-    "🖼️ Medium (720p)": "-qm",
-}
 
 OUTPUT_FLAGS = {
     "🎬 MP4 Video": [],
@@ -19,154 +28,517 @@ OUTPUT_FLAGS = {
     "📐 SVG Vector": ["-s", "--format=svg"],
 }
 
+# Live log view: only the tail is sent to the browser, at most every
+# LOG_REFRESH_SECONDS, so long renders don't re-send the whole log per line.
+LOG_TAIL_LINES = 300
+LOG_REFRESH_SECONDS = 0.5
+
+# Server-wide render limits shared by every browser session. 4K renders are
+# "heavy" and may only take a share of the slots so they can't starve others.
+MAX_CONCURRENT_RENDERS = int(os.environ.get("MANIMGUI_MAX_RENDERS", max(1, (os.cpu_count() or 2) // 2)))
+MAX_RENDERS_PER_SESSION = int(os.environ.get("MANIMGUI_MAX_RENDERS_PER_SESSION", 1))
+MAX_HEAVY_RENDERS = int(os.environ.get("MANIMGUI_MAX_HEAVY_RENDERS", max(1, MAX_CONCURRENT_RENDERS // 2)))
+
+# Visitors only search their own session's render logs, kept apart from the
+# desktop app's. An operator running it for one user can opt in to sharing the
+# desktop store, which lets every visitor search every stored render.
+SHARED_LOGS = os.environ.get("MANIMGUI_WEB_SHARED_LOGS") == "1"
+
+UPDATE_TIMEOUT_SECONDS = 120
+
 
 def detect_scene_classes(code: str):
     pattern = r"class\s+(\w+)\(.*Scene.*\)"
     return re.findall(pattern, code)
 
 
-def list_py_files(project_dir: Path):
+@st.cache_resource
+def _py_files_cache():
+    """(cache, lock) shared by every session.
+
+    cache maps (project_dir, ignored_dirs) -> ({dir: mtime_ns}, [relative .py
+    paths]); hold lock while reading or updating it. Kept in a cache resource
+    because Streamlit re-executes this script on every rerun, which would reset
+    plain module globals.
+    """
+    return {}, threading.Lock()
+
+
+def _walk_py_files(project_dir: Path, ignored_dirs):
+    dir_mtimes = {}
+    files = []
+    for root, dirnames, filenames in os.walk(project_dir):
+        try:
+            dir_mtimes[root] = os.stat(root).st_mtime_ns
+        except OSError:
+            continue
+        dirnames[:] = [d for d in dirnames if not is_ignored_dir(root, d, ignored_dirs)]
+        for name in filenames:
+            if name.endswith(".py"):
+                files.append(os.path.relpath(os.path.join(root, name), project_dir))
+    return dir_mtimes, sorted(files)
+
+
+def _dirs_unchanged(dir_mtimes):
+    # Adding, removing or renaming an entry bumps its parent directory's mtime,
+    # so one stat per directory is enough to know the listing is still valid.
+    for directory, mtime in dir_mtimes.items():
+        try:
+            if os.stat(directory).st_mtime_ns != mtime:
+                return False
+        except OSError:
+            return False
+    return True
+
+
+def list_py_files(project_dir: Path, ignored_dirs=DEFAULT_IGNORED_DIRS):
+    """List .py files under project_dir, cached until a walked directory changes."""
     if not project_dir.exists():
         return []
-  codex/improve-logging-system-and-ui-krnteu
- 
-  codex/improve-logging-system-and-ui-wjiw0z
- 
-  codex/improve-logging-system-and-ui-gcwvxn
-   main
-  main
-    files = []
-    for path in project_dir.rglob("*.py"):
-        if path.is_file():
-            files.append(str(path.relative_to(project_dir)))
-    return sorted(files)
+    cache, lock = _py_files_cache()
+    key = (str(project_dir), tuple(sorted(ignored_dirs)))
+    with lock:
+        cached = cache.get(key)
+    if cached and _dirs_unchanged(cached[0]):
+        return list(cached[1])
+
+    dir_mtimes, files = _walk_py_files(project_dir, set(ignored_dirs))
+    with lock:
+        cache[key] = (dir_mtimes, files)
+    return list(files)
+
+
+def invalidate_py_files_cache(project_dir: Path = None):
+    cache, lock = _py_files_cache()
+    with lock:
+        if project_dir is None:
+            cache.clear()
+            return
+        for key in [k for k in cache if k[0] == str(project_dir)]:
+            del cache[key]
+
+
+class GitUpdateJob:
+    """`git pull --ff-only` running on a background thread, with timeout and cancel."""
+
+    def __init__(self, repo_dir: Path, timeout: float = UPDATE_TIMEOUT_SECONDS):
+        self.repo_dir = repo_dir
+        self.timeout = timeout
+        self.lines = []
+        self.returncode = None
+        self.cancelled = False
+        self.timed_out = False
+        self.process = None
+        self._lock = threading.Lock()
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+
+    @property
+    def running(self):
+        return self.thread.is_alive()
+
+    @property
+    def ok(self):
+        return self.returncode == 0 and not self.cancelled and not self.timed_out
+
+    def output(self):
+        return "\n".join(self.lines).strip() or "No output from git."
+
+    def cancel(self):
+        # Under the lock so a cancel that lands while git is starting is seen by _run.
+        with self._lock:
+            self.cancelled = True
+        self._kill()
+
+    def _kill(self):
+        with self._lock:
+            process = self.process
+        if process is not None:
+            # git pull runs fetch/ssh helpers that hold stdout open; stop them too.
+            stop_process_tree(process)
+
+    def _on_timeout(self):
+        self.timed_out = True
+        self.lines.append(f"Timed out after {int(self.timeout)}s.")
+        self._kill()
+
+    def _run(self):
+        # Never let git wait on a credential or host-key prompt nobody can see.
+        env = dict(os.environ, GIT_TERMINAL_PROMPT="0", GCM_INTERACTIVE="never")
+        env.setdefault("GIT_SSH_COMMAND", "ssh -o BatchMode=yes")
+        try:
+            process = subprocess.Popen(
+                ["git", "pull", "--ff-only"],
+                cwd=str(self.repo_dir),
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                text=True,
+                env=env,
+                **process_group_kwargs(),
+            )
+        except OSError as exc:
+            self.lines.append(f"Could not start git: {exc}")
+            self.returncode = -1
+            return
+        with self._lock:
+            self.process = process
+            cancelled = self.cancelled
+        if cancelled:
+            self._kill()
+
+        timer = threading.Timer(self.timeout, self._on_timeout)
+        timer.daemon = True
+        timer.start()
+        try:
+            for line in self.process.stdout:
+                self.lines.append(line.rstrip("\n"))
+            self.returncode = self.process.wait()
+        finally:
+            timer.cancel()
 
 
 def update_from_github(repo_dir: Path):
+    """Start a background update; returns (job, error message)."""
     git_dir = repo_dir / ".git"
     if not os.path.isdir(git_dir):
-        return False, "No git repository found next to the app files."
+        return None, "No git repository found next to the app files."
+    return GitUpdateJob(repo_dir), ""
 
-    update = subprocess.run(
-        ["git", "pull", "--ff-only"],
-        cwd=str(repo_dir),
-        capture_output=True,
-        text=True,
-    )
-    output = "\n".join(x for x in [update.stdout.strip(), update.stderr.strip()] if x).strip()
-    if not output:
-        output = "No output from git."
-    return update.returncode == 0, output
-  codex/improve-logging-system-and-ui-krnteu
-
-
-def deep_repo_scan(repo_dir: Path):
-    """Scan repository files for unresolved merge markers and syntax issues."""
-    markers = ("<<<<<<<", "=======", ">>>>>>>")
-    marker_flagged = []
-    syntax_flagged = []
- 
-  codex/improve-logging-system-and-ui-wjiw0z
-
-
-def deep_repo_scan(repo_dir: Path):
-    """Scan repository files for unresolved merge markers."""
-    markers = ("<<<<<<<", "=======", ">>>>>>>")
-    flagged = []
-  main
-    for pattern in ("*.py", "*.md", "*.txt", "*.yml", "*.yaml"):
-        for file_path in repo_dir.rglob(pattern):
-            if ".git" in file_path.parts:
-                continue
-            try:
-                content = file_path.read_text(encoding="utf-8")
-            except (UnicodeDecodeError, OSError):
-                continue
-            if any(marker in content for marker in markers):
-  codex/improve-logging-system-and-ui-krnteu
-                marker_flagged.append(str(file_path.relative_to(repo_dir)))
-
-            if file_path.suffix == ".py":
-                try:
-                    compile(content, str(file_path), "exec")
-                except SyntaxError as exc:
-                    syntax_flagged.append(
-                        f"{file_path.relative_to(repo_dir)}:{exc.lineno} - {exc.msg}"
-                    )
-
-    return sorted(marker_flagged), sorted(syntax_flagged)
- 
-                flagged.append(str(file_path.relative_to(repo_dir)))
-    return sorted(flagged)
- 
- 
-    return sorted([str(p.relative_to(project_dir)) for p in project_dir.glob("*.py")])
-  main
-  main
-  main
-
-
-def build_manim_command(file_path: Path, scene_class: str, quality_label: str, output_label: str):
-    cmd = ["manim", QUALITY_FLAGS.get(quality_label, "-qh")]
-    cmd.extend(OUTPUT_FLAGS.get(output_label, []))
+
+@st.cache_resource
+def deep_scan_cache():
+    return ScanCache()
+
+
+def build_manim_command(file_path: Path, scene_class: str, profile: dict, output_label: str):
+    cmd = ["manim"] + profile_flags(profile)
+    cmd.extend(flag for flag in OUTPUT_FLAGS.get(output_label, []) if flag not in cmd)
     if output_label == "🎬 MP4 Video":
         cmd.append("-p")
     cmd.extend([str(file_path), scene_class])
     return cmd
 
 
+def log_kind(line: str):
+    if "ERROR" in line or "❌" in line or "Exception" in line:
+        return "error"
+    if "WARNING" in line or "⚠️" in line:
+        return "warning"
+    if "INFO" in line or "✅" in line or "▶️" in line:
+        return "info"
+    return "normal"
+
+
 def append_log(line: str):
-    st.session_state.logs.append(line.rstrip("\n"))
+    line = line.rstrip("\n")
+    st.session_state.logs.append(line)
+    if st.session_state.get("log_run") is not None:
+        log_store().append(st.session_state.log_run, line, log_kind(line))
 
 
-def filtered_logs():
-    level = st.session_state.log_filter
-    logs = st.session_state.logs
+def log_line_allowed(line: str, level: str):
     if level == "Info Only":
-        return [line for line in logs if "INFO" in line or "✅" in line or "▶️" in line]
+        return "INFO" in line or "✅" in line or "▶️" in line
     if level == "Warnings+":
-        return [line for line in logs if "WARNING" in line or "ERROR" in line or "⚠️" in line or "❌" in line]
+        return "WARNING" in line or "ERROR" in line or "⚠️" in line or "❌" in line
     if level == "Errors Only":
-        return [line for line in logs if "ERROR" in line or "❌" in line or "Exception" in line]
-    return logs
+        return "ERROR" in line or "❌" in line or "Exception" in line
+    return True
+
+
+def filtered_logs():
+    level = st.session_state.log_filter
+    logs = st.session_state.logs
+    if level == "All Logs":
+        return logs
+    return [line for line in logs if log_line_allowed(line, level)]
+
+
+def tail_logs(limit: int = LOG_TAIL_LINES):
+    """Return (last `limit` filtered lines, whether earlier filtered lines exist) without filtering the whole log."""
+    level = st.session_state.log_filter
+    tail = []
+    for line in reversed(st.session_state.logs):
+        if log_line_allowed(line, level):
+            # One line past the limit tells whether anything is hidden
+            if len(tail) >= limit:
+                tail.reverse()
+                return tail, True
+            tail.append(line)
+    tail.reverse()
+    return tail, False
+
+
+def show_logs(log_box, full: bool = None):
+    """Draw the log into log_box; full defaults to the 'Show full log' checkbox, read on every refresh."""
+    if full is None:
+        full = st.session_state.get("show_full_log", False)
+    if full:
+        lines, hidden = filtered_logs(), False
+    else:
+        lines, hidden = tail_logs()
+    text = "\n".join(lines)
+    if hidden:
+        text = f"... showing the last {len(lines)} lines (enable 'Show full log' to see everything)\n" + text
+    log_box.code(text or "No logs yet.", language="bash")
+
+
+class RenderJob:
+    def __init__(self, session_id: str, heavy: bool):
+        self.id = uuid.uuid4().hex
+        self.session_id = session_id
+        self.heavy = heavy
+        self.admitted = threading.Event()
+        self.started_at = None
+
+
+class RenderScheduler:
+    """Admit render jobs under a global cap, round-robin across sessions.
+
+    Each session has its own FIFO queue. Whenever a slot frees up, sessions are
+    visited in rotation and the first one whose head job is allowed to run
+    (per-session and heavy-job limits) gets the slot, so one user queueing many
+    renders can't push everyone else back.
+    """
+
+    def __init__(self, max_concurrent=MAX_CONCURRENT_RENDERS, per_session=MAX_RENDERS_PER_SESSION,
+                 max_heavy=MAX_HEAVY_RENDERS):
+        self.max_concurrent = max(1, max_concurrent)
+        self.per_session = max(1, per_session)
+        self.max_heavy = max(1, max_heavy)
+        self._lock = threading.Lock()
+        self._queues = {}  # session_id -> deque of waiting jobs, in rotation order
+        self._running = {}  # job id -> job
+        self._durations = {False: deque(maxlen=20), True: deque(maxlen=20)}
+
+    def submit(self, session_id: str, heavy: bool = False):
+        job = RenderJob(session_id, heavy)
+        with self._lock:
+            self._queues.setdefault(session_id, deque()).append(job)
+            self._dispatch()
+        return job
+
+    def wait(self, job: RenderJob, timeout: float = None):
+        return job.admitted.wait(timeout)
+
+    def release(self, job: RenderJob):
+        """Finish a running job or withdraw a queued one."""
+        with self._lock:
+            if self._running.pop(job.id, None) is not None:
+                self._durations[job.heavy].append(time.monotonic() - job.started_at)
+            else:
+                queue = self._queues.get(job.session_id)
+                if queue and job in queue:
+                    queue.remove(job)
+                    if not queue:
+                        del self._queues[job.session_id]
+            self._dispatch()
+
+    def queue_status(self, job: RenderJob):
+        """Return (position, estimated wait in seconds) for a queued job."""
+        with self._lock:
+            order = self._admission_order()
+            position = order.index(job) if job in order else 0
+            durations = self._durations[False] + self._durations[True]
+            average = sum(durations) / len(durations) if durations else 30.0
+            return position, (position // self.max_concurrent + 1) * average
+
+    def stats(self):
+        with self._lock:
+            return len(self._running), sum(len(q) for q in self._queues.values())
+
+    def _admission_order(self):
+        order = []
+        queues = list(self._queues.values())
+        depth = 0
+        while True:
+            layer = [q[depth] for q in queues if len(q) > depth]
+            if not layer:
+                return order
+            order.extend(layer)
+            depth += 1
+
+    def _can_start(self, job: RenderJob):
+        running = self._running.values()
+        if sum(1 for j in running if j.session_id == job.session_id) >= self.per_session:
+            return False
+        if job.heavy and sum(1 for j in running if j.heavy) >= self.max_heavy:
+            return False
+        return True
+
+    def _dispatch(self):
+        while len(self._running) < self.max_concurrent:
+            for session_id, queue in self._queues.items():
+                if self._can_start(queue[0]):
+                    break
+            else:
+                return
+            job = queue.popleft()
+            # Move the session to the back of the rotation.
+            del self._queues[session_id]
+            if queue:
+                self._queues[session_id] = queue
+            job.started_at = time.monotonic()
+            self._running[job.id] = job
+            job.admitted.set()
+
+
+@st.cache_resource
+def render_scheduler():
+    return RenderScheduler()
 
 
-def render_scene(project_dir: Path, file_path: Path, scene_class: str, quality_label: str, output_label: str):
-    cmd = build_manim_command(file_path, scene_class, quality_label, output_label)
+def import_dirs_fingerprint(file_path: str, project_dir: str):
+    """mtimes of the directories imports resolve in; adding a module or installing a package changes one."""
+    stamps = []
+    for directory in [str(Path(file_path).parent), project_dir] + sys.path:
+        try:
+            stamps.append(os.stat(directory or ".").st_mtime_ns)
+        except OSError:
+            stamps.append(None)
+    return tuple(stamps)
+
+
+@st.cache_data(max_entries=256)
+def preflight_check(source: str, scene_class: str, file_path: str, project_dir: str, import_dirs: tuple):
+    """Cached by content and import_dirs_fingerprint(), so re-rendering unchanged code skips the checks."""
+    # Finders cache directory listings; a changed fingerprint means they may be stale
+    importlib.invalidate_caches()
+    return preflight(source, scene_class, file_path, search_paths=[str(Path(file_path).parent), project_dir])
+
+
+@st.cache_resource
+def render_history():
+    return RenderHistory()
+
+
+@st.cache_resource
+def log_store():
+    """Searchable render log lines; the desktop app's store only with MANIMGUI_WEB_SHARED_LOGS=1."""
+    if SHARED_LOGS:
+        return LogStore()
+    return LogStore(os.path.join(os.path.dirname(default_log_db_path()), "web_render_logs.sqlite"))
+
+
+def render_scene(project_dir: Path, file_path: Path, scene_class: str, profile: dict, output_label: str):
+    cmd = build_manim_command(file_path, scene_class, profile, output_label)
     st.session_state.logs = []
     st.session_state.last_output_file = ""
     st.session_state.last_output_dir = ""
+    st.session_state.log_run = log_store().start_run(scene_class, str(file_path))
+    st.session_state.log_runs.append(st.session_state.log_run)
     append_log(f"▶️ Starting render: {' '.join(cmd)}")
 
-    process = subprocess.Popen(
-        cmd,
-        cwd=str(project_dir),
-        stdout=subprocess.PIPE,
-        stderr=subprocess.STDOUT,
-        text=True,
-        bufsize=1,
-    )
-
-    log_box = st.empty()
-    for line in process.stdout:
-        append_log(line)
-        ready_match = re.search(r"File ready at:\s*(.*\.(mp4|png|svg))", line)
-        if ready_match:
-            relative_path = ready_match.group(1).strip()
-            absolute_output = (project_dir / relative_path).resolve()
-            st.session_state.last_output_file = str(absolute_output)
-            st.session_state.last_output_dir = str(absolute_output.parent)
-            append_log(f"🎥 Output ready: {absolute_output}")
+    scheduler = render_scheduler()
+    job = scheduler.submit(st.session_state.session_id, heavy=is_heavy(profile))
+    queue_box = st.empty()
+    process = None
+    try:
+        while not scheduler.wait(job, timeout=1.0):
+            position, eta = scheduler.queue_status(job)
+            queue_box.info(f"⏳ Waiting for a free render slot: position {position + 1}, estimated wait ~{int(eta)}s")
+        queue_box.empty()
+
+        started_at = time.time()
+        started = time.monotonic()
+        peak_rss = None
+        process = subprocess.Popen(
+            cmd,
+            cwd=str(project_dir),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            bufsize=1,
+            **process_group_kwargs(),
+        )
 
-        log_box.code("\n".join(filtered_logs()) or "No logs yet.", language="bash")
+        log_box = st.empty()
+        last_refresh = 0.0
+        for line in process.stdout:
+            append_log(line)
+            ready_match = re.search(r"File ready at:?\s*'?(.*?\.(mp4|mov|webm|gif|png|svg))", line)
+            if ready_match:
+                relative_path = ready_match.group(1).strip()
+                absolute_output = (project_dir / relative_path).resolve()
+                st.session_state.last_output_file = str(absolute_output)
+                st.session_state.last_output_dir = str(absolute_output.parent)
+                append_log(f"🎥 Output ready: {absolute_output}")
+
+            now = time.monotonic()
+            if now - last_refresh >= LOG_REFRESH_SECONDS:
+                show_logs(log_box)
+                log_store().flush()
+                last_refresh = now
+                peak_rss = max(peak_rss or 0, peak_rss_bytes(process.pid) or 0) or None
+
+        process.wait()
+        render_history().record(
+            str(project_dir), str(file_path), scene_class, describe(profile), cmd[1:-2],
+            time.monotonic() - started, process.returncode, started_at=started_at, peak_rss=peak_rss,
+            output_path=st.session_state.last_output_file or None,
+        )
+    finally:
+        # A rerun or closed tab interrupts the script; don't leave the slot
+        # held or the manim process running behind the scheduler's back.
+        if process is not None and process.poll() is None:
+            stop_process_tree(process)
+            remove_partial_outputs(project_dir / "media", scene_class, started_at)
+        scheduler.release(job)
 
-    process.wait()
     if process.returncode == 0:
         append_log("✅ Render completed successfully.")
     else:
         append_log(f"❌ Render failed with exit code {process.returncode}.")
+    log_store().flush()
 
-    log_box.code("\n".join(filtered_logs()) or "No logs yet.", language="bash")
+    show_logs(log_box)
+
+
+def show_log_search():
+    """Indexed search over stored render logs, with the lines around the selected match."""
+    query = st.text_input("🔍 Search render logs", placeholder="e.g. latex error")
+    all_renders = st.checkbox(
+        "All renders" if SHARED_LOGS else "All renders in this session", value=st.session_state.get("log_run") is None
+    )
+    if not query_words(query):
+        return
+    if all_renders:
+        run = None if SHARED_LOGS else st.session_state.log_runs
+        searchable = SHARED_LOGS or bool(run)
+    else:
+        run = st.session_state.get("log_run")
+        searchable = run is not None
+    if not searchable:
+        st.caption("No render yet in this session.")
+        return
+    store = log_store()
+    store.flush()
+    counts, hits = store.search(query, run, limit=500)
+    total = sum(count for *_, count in counts)
+    if not total:
+        st.caption("No matches.")
+        return
+    listed = f", newest {len(hits)} listed" if total > len(hits) else ""
+    st.caption(
+        f"{total} match(es) in {len(counts)} render(s){listed}: "
+        + ", ".join(f"{scene or '?'} ({count})" for _, scene, _, count in counts[:10])
+    )
+    scenes = {run_id: scene for run_id, scene, _, _ in counts}
+    st.dataframe(
+        [{"Render": scenes.get(hit_run) or "?", "Line": seq + 1, "Text": text} for _, hit_run, seq, _, text in hits],
+        use_container_width=True, height=220,
+    )
+    # The number input's -/+ buttons step through the matches
+    index = st.number_input("Match", min_value=1, max_value=len(hits), value=1, step=1)
+    line_id = hits[index - 1][0]
+    st.code(
+        "\n".join(
+            f"{'>' if other_id == line_id else ' '} {seq + 1:>6}  {text}"
+            for other_id, seq, _, text in store.context(line_id, radius=5)
+        ),
+        language="bash",
+    )
 
 
 def main():
@@ -182,32 +554,50 @@ def main():
         st.session_state.last_output_dir = ""
     if "log_filter" not in st.session_state:
         st.session_state.log_filter = "All Logs"
+    if "show_full_log" not in st.session_state:
+        st.session_state.show_full_log = False
+    if "update_job" not in st.session_state:
+        st.session_state.update_job = None
+    if "session_id" not in st.session_state:
+        st.session_state.session_id = uuid.uuid4().hex
+    if "log_runs" not in st.session_state:
+        st.session_state.log_runs = []
 
     with st.sidebar:
         st.header("⚙️ Project")
         project_dir_str = st.text_input("Project directory", value=str(Path.cwd()))
         project_dir = Path(project_dir_str).expanduser().resolve()
 
-  codex/improve-logging-system-and-ui-krnteu
- 
-  codex/improve-logging-system-and-ui-wjiw0z
- 
-  codex/improve-logging-system-and-ui-gcwvxn
-  main
-  main
-        if st.button("🔄 Update from GitHub", use_container_width=True):
-            repo_dir = Path(__file__).resolve().parent
-            ok, output = update_from_github(repo_dir)
-            if ok:
-                st.success("Update completed. Restart Streamlit if needed.")
-            else:
-                st.error("Update failed. Check output below.")
-            st.code(output, language="bash")
+        update_job = st.session_state.update_job
+        if update_job is not None and update_job.running:
+            st.info("🔄 Updating from GitHub...")
+            refresh_col, cancel_col = st.columns(2)
+            refresh_col.button("🔄 Refresh", use_container_width=True)
+            if cancel_col.button("⏹️ Cancel", use_container_width=True):
+                update_job.cancel()
+            st.code(update_job.output(), language="bash")
+        else:
+            if st.button("🔄 Update from GitHub", use_container_width=True):
+                repo_dir = Path(__file__).resolve().parent
+                update_job, error = update_from_github(repo_dir)
+                st.session_state.update_job = update_job
+                if update_job is None:
+                    st.error(error)
+                else:
+                    st.rerun()
+            if update_job is not None:
+                if update_job.ok:
+                    st.success("Update completed. Restart Streamlit if needed.")
+                elif update_job.cancelled:
+                    st.warning("Update cancelled.")
+                else:
+                    st.error("Update failed. Check output below.")
+                st.code(update_job.output(), language="bash")
 
-  codex/improve-logging-system-and-ui-krnteu
         if st.button("🔍 Deep Error Scan", use_container_width=True):
             repo_dir = Path(__file__).resolve().parent
-            conflict_files, syntax_errors = deep_repo_scan(repo_dir)
+            with st.spinner("Scanning repository..."):
+                conflict_files, syntax_errors = deep_repo_scan(repo_dir, cache=deep_scan_cache())
             if conflict_files:
                 st.error("Found unresolved merge markers:")
                 st.code("\n".join(conflict_files), language="bash")
@@ -217,28 +607,77 @@ def main():
             else:
                 st.success("Deep scan complete: no merge markers or syntax errors found.")
 
- 
-  codex/improve-logging-system-and-ui-wjiw0z
-        if st.button("🔍 Deep Error Scan", use_container_width=True):
-            repo_dir = Path(__file__).resolve().parent
-            conflict_files = deep_repo_scan(repo_dir)
-            if conflict_files:
-                st.error("Found unresolved merge markers:")
-                st.code("\n".join(conflict_files), language="bash")
-            else:
-                st.success("Deep scan complete: no merge conflict markers found.")
-
- 
- 
-  main
-  main
-  main
-        py_files = list_py_files(project_dir)
+        ignored_text = st.text_input(
+            "Ignored folders",
+            value=", ".join(DEFAULT_IGNORED_DIRS),
+            help="Folder names skipped when listing Python files.",
+        )
+        ignored_dirs = tuple(name.strip() for name in ignored_text.split(",") if name.strip())
+        py_files = list_py_files(project_dir, ignored_dirs)
         selected_file = st.selectbox("Python file", options=py_files if py_files else [""])
         st.session_state.log_filter = st.selectbox(
             "Log filter", ["All Logs", "Info Only", "Warnings+", "Errors Only"], index=0
         )
 
+        scheduler = render_scheduler()
+        running, queued = scheduler.stats()
+        st.caption(f"🖥️ Render slots: {running}/{scheduler.max_concurrent} busy, {queued} queued")
+
+        profiles = load_profiles(project_dir if project_dir.exists() else None)
+        with st.expander("🎛️ Render profiles"):
+            edit_name = st.selectbox("Edit profile", list(profiles) + ["➕ New profile"])
+            base = profiles.get(edit_name, profiles[DEFAULT_PROFILE])
+            with st.form("profile_form"):
+                new_name = st.text_input("Name", value=edit_name if edit_name in profiles else "")
+                new_quality = st.selectbox("Quality preset", QUALITY_PRESETS, index=QUALITY_PRESETS.index(base["quality"]))
+                new_resolution = st.text_input("Resolution", value=base["resolution"], placeholder="e.g. 854,480")
+                new_fps = st.number_input("Frame rate (0 = preset default)", min_value=0, max_value=240, value=base["fps"])
+                new_no_cache = st.checkbox("--disable_caching", value=base["disable_caching"])
+                new_movie = st.checkbox("--write_to_movie", value=base["write_to_movie"])
+                new_last_frame = st.checkbox("--save_last_frame", value=base["save_last_frame"])
+                save_col, delete_col = st.columns(2)
+                save_profile_clicked = save_col.form_submit_button("💾 Save", use_container_width=True)
+                delete_profile_clicked = delete_col.form_submit_button("🗑️ Delete", use_container_width=True)
+            if save_profile_clicked:
+                try:
+                    save_profile(project_dir, new_name, {
+                        "quality": new_quality, "resolution": new_resolution, "fps": new_fps,
+                        "disable_caching": new_no_cache, "write_to_movie": new_movie,
+                        "save_last_frame": new_last_frame,
+                    })
+                except (ProfileError, OSError) as e:
+                    st.error(str(e))
+                else:
+                    st.rerun()
+            if delete_profile_clicked:
+                try:
+                    removed = delete_profile(project_dir, new_name.strip())
+                except OSError as e:
+                    st.error(str(e))
+                else:
+                    if removed:
+                        st.rerun()
+                    st.info(f"'{new_name}' is built in and can't be deleted.")
+            st.caption(f"Saved to {project_dir / '.manimgui' / 'profiles.json'}, shared with the desktop app.")
+
+        with st.expander("📈 Slower renders"):
+            threshold = st.number_input("Threshold (%)", min_value=1, value=int(DEFAULT_THRESHOLD_PERCENT))
+            regressions = render_history().regressions(threshold)
+            if regressions:
+                st.dataframe(
+                    [
+                        {
+                            "Scene": scene, "Quality": quality, "Baseline (s)": round(baseline, 1),
+                            "Now (s)": round(wall, 1), "Slower": f"+{percent:.0f}%",
+                            "Rendered": time.strftime("%Y-%m-%d %H:%M", time.localtime(started_at)),
+                        }
+                        for started_at, scene, quality, wall, baseline, percent, _, _ in regressions
+                    ],
+                    use_container_width=True,
+                )
+            else:
+                st.caption("No render regressed past the threshold.")
+
     left, right = st.columns([3, 2], gap="large")
 
     with left:
@@ -257,7 +696,12 @@ def main():
 
         q_col, o_col, s_col = st.columns(3)
         with q_col:
-            quality = st.selectbox("Quality", list(QUALITY_FLAGS.keys()))
+            profile_names = list(profiles)
+            profile_name = st.selectbox(
+                "Profile", profile_names, index=profile_names.index(DEFAULT_PROFILE),
+                help="Draft renders a tiny, low frame rate preview for the fastest feedback.",
+            )
+            st.caption(" ".join(profile_flags(profiles[profile_name])))
         with o_col:
             output_type = st.selectbox("Output", list(OUTPUT_FLAGS.keys()))
         with s_col:
@@ -268,6 +712,7 @@ def main():
         if save_clicked:
             project_dir.mkdir(parents=True, exist_ok=True)
             file_path.write_text(code, encoding="utf-8")
+            invalidate_py_files_cache(project_dir)
             st.success(f"Saved: {file_path}")
 
         render_clicked = st.button("▶️ Render Scene", type="primary", use_container_width=True)
@@ -275,20 +720,32 @@ def main():
             if not scene_class.strip():
                 st.error("Please enter a scene class.")
             else:
-                project_dir.mkdir(parents=True, exist_ok=True)
-                file_path.write_text(code, encoding="utf-8")
-                render_scene(project_dir, file_path, scene_class.strip(), quality, output_type)
+                problem = preflight_check(
+                    code, scene_class.strip(), str(file_path), str(project_dir),
+                    import_dirs_fingerprint(str(file_path), str(project_dir)),
+                )
+                if problem:
+                    st.error(f"Pre-flight check failed at line {problem['line']}: {problem['message']}")
+                    lines = code.splitlines()
+                    if 0 < problem["line"] <= len(lines):
+                        st.code(lines[problem["line"] - 1], language="python")
+                else:
+                    project_dir.mkdir(parents=True, exist_ok=True)
+                    file_path.write_text(code, encoding="utf-8")
+                    render_scene(project_dir, file_path, scene_class.strip(), profiles[profile_name], output_type)
 
     with right:
         st.subheader("📊 Logs")
+        st.checkbox("Show full log", key="show_full_log")
+        show_logs(st.empty())
         shown_logs = "\n".join(filtered_logs())
-        st.code(shown_logs or "No logs yet.", language="bash")
         st.download_button(
             "💾 Download Logs",
             data=(shown_logs + "\n") if shown_logs else "",
             file_name="manim_render_logs.txt",
             use_container_width=True,
         )
+        show_log_search()
 
         st.subheader("📁 Output")
         if st.session_state.last_output_file:
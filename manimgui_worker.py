@@ -0,0 +1,499 @@
+"""Render farm worker daemon and client used by the desktop app.
+
+Run a worker on each render box:
+
+    python manimgui_worker.py --host 0.0.0.0 --port 8765 --slots 2 --token SECRET
+
+Every request is one TCP connection carrying newline-delimited JSON messages.
+File contents travel base64-encoded and are stored by the worker in a
+content-addressed cache, so a scene's imports are only sent once per worker.
+
+    {"op": "status"}                        -> {"op": "status", "running", "queued", "slots"}
+    {"op": "have", "hashes": [...]}         -> {"op": "have", "hashes": [subset already cached]}
+    {"op": "render", "files": {rel: sha}, "blobs": {sha: b64},
+     "entry": rel, "scene": name, "args": [...]}
+                                            -> {"op": "log", "line"}... then
+                                               {"op": "result", "returncode", "outputs": [{"path", "data"}]}
+
+Any request may carry "token"; a worker started with a token rejects requests
+without it. A token is required to listen on anything but loopback, since a
+render request runs the client's code. Errors are answered with {"op": "error", "message"}.
+"""
+import argparse
+import ast
+import base64
+import hashlib
+import hmac
+import ipaddress
+import json
+import os
+import shlex
+import shutil
+import socket
+import socketserver
+import subprocess
+import sys
+import tempfile
+import threading
+from collections import deque
+
+from manimgui_process import process_group_kwargs, stop_process_tree
+
+DEFAULT_PORT = 8765
+CONNECT_TIMEOUT_SECONDS = 5
+# How often a queue waiting on workers busy with other clients' jobs is retried
+RETRY_SECONDS = 5
+OUTPUT_EXTENSIONS = (".mp4", ".mov", ".webm", ".gif", ".png", ".svg")
+
+
+class FarmError(Exception):
+    """A worker could not be reached or refused a job."""
+
+
+def file_hash(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 16), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def is_loopback(host):
+    if host == "localhost":
+        return True
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False
+
+
+def parse_address(address):
+    host, _, port = address.strip().rpartition(":")
+    if not host:
+        return address.strip(), DEFAULT_PORT
+    return host, int(port)
+
+
+def safe_relpath(rel):
+    """Reject absolute paths and anything escaping the job folder."""
+    norm = os.path.normpath(rel)
+    if os.path.isabs(norm) or norm == ".." or norm.startswith(".." + os.sep):
+        raise FarmError(f"Unsafe path in job: {rel}")
+    return norm
+
+
+def _module_candidates(project_dir, base_dir, module, level):
+    root = base_dir if level else project_dir
+    for _ in range(max(0, level - 1)):
+        root = os.path.dirname(root)
+    parts = module.split(".") if module else []
+    target = os.path.join(root, *parts)
+    return [target + ".py", os.path.join(target, "__init__.py")]
+
+
+def collect_job_files(entry_path, project_dir):
+    """The entry file plus every project-local module it imports, transitively.
+
+    Returns {relative path: absolute path}. Imports that don't resolve inside
+    project_dir (manim, numpy, ...) are left to the worker's environment.
+    """
+    project_dir = os.path.abspath(project_dir)
+    files = {}
+    pending = [os.path.abspath(entry_path)]
+    while pending:
+        path = pending.pop()
+        rel = os.path.relpath(path, project_dir)
+        if rel in files or rel.startswith(".."):
+            continue
+        files[rel] = path
+        try:
+            with open(path, encoding="utf-8") as f:
+                tree = ast.parse(f.read(), path)
+        except (OSError, UnicodeDecodeError, SyntaxError):
+            continue
+        base_dir = os.path.dirname(path)
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                targets = [(alias.name, 0) for alias in node.names]
+            elif isinstance(node, ast.ImportFrom):
+                targets = [(node.module or "", node.level)]
+                # "from pkg import mod" may name submodules
+                targets += [(f"{node.module}.{a.name}" if node.module else a.name, node.level) for a in node.names]
+            else:
+                continue
+            for module, level in targets:
+                for candidate in _module_candidates(project_dir, base_dir, module, level):
+                    if os.path.isfile(candidate):
+                        pending.append(candidate)
+                        break
+                # Packages need their __init__ files on the way down too
+                parts = module.split(".")
+                for depth in range(1, len(parts)):
+                    init = _module_candidates(project_dir, base_dir, ".".join(parts[:depth]), level)[1]
+                    if os.path.isfile(init):
+                        pending.append(init)
+    return files
+
+
+# ---------------------------------------------------------------- protocol
+
+def send_message(sock_file, message):
+    sock_file.write(json.dumps(message).encode("utf-8") + b"\n")
+    sock_file.flush()
+
+
+def read_message(sock_file):
+    line = sock_file.readline()
+    if not line:
+        return None
+    return json.loads(line)
+
+
+def request(address, message, token=None, timeout=CONNECT_TIMEOUT_SECONDS):
+    """Send one message and yield every reply until the connection closes."""
+    if token:
+        message = dict(message, token=token)
+    host, port = parse_address(address)
+    try:
+        sock = socket.create_connection((host, port), timeout=timeout)
+    except OSError as e:
+        raise FarmError(f"Cannot reach worker {address}: {e}") from e
+    # Renders can go quiet for a long time between log lines
+    sock.settimeout(None)
+    with sock, sock.makefile("rwb") as sock_file:
+        send_message(sock_file, message)
+        while True:
+            try:
+                reply = read_message(sock_file)
+            except (OSError, ValueError) as e:
+                raise FarmError(f"Connection to {address} failed: {e}") from e
+            if reply is None:
+                return
+            if reply.get("op") == "error":
+                raise FarmError(f"{address}: {reply.get('message')}")
+            yield reply
+
+
+def worker_status(address, token=None):
+    for reply in request(address, {"op": "status"}, token):
+        return reply
+    raise FarmError(f"{address} closed the connection")
+
+
+def worker_has(address, hashes, token=None):
+    for reply in request(address, {"op": "have", "hashes": list(hashes)}, token):
+        return set(reply.get("hashes", []))
+    raise FarmError(f"{address} closed the connection")
+
+
+# ------------------------------------------------------------------ worker
+
+class WorkerState:
+    def __init__(self, cache_dir, slots, manim_cmd, token):
+        self.cache_dir = cache_dir
+        self.slots = threading.BoundedSemaphore(slots)
+        self.slot_count = slots
+        self.manim_cmd = manim_cmd
+        self.token = token
+        self.lock = threading.Lock()
+        self.running = 0
+        self.queued = 0
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def blob_path(self, sha):
+        if len(sha) != 64 or any(c not in "0123456789abcdef" for c in sha):
+            raise FarmError(f"Bad blob hash: {sha}")
+        return os.path.join(self.cache_dir, sha)
+
+    def has_blob(self, sha):
+        return os.path.exists(self.blob_path(sha))
+
+    def store_blob(self, sha, data):
+        if hashlib.sha256(data).hexdigest() != sha:
+            raise FarmError(f"Blob does not match its hash: {sha}")
+        path = self.blob_path(sha)
+        if not os.path.exists(path):
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir)
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+
+
+def token_matches(given, expected):
+    """Compare in constant time so the token can't be guessed from response timing."""
+    return hmac.compare_digest(str(given or "").encode("utf-8"), expected.encode("utf-8"))
+
+
+class WorkerHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        state = self.server.state
+        try:
+            message = read_message(self.rfile)
+            if message is None:
+                return
+            if state.token and not token_matches(message.get("token"), state.token):
+                raise FarmError("Invalid or missing token")
+            op = message.get("op")
+            if op == "status":
+                with state.lock:
+                    send_message(self.wfile, {
+                        "op": "status", "running": state.running,
+                        "queued": state.queued, "slots": state.slot_count,
+                    })
+            elif op == "have":
+                hashes = [h for h in message.get("hashes", []) if state.has_blob(h)]
+                send_message(self.wfile, {"op": "have", "hashes": hashes})
+            elif op == "render":
+                self.render(state, message)
+            else:
+                raise FarmError(f"Unknown op: {op}")
+        except (FarmError, ValueError, KeyError) as e:
+            send_message(self.wfile, {"op": "error", "message": str(e)})
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+    def render(self, state, message):
+        for sha, data in message.get("blobs", {}).items():
+            state.store_blob(sha, base64.b64decode(data))
+        files = {safe_relpath(rel): sha for rel, sha in message["files"].items()}
+        missing = [rel for rel, sha in files.items() if not state.has_blob(sha)]
+        if missing:
+            raise FarmError(f"Missing files: {', '.join(missing)}")
+        entry = safe_relpath(message["entry"])
+        args = [str(arg) for arg in message.get("args", [])]
+
+        with state.lock:
+            state.queued += 1
+        state.slots.acquire()
+        with state.lock:
+            state.queued -= 1
+            state.running += 1
+        job_dir = tempfile.mkdtemp(prefix="manimgui-job-")
+        try:
+            for rel, sha in files.items():
+                target = os.path.join(job_dir, rel)
+                os.makedirs(os.path.dirname(target), exist_ok=True)
+                shutil.copyfile(state.blob_path(sha), target)
+            returncode, outputs = self.run_manim(state, job_dir, entry, message["scene"], args)
+            send_message(self.wfile, {"op": "result", "returncode": returncode, "outputs": outputs})
+        finally:
+            shutil.rmtree(job_dir, ignore_errors=True)
+            with state.lock:
+                state.running -= 1
+            state.slots.release()
+
+    def run_manim(self, state, job_dir, entry, scene, args):
+        env = dict(os.environ, COLUMNS="1000", PYTHONUNBUFFERED="1")
+        cmd = shlex.split(state.manim_cmd) + args + [entry, scene]
+        send_message(self.wfile, {"op": "log", "line": f"Worker running: {' '.join(cmd)}"})
+        process = subprocess.Popen(
+            cmd, cwd=job_dir, env=env, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+            text=True, errors="replace", bufsize=1, **process_group_kwargs(),
+        )
+        try:
+            for line in process.stdout:
+                # Paths are reported relative to the job folder, which mirrors the project
+                line = line.rstrip("\n").replace(job_dir + os.sep, "")
+                send_message(self.wfile, {"op": "log", "line": line})
+            returncode = process.wait()
+        finally:
+            # The client went away; job_dir and its partial files are removed by the caller
+            stop_process_tree(process)
+
+        outputs = []
+        media_dir = os.path.join(job_dir, "media")
+        for root, dirnames, filenames in os.walk(media_dir):
+            dirnames[:] = [d for d in dirnames if d not in ("partial_movie_files", "Tex", "texts")]
+            for name in filenames:
+                if name.endswith(OUTPUT_EXTENSIONS):
+                    path = os.path.join(root, name)
+                    with open(path, "rb") as f:
+                        data = base64.b64encode(f.read()).decode("ascii")
+                    outputs.append({"path": os.path.relpath(path, job_dir), "data": data})
+        return returncode, outputs
+
+
+class WorkerServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, address, state):
+        super().__init__(address, WorkerHandler)
+        self.state = state
+
+
+# --------------------------------------------------------------- scheduler
+
+class FarmJob:
+    def __init__(self, entry_path, project_dir, scene, args, on_line=None, on_done=None):
+        self.entry_path = entry_path
+        self.project_dir = project_dir
+        self.scene = scene
+        self.args = list(args)
+        self.on_line = on_line or (lambda job, line: None)
+        self.on_done = on_done or (lambda job, returncode, outputs, error: None)
+        self.worker = None
+
+
+class FarmScheduler:
+    """Queue of render jobs dispatched across a set of workers.
+
+    A job goes to the worker with the lowest load (running plus queued jobs
+    per slot, including jobs this scheduler has already sent there). Ties go
+    to the worker that already caches most of the job's files, so it has the
+    least to upload. Each dispatched job streams on its own thread; callbacks
+    run on that thread. A finished job dispatches the next one; when every
+    worker is full of other clients' jobs the queue is retried on a timer.
+    """
+
+    def __init__(self, workers, token=None):
+        self.workers = [w.strip() for w in workers if w.strip()]
+        self.token = token
+        self.lock = threading.Lock()
+        self.queue = deque()
+        self.in_flight = {worker: 0 for worker in self.workers}
+        self.retry_timer = None
+
+    def submit(self, job):
+        with self.lock:
+            self.queue.append(job)
+        self.dispatch()
+
+    def pending(self):
+        with self.lock:
+            return len(self.queue)
+
+    def choose_worker(self, hashes):
+        """Return (best free worker or None, number of reachable workers)."""
+        best, best_score, reachable = None, None, 0
+        for worker in self.workers:
+            try:
+                status = worker_status(worker, self.token)
+                cached = worker_has(worker, hashes, self.token) if hashes else set()
+            except FarmError:
+                continue
+            reachable += 1
+            slots = max(1, status.get("slots", 1))
+            with self.lock:
+                busy = max(status.get("running", 0) + status.get("queued", 0), self.in_flight.get(worker, 0))
+            if busy >= slots:
+                continue
+            score = (busy / slots, len(set(hashes) - cached))
+            if best_score is None or score < best_score:
+                best, best_score = worker, score
+        return best, reachable
+
+    def dispatch(self):
+        while True:
+            with self.lock:
+                if not self.queue:
+                    return
+                job = self.queue[0]
+            try:
+                files = collect_job_files(job.entry_path, job.project_dir)
+                hashes = {rel: file_hash(path) for rel, path in files.items()}
+            except OSError as e:
+                with self.lock:
+                    self.queue.popleft()
+                job.on_done(job, None, [], str(e))
+                continue
+            worker, reachable = self.choose_worker(list(hashes.values()))
+            if worker is None:
+                with self.lock:
+                    idle = not any(self.in_flight.values())
+                    if reachable == 0 and idle and self.queue and self.queue[0] is job:
+                        self.queue.popleft()
+                    else:
+                        # Everyone is busy. One of our jobs finishing dispatches
+                        # again; if none is running, nothing would, so poll.
+                        if idle:
+                            self._schedule_retry()
+                        return
+                job.on_done(job, None, [], "No render worker is reachable")
+                continue
+            with self.lock:
+                if not self.queue or self.queue[0] is not job:
+                    continue
+                self.queue.popleft()
+                self.in_flight[worker] = self.in_flight.get(worker, 0) + 1
+            job.worker = worker
+            threading.Thread(target=self._run, args=(job, worker, files, hashes), daemon=True).start()
+
+    def _schedule_retry(self):
+        """Dispatch again in RETRY_SECONDS; call with the lock held."""
+        if self.retry_timer is None:
+            self.retry_timer = threading.Timer(RETRY_SECONDS, self._retry)
+            self.retry_timer.daemon = True
+            self.retry_timer.start()
+
+    def _retry(self):
+        with self.lock:
+            self.retry_timer = None
+        self.dispatch()
+
+    def _run(self, job, worker, files, hashes):
+        outputs, returncode, error = [], None, None
+        try:
+            cached = worker_has(worker, hashes.values(), self.token)
+            blobs = {}
+            for rel, sha in hashes.items():
+                if sha not in cached and sha not in blobs:
+                    with open(files[rel], "rb") as f:
+                        blobs[sha] = base64.b64encode(f.read()).decode("ascii")
+            message = {
+                "op": "render",
+                "files": {rel.replace(os.sep, "/"): sha for rel, sha in hashes.items()},
+                "blobs": blobs,
+                "entry": os.path.relpath(job.entry_path, job.project_dir).replace(os.sep, "/"),
+                "scene": job.scene,
+                "args": job.args,
+            }
+            for reply in request(worker, message, self.token):
+                if reply.get("op") == "log":
+                    job.on_line(job, reply.get("line", ""))
+                elif reply.get("op") == "result":
+                    returncode = reply.get("returncode")
+                    for output in reply.get("outputs", []):
+                        target = os.path.join(job.project_dir, safe_relpath(output["path"]))
+                        os.makedirs(os.path.dirname(target), exist_ok=True)
+                        with open(target, "wb") as f:
+                            f.write(base64.b64decode(output["data"]))
+                        outputs.append(target)
+            if returncode is None:
+                error = f"{worker} closed the connection before the render finished"
+        except (FarmError, OSError, ValueError) as e:
+            error = str(e)
+        finally:
+            with self.lock:
+                self.in_flight[worker] -= 1
+        job.on_done(job, returncode, outputs, error)
+        self.dispatch()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="ManimGUI render farm worker")
+    parser.add_argument("--host", default="127.0.0.1", help="interface to listen on (default: localhost only)")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--slots", type=int, default=max(1, (os.cpu_count() or 2) // 4),
+                        help="renders run at the same time")
+    parser.add_argument("--cache-dir", default=os.path.join(tempfile.gettempdir(), "manimgui-worker-cache"))
+    parser.add_argument("--manim", default="manim", help="command used to run manim")
+    parser.add_argument("--token", default=os.environ.get("MANIMGUI_WORKER_TOKEN"),
+                        help="shared secret clients must send (default: $MANIMGUI_WORKER_TOKEN)")
+    args = parser.parse_args(argv)
+    if not args.token and not is_loopback(args.host):
+        parser.error(f"--token (or $MANIMGUI_WORKER_TOKEN) is required to listen on {args.host or 'all interfaces'}: "
+                     "without it anyone who can reach the port can run code on this machine")
+
+    state = WorkerState(args.cache_dir, max(1, args.slots), args.manim, args.token)
+    with WorkerServer((args.host, args.port), state) as server:
+        print(f"ManimGUI worker listening on {args.host}:{args.port} with {state.slot_count} slot(s)", flush=True)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())